@@ -30,6 +30,9 @@ _logger = logging.getLogger(__name__)
 class Distribution(abc.ABC):
     """Base class for probability distributions."""
 
+    # attributes that only cache quantities derived from the exported ones
+    _cached_attributes: tuple[str, ...] = ()
+
     @abstractmethod
     def draw(self, num_draws: int = 1) -> np.ndarray:
         """Draw samples.
@@ -59,10 +62,14 @@ class Distribution(abc.ABC):
     def export_dict(self) -> dict:
         """Create a dict of the distribution.
 
+        Cached attributes of the distribution are not exported.
+
         Returns:
             Dict containing distribution information
         """
-        export_dict = vars(self)
+        export_dict = {
+            key: value for key, value in vars(self).items() if key not in self._cached_attributes
+        }
         export_dict = {"type": self.__class__.__name__, **export_dict}
         return export_dict
 
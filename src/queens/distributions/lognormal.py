@@ -88,12 +88,7 @@ class LogNormal(Continuous):
             Log-PDF at positions
         """
         log_x = np.log(x).reshape(-1, self.dimension)
-        dist = log_x - self.normal_distribution.mean
-        logpdf = (
-            self.normal_distribution.logpdf_const
-            - np.sum(log_x, axis=1)
-            - 0.5 * (np.dot(dist, self.normal_distribution.precision) * dist).sum(axis=1)
-        )
+        logpdf = self.normal_distribution.logpdf(log_x) - np.sum(log_x, axis=1)
         return logpdf
 
     def grad_logpdf(self, x: np.ndarray) -> np.ndarray:
@@ -107,17 +102,7 @@ class LogNormal(Continuous):
         """
         x = x.reshape(-1, self.dimension)
         x[x == 0] = np.nan
-        grad_logpdf = (
-            1
-            / x
-            * (
-                np.dot(
-                    self.normal_distribution.mean.reshape(1, -1) - np.log(x),
-                    self.normal_distribution.precision,
-                )
-                - 1
-            )
-        )
+        grad_logpdf = 1 / x * (self.normal_distribution.grad_logpdf(np.log(x)) - 1)
         return grad_logpdf
 
     def pdf(self, x: np.ndarray) -> np.ndarray:
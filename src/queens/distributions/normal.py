@@ -15,24 +15,32 @@
 """Normal distribution."""
 
 import numpy as np
+import scipy.linalg
 import scipy.stats
 from numpy.typing import ArrayLike
 
 from queens.distributions._distribution import Continuous
 from queens.utils.logger_settings import log_init_args
 from queens.utils.numpy_array import at_least_2d
-from queens.utils.numpy_linalg import safe_cholesky
+from queens.utils.numpy_linalg import cholesky_rank_one_update, safe_cholesky
 
 
 class Normal(Continuous):
     """Normal distribution.
 
+    The log-PDF and its gradient are evaluated with triangular solves based on the Cholesky factor
+    of the covariance matrix, i.e., the precision matrix is never formed explicitly. For diagonal
+    covariance matrices, all operations reduce to elementwise operations on the variances.
+
     Attributes:
         low_chol: Lower-triangular Cholesky factor of covariance matrix.
-        precision: Precision matrix corresponding to covariance matrix.
         logpdf_const: Constant for evaluation of log-PDF.
+        variances: Diagonal of the covariance matrix if the covariance matrix is diagonal, None
+            otherwise.
     """
 
+    _cached_attributes = ("_precision",)
+
     @log_init_args
     def __init__(
         self,
@@ -71,11 +79,27 @@ class Normal(Continuous):
                 f"Provided dimension of covariance matrix: {dimension}. "
             )
 
-        low_chol, precision, logpdf_const = self._calculate_distribution_parameters(covariance)
+        low_chol, variances, logpdf_const = self._calculate_distribution_parameters(covariance)
         super().__init__(mean, covariance, dimension)
         self.low_chol = low_chol
-        self.precision = precision
+        self.variances = variances
         self.logpdf_const = logpdf_const
+        self._precision = None
+
+    @property
+    def precision(self) -> np.ndarray:
+        """Precision matrix corresponding to covariance matrix.
+
+        The precision matrix is only assembled on request and cached until the covariance changes.
+        """
+        if self._precision is None:
+            if self.variances is not None:
+                self._precision = np.diag(1.0 / self.variances)
+            else:
+                self._precision = scipy.linalg.cho_solve(
+                    (self.low_chol, True), np.eye(self.dimension)
+                )
+        return self._precision
 
     def cdf(self, x: np.ndarray) -> np.ndarray:
         """Cumulative distribution function.
@@ -101,6 +125,8 @@ class Normal(Continuous):
             Drawn samples from the distribution
         """
         uncorrelated_vector = np.random.randn(self.dimension, num_draws)
+        if self.variances is not None:
+            return self.mean + (np.sqrt(self.variances).reshape(-1, 1) * uncorrelated_vector).T
         samples = self.mean + np.dot(self.low_chol, uncorrelated_vector).T
         return samples
 
@@ -114,7 +140,14 @@ class Normal(Continuous):
             Log-PDF at positions
         """
         dist = x.reshape(-1, self.dimension) - self.mean
-        logpdf = self.logpdf_const - 0.5 * (np.dot(dist, self.precision) * dist).sum(axis=1)
+        if self.variances is not None:
+            mahalanobis_squared = np.sum(dist**2 / self.variances, axis=1)
+        else:
+            whitened_dist = scipy.linalg.solve_triangular(
+                self.low_chol, dist.T, lower=True, check_finite=False
+            )
+            mahalanobis_squared = np.sum(whitened_dist**2, axis=0)
+        logpdf = self.logpdf_const - 0.5 * mahalanobis_squared
         return logpdf
 
     def grad_logpdf(self, x: np.ndarray) -> np.ndarray:
@@ -126,8 +159,13 @@ class Normal(Continuous):
         Returns:
             Gradient of the log-PDF evaluated at positions
         """
-        x = x.reshape(-1, self.dimension)
-        grad_logpdf = np.dot(self.mean.reshape(1, -1) - x, self.precision)
+        dist = self.mean.reshape(1, -1) - x.reshape(-1, self.dimension)
+        if self.variances is not None:
+            grad_logpdf = dist / self.variances
+            # as for the solve with a full covariance, NaNs affect all components of a sample
+            grad_logpdf[np.isnan(grad_logpdf).any(axis=1)] = np.nan
+            return grad_logpdf
+        grad_logpdf = scipy.linalg.cho_solve((self.low_chol, True), dist.T, check_finite=False).T
         return grad_logpdf
 
     def ppf(self, quantiles: ArrayLike) -> np.ndarray:
@@ -151,16 +189,42 @@ class Normal(Continuous):
         Args:
             covariance: Covariance matrix
         """
-        low_chol, precision, logpdf_const = self._calculate_distribution_parameters(covariance)
+        low_chol, variances, logpdf_const = self._calculate_distribution_parameters(covariance)
         self.covariance = covariance
         self.low_chol = low_chol
-        self.precision = precision
+        self.variances = variances
         self.logpdf_const = logpdf_const
+        self._precision = None
+
+    def low_rank_update(self, low_rank_factor: np.ndarray, downdate: bool = False) -> None:
+        r"""Update the covariance by a low-rank term.
+
+        The covariance is updated to :math:`\Sigma \pm UU^T` with the low-rank factor :math:`U` of
+        shape (dimension, rank). The Cholesky factor is updated with one rank-one update per
+        column of :math:`U`, which costs :math:`\mathcal{O}(rd^2)` instead of the
+        :math:`\mathcal{O}(d^3)` of a new factorization. Combined with a diagonal initial
+        covariance, this yields a cheap low-rank-plus-diagonal covariance.
+
+        Args:
+            low_rank_factor: Low-rank factor of shape (dimension, rank) or (dimension,)
+            downdate: If True, the low-rank term is subtracted from the covariance
+        """
+        low_rank_factor = np.array(low_rank_factor).reshape(self.dimension, -1)
+        low_chol = self.low_chol
+        for vector in low_rank_factor.T:
+            low_chol = cholesky_rank_one_update(low_chol, vector, downdate=downdate)
+
+        sign = -1.0 if downdate else 1.0
+        self.covariance = self.covariance + sign * np.dot(low_rank_factor, low_rank_factor.T)
+        self.low_chol = low_chol
+        self.variances = None
+        self.logpdf_const = self._logpdf_const_from_chol(low_chol)
+        self._precision = None
 
     @staticmethod
     def _calculate_distribution_parameters(
         covariance: np.ndarray,
-    ) -> tuple[np.ndarray, np.ndarray, np.float64]:
+    ) -> tuple[np.ndarray, np.ndarray | None, np.float64]:
         """Calculate covariance dependent distribution parameters.
 
         Args:
@@ -168,16 +232,30 @@ class Normal(Continuous):
 
         Returns:
             low_chol: Lower-triangular Cholesky factor of covariance matrix
-            precision: Precision matrix corresponding to covariance matrix
+            variances: Diagonal of covariance matrix if it is diagonal, None otherwise
             logpdf_const: Constant for evaluation of log-PDF
         """
-        dimension = covariance.shape[0]
-        low_chol = safe_cholesky(covariance)
+        variances = np.diagonal(covariance).astype(float)
+        is_diagonal = np.count_nonzero(covariance) == np.count_nonzero(variances)
+        if is_diagonal and np.all(variances > 0):
+            low_chol = np.diag(np.sqrt(variances))
+        else:
+            variances = None
+            low_chol = safe_cholesky(covariance)
+
+        logpdf_const = Normal._logpdf_const_from_chol(low_chol)
+        return low_chol, variances, logpdf_const
+
+    @staticmethod
+    def _logpdf_const_from_chol(low_chol: np.ndarray) -> np.float64:
+        """Calculate the log-PDF constant from the Cholesky factor.
 
-        # precision matrix Q and determinant of cov matrix
-        chol_inv = np.linalg.inv(low_chol)
-        precision = np.dot(chol_inv.T, chol_inv)
+        Args:
+            low_chol: Lower-triangular Cholesky factor of covariance matrix
 
-        # constant needed for pdf
-        logpdf_const = -1 / 2 * (np.log(2.0 * np.pi) * dimension + np.linalg.slogdet(covariance)[1])
-        return low_chol, precision, logpdf_const
+        Returns:
+            Constant for evaluation of log-PDF
+        """
+        dimension = low_chol.shape[0]
+        log_det_covariance = 2.0 * np.sum(np.log(np.diagonal(low_chol)))
+        return -1 / 2 * (np.log(2.0 * np.pi) * dimension + log_det_covariance)
@@ -14,12 +14,14 @@
 #
 """Discrete particle distribution."""
 
-import itertools
 import logging
+from collections.abc import Sequence, Sized
 
 import numpy as np
+from numpy.typing import ArrayLike
 
 from queens.distributions._distribution import Discrete
+from queens.utils.numpy_array import row_keys
 
 _logger = logging.getLogger(__name__)
 
@@ -42,8 +44,53 @@ class Particle(Discrete):
         dimension: Dimensionality of the distribution
         probabilities: Probabilities associated with all the events in the sample space
         sample_space: Samples, i.e. possible outcomes of sampling the distribution
+        cumulative_probabilities: Cumulative sum of the probabilities
     """
 
+    _cached_attributes = ("_sorting_indices", "_sorted_event_keys")
+
+    def __init__(
+        self,
+        probabilities: ArrayLike,
+        sample_space: np.ndarray | Sequence[Sized],
+        dimension: int | None = None,
+    ) -> None:
+        """Initialize the particle distribution.
+
+        Besides the cumulative probabilities, the events are sorted lexicographically once such that
+        events can be looked up by binary search instead of comparing with the whole sample space.
+
+        Args:
+            probabilities: Probabilities associated with all the events in the sample space
+            sample_space: Samples, i.e. possible outcomes of sampling the distribution
+            dimension: Dimension of a sample event
+        """
+        super().__init__(probabilities, sample_space, dimension)
+        self.cumulative_probabilities = np.cumsum(self.probabilities)
+        event_keys = row_keys(self.sample_space)
+        self._sorting_indices = np.argsort(event_keys, kind="stable")
+        self._sorted_event_keys = event_keys[self._sorting_indices]
+
+    def event_indices(self, x: np.ndarray) -> np.ndarray:
+        """Find the indices of events in the sample space.
+
+        Args:
+            x: Events which are looked up in the sample space
+
+        Returns:
+            Indices of the events in the sample space
+        """
+        event_keys = row_keys(np.asarray(x).reshape(-1, self.dimension))
+        positions = np.searchsorted(self._sorted_event_keys, event_keys)
+        positions = np.clip(positions, 0, len(self._sorted_event_keys) - 1)
+
+        if not np.all(self._sorted_event_keys[positions] == event_keys):
+            raise ValueError(
+                f"At least one event is not part of the sample space {self.sample_space}"
+            )
+
+        return self._sorting_indices[positions]
+
     def _compute_mean_and_covariance(self) -> tuple[np.ndarray, np.ndarray]:
         """Compute the mean value and covariance of the mixture model.
 
@@ -72,7 +119,8 @@ class Particle(Discrete):
         """
         self.check_1d()
         closest_sample_event = np.searchsorted(self.sample_space.flatten(), x.flatten())
-        return np.array([np.sum(self.probabilities[: (idx + 1)]) for idx in closest_sample_event])
+        closest_sample_event = np.clip(closest_sample_event, 0, len(self.probabilities) - 1)
+        return self.cumulative_probabilities[closest_sample_event]
 
     def draw(self, num_draws: int = 1) -> np.ndarray:
         """Draw samples.
@@ -84,16 +132,8 @@ class Particle(Discrete):
             Drawn samples
         """
         samples_per_event = np.random.multinomial(num_draws, self.probabilities)
-        samples_tuple = (
-            [
-                [self.sample_space[sample_event]] * repetitions
-                for sample_event, repetitions in enumerate(samples_per_event)
-                if repetitions
-            ],
-        )
-        samples = np.array(
-            list(itertools.chain.from_iterable(*samples_tuple)),
-        )
+        sample_events = np.repeat(np.arange(len(samples_per_event)), samples_per_event)
+        samples = self.sample_space[sample_events]
         np.random.shuffle(samples)
         return samples.reshape(-1, 1)
 
@@ -117,14 +157,7 @@ class Particle(Discrete):
         Returns:
             PDF at positions
         """
-        index = np.array([(self.sample_space == xi).all(axis=1).nonzero()[0] for xi in x]).flatten()
-
-        if len(index) != len(x):
-            raise ValueError(
-                f"At least one event is not part of the sample space {self.sample_space}"
-            )
-
-        return self.probabilities[index]
+        return self.probabilities[self.event_indices(x)]
 
     def ppf(self, quantiles: np.ndarray) -> np.ndarray:
         """Percent point function (inverse of CDF-quantiles).
@@ -136,6 +169,6 @@ class Particle(Discrete):
             Event samples corresponding to the quantiles
         """
         self.check_1d()
-        indices = np.searchsorted(np.cumsum(self.probabilities), quantiles, side="left")
+        indices = np.searchsorted(self.cumulative_probabilities, quantiles, side="left")
         indices = np.clip(indices, 0, len(self.probabilities))
         return self.sample_space[indices].reshape(-1)
@@ -39,15 +39,21 @@ class GlobalSettings:
         output_dir (Path): Output directory for queens run
         git_hash (str): Hash of active git commit
         debug (bool): True if debug mode is to be used
+        jax_compilation_cache_dir (str, Path): Directory of the persistent JAX compilation cache
     """
 
-    def __init__(self, experiment_name, output_dir, debug=False):
+    def __init__(self, experiment_name, output_dir, debug=False, jax_compilation_cache_dir=None):
         """Initialize global settings.
 
         Args:
             experiment_name (str): Experiment name of queens run
             output_dir (str, Path): Output directory for queens run
             debug (bool): True if debug mode is to be used
+            jax_compilation_cache_dir (str, Path): Directory of the persistent JAX compilation
+                                                   cache. Compiled JAX functions, e.g., of the
+                                                   GP surrogates, are then reused across runs.
+                                                   The cache is configured for the whole process.
+                                                   If None, the JAX configuration is not changed.
         """
         self.output_dir = create_folder_if_not_existent(output_dir)
 
@@ -59,6 +65,14 @@ class GlobalSettings:
 
         self.debug = debug
 
+        self.jax_compilation_cache_dir = jax_compilation_cache_dir
+        if jax_compilation_cache_dir is not None:
+            # pylint: disable-next=import-outside-toplevel
+            import jax
+
+            jax.config.update("jax_compilation_cache_dir", str(jax_compilation_cache_dir))
+            jax.config.update("jax_persistent_cache_min_compile_time_secs", 0)
+
         # set up logging
         log_file_path = self.result_file(".log")
         setup_basic_logging(log_file_path=log_file_path, debug=self.debug)
@@ -377,26 +377,24 @@ class VariationalInference(Iterator):
                 self.iteration_data.elbo,
             )
 
-    def _get_fim(self):
-        """Get the FIM for the current variational distribution.
-
-        Add dampening if desired.
+    def _get_fim_dampening_coefficient(self):
+        """Get the dampening coefficient of the FIM for the current iteration.
 
         Returns:
-            fisher (np.array): fisher information matrix of the variational distribution
+            dampening_coefficient (float): Nugget added to the diagonal of the FIM
         """
-        fim = self.variational_distribution.fisher_information_matrix(self.variational_params)
-        if self.fim_dampening_bool:
-            if self.stochastic_optimizer.iteration > self.fim_decay_start_iter:
-                dampening_coefficient = self.fim_dampening_coefficient * np.exp(
-                    -(self.stochastic_optimizer.iteration - self.fim_decay_start_iter)
-                    / self.fim_decay_start_iter
-                )
-                dampening_coefficient = max(self.fim_dampening_lower_bound, dampening_coefficient)
-            else:
-                dampening_coefficient = self.fim_dampening_coefficient
-            fim = fim + np.eye(len(fim)) * dampening_coefficient
-        return fim
+        if not self.fim_dampening_bool:
+            return 0.0
+
+        if self.stochastic_optimizer.iteration > self.fim_decay_start_iter:
+            dampening_coefficient = self.fim_dampening_coefficient * np.exp(
+                -(self.stochastic_optimizer.iteration - self.fim_decay_start_iter)
+                / self.fim_decay_start_iter
+            )
+            dampening_coefficient = max(self.fim_dampening_lower_bound, dampening_coefficient)
+        else:
+            dampening_coefficient = self.fim_dampening_coefficient
+        return dampening_coefficient
 
     def get_gradient_function(self):
         """Select the gradient function for the stochastic optimizer.
@@ -410,7 +408,14 @@ class VariationalInference(Iterator):
         if self.natural_gradient_bool:
 
             def my_gradient(variational_parameters):
-                return np.linalg.solve(self._get_fim(), safe_gradient(variational_parameters))
+                # the FIM is evaluated at the parameters before the gradient estimation
+                fim_variational_parameters = self.variational_params
+                dampening_coefficient = self._get_fim_dampening_coefficient()
+                return self.variational_distribution.natural_gradient(
+                    fim_variational_parameters,
+                    safe_gradient(variational_parameters),
+                    dampening_coefficient,
+                )
 
             gradient = my_gradient
 
@@ -15,8 +15,12 @@
 """Adaptive sampling iterator."""
 
 import logging
+import os
 import pickle
 import types
+from collections.abc import Mapping, Sequence
+from functools import partial
+from pathlib import Path
 
 import jax
 import jax.numpy as jnp
@@ -25,11 +29,15 @@ from jax import jit
 
 from queens.iterators._iterator import Iterator
 from queens.iterators.sequential_monte_carlo_chopin import SequentialMonteCarloChopin
-from queens.utils.io import load_result
+from queens.utils.io import load_pickle, load_result
+from queens.utils.numpy_array import row_keys
 
 _logger = logging.getLogger(__name__)
 jax.config.update("jax_enable_x64", True)
 
+# results that only grow by appended rows, such that each step file only stores the new rows
+APPENDED_RESULT_KEYS = ("x_train", "x_train_failed", "model_outputs", "model_outputs_failed")
+
 
 class AdaptiveSampling(Iterator):
     """Adaptive sampling iterator.
@@ -47,6 +55,12 @@ class AdaptiveSampling(Iterator):
         x_train_new (np.ndarray): Newly drawn training samples
         y_train (np.ndarray): Training likelihood output samples
         model_outputs (np.ndarray): Training model output samples
+        step_files (list): Result files of the individual adaptive sampling steps
+        num_written_rows (dict): Number of rows of the appended results that are already written
+                                 to the step files
+        particles_prev (np.ndarray): Particles of the approximated posterior of the previous step
+        weights_prev (np.ndarray): Particle weights of the approximated posterior of the previous
+                                   step
     """
 
     def __init__(
@@ -95,6 +109,10 @@ class AdaptiveSampling(Iterator):
         self.y_train = np.empty((0, 1))
         self.model_outputs = np.empty((0, self.likelihood_model.y_obs.size))
         self.model_outputs_failed = np.empty((0, self.likelihood_model.y_obs.size))
+        self.step_files = []
+        self.num_written_rows = dict.fromkeys(APPENDED_RESULT_KEYS, 0)
+        self.particles_prev = None
+        self.weights_prev = None
 
     def pre_run(self):
         """Pre run."""
@@ -106,6 +124,16 @@ class AdaptiveSampling(Iterator):
             self.model_outputs = results["model_outputs"][-1]
             self.y_train = results["y_train"][-1]
             self.x_train_new = results["x_train_new"][-1]
+            self.particles_prev = results["particles"][-1]
+            self.weights_prev = results["weights"][-1]
+            if isinstance(results, AdaptiveSamplingResults):
+                self.step_files = results.step_file_paths()
+                for key in APPENDED_RESULT_KEYS:
+                    self.num_written_rows[key] = len(results[key][-1])
+            else:
+                # results of a single pickle file are split into files per step once
+                for step in range(len(results["x_train"])):
+                    self.write_step_results({key: results[key][step] for key in results})
 
     def core_run(self):
         """Core run."""
@@ -216,7 +244,12 @@ class AdaptiveSampling(Iterator):
             x_train_new (np.ndarray): New training samples
         """
         # Filter particles, that are present in training sample set
-        indices = (particles[:, np.newaxis] == self.x_train).all(-1).any(-1)
+        train_keys = set(row_keys(self.x_train).tolist())
+        indices = np.fromiter(
+            (key in train_keys for key in row_keys(particles).tolist()),
+            dtype=bool,
+            count=len(particles),
+        )
         particles = particles[~indices]
         weights = weights[~indices]
         weights /= np.sum(weights)
@@ -249,6 +282,10 @@ class AdaptiveSampling(Iterator):
     def write_results(self, particles, weights, log_posterior, iteration):
         """Write results to output file and calculate cs_div.
 
+        The results of each step are written to a separate file. Of the training data, which only
+        grows, each step file only contains the rows appended in that step. The result file itself
+        only contains an index of these step files and is read lazily with *load_result*.
+
         Args:
             particles (np.ndarray): Particles of approximated posterior
             weights (np.ndarray): Particle weights of approximated posterior
@@ -259,60 +296,247 @@ class AdaptiveSampling(Iterator):
             cs_div (float): Maximum Cauchy-Schwarz divergence between marginals of the current and
                             previous step
         """
-        result_file = self.global_settings.result_file(".pickle")
-
-        if iteration == 0 and not self.restart_file:
-            results = {
-                "x_train": [],
-                "x_train_failed": [],
-                "model_outputs": [],
-                "model_outputs_failed": [],
-                "y_train": [],
-                "x_train_new": [],
-                "particles": [],
-                "weights": [],
-                "log_posterior": [],
-                "cs_div": [],
-            }
+        if self.particles_prev is None:
             cs_div = np.nan
         else:
-            results = load_result(result_file)
-            particles_prev = results["particles"][-1]
-            weights_prev = results["weights"][-1]
-            samples_prev = particles_prev[
-                np.random.choice(np.arange(weights_prev.size), 5_000, p=weights_prev)
+            samples_prev = self.particles_prev[
+                np.random.choice(np.arange(self.weights_prev.size), 5_000, p=self.weights_prev)
             ]
             samples_curr = particles[np.random.choice(np.arange(weights.size), 5_000, p=weights)]
             cs_div = float(cauchy_schwarz_divergence(samples_prev, samples_curr))
             _logger.info("Cauchy Schwarz divergence: %.2e", cs_div)
+        self.particles_prev = particles
+        self.weights_prev = weights
+
+        self.write_step_results(
+            {
+                "x_train": self.x_train,
+                "x_train_failed": self.x_train_failed,
+                "model_outputs": self.model_outputs,
+                "model_outputs_failed": self.model_outputs_failed,
+                "y_train": self.y_train,
+                "x_train_new": self.x_train_new,
+                "particles": particles,
+                "weights": weights,
+                "log_posterior": log_posterior,
+                "cs_div": cs_div,
+            }
+        )
+        _logger.debug("Wrote results of iteration %i.", iteration)
 
-        results["x_train"].append(self.x_train)
-        results["x_train_failed"].append(self.x_train_failed)
-        results["model_outputs"].append(self.model_outputs)
-        results["model_outputs_failed"].append(self.model_outputs_failed)
-        results["y_train"].append(self.y_train)
-        results["x_train_new"].append(self.x_train_new)
-        results["particles"].append(particles)
-        results["weights"].append(weights)
-        results["log_posterior"].append(log_posterior)
-        results["cs_div"].append(cs_div)
+        return cs_div
 
-        with open(result_file, "wb") as handle:
-            pickle.dump(results, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    def write_step_results(self, step_results):
+        """Write the results of one step and update the index in the result file.
 
-        return cs_div
+        Only the rows of the appended results that are not yet written in previous steps are
+        stored in the step file. The step files are indexed relative to the result file, such
+        that the output directory can be moved.
+
+        Args:
+            step_results (dict): Results of the step
+        """
+        step_results = dict(step_results)
+        for key in APPENDED_RESULT_KEYS:
+            num_rows = len(step_results[key])
+            step_results[key] = step_results[key][self.num_written_rows[key] :]
+            self.num_written_rows[key] = num_rows
+
+        step_file = self.global_settings.result_file(
+            ".pickle", suffix=f"_step_{len(self.step_files)}"
+        )
+        with open(step_file, "wb") as handle:
+            pickle.dump(step_results, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        self.step_files.append(step_file)
+
+        result_file = self.global_settings.result_file(".pickle")
+        with open(result_file, "wb") as handle:
+            pickle.dump(
+                AdaptiveSamplingResults(
+                    [
+                        os.path.relpath(step_file, result_file.parent)
+                        for step_file in self.step_files
+                    ],
+                    list(step_results.keys()),
+                    APPENDED_RESULT_KEYS,
+                ),
+                handle,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
 
     def post_run(self):
         """Post run."""
 
 
-@jit
-def cauchy_schwarz_divergence(samples_1, samples_2):
+class AdaptiveSamplingResults(Mapping):
+    """Lazy results of an adaptive sampling run stored in one file per step.
+
+    Each key maps to a sequence over the steps, such that e.g. *results["particles"][-1]* only
+    loads the result file of the last step. The step files of appended results only contain the
+    rows of their step, which are concatenated when loaded. The appended rows and the most recently
+    loaded step are cached, such that each step file is unpickled only once when the results of
+    several keys are read, e.g., for a restart.
+
+    Attributes:
+        step_files (list): Result files of the individual steps relative to the result file
+        result_keys (list): Keys of the results of each step
+        appended_keys (tuple): Keys of the results of which each step file only contains the
+                               rows appended in that step
+        result_dir (Path): Directory of the result file, set by *load_result*
+        appended_rows (list): Cached appended rows of the steps loaded so far
+        loaded_step (tuple): Index and results of the most recently loaded step
+    """
+
+    def __init__(self, step_files, result_keys, appended_keys=()):
+        """Initialize AdaptiveSamplingResults.
+
+        Args:
+            step_files (list): Result files of the individual steps relative to the result file
+            result_keys (list): Keys of the results of each step
+            appended_keys (tuple, opt): Keys of the results of which each step file only contains
+                                        the rows appended in that step
+        """
+        self.step_files = [Path(step_file) for step_file in step_files]
+        self.result_keys = result_keys
+        self.appended_keys = tuple(appended_keys)
+        self.result_dir = None
+        self.appended_rows = []
+        self.loaded_step = (None, None)
+
+    def set_result_dir(self, result_dir):
+        """Set the directory of the result file to locate the step files.
+
+        Args:
+            result_dir (str, Path): Directory of the result file
+        """
+        self.result_dir = Path(result_dir)
+
+    def step_file_paths(self):
+        """Paths of the step files.
+
+        Returns:
+            list: Paths of the step files
+        """
+        if self.result_dir is None:
+            return list(self.step_files)
+        return [self.result_dir / step_file for step_file in self.step_files]
+
+    def load_step(self, index):
+        """Load the results of one step.
+
+        Args:
+            index (int): Step index
+
+        Returns:
+            dict: Results of the step
+        """
+        if self.loaded_step[0] != index:
+            step_results = load_pickle(self.step_file_paths()[index])
+            if index == len(self.appended_rows):
+                self.appended_rows.append({key: step_results[key] for key in self.appended_keys})
+            self.loaded_step = (index, step_results)
+        return self.loaded_step[1]
+
+    def load_appended_rows(self, key, index):
+        """Load the rows of an appended result up to a step.
+
+        Args:
+            key (str): Result key
+            index (int): Step index
+
+        Returns:
+            np.ndarray: Rows appended in the steps up to *index*
+        """
+        for step in range(len(self.appended_rows), index + 1):
+            self.load_step(step)
+        return np.concatenate([rows[key] for rows in self.appended_rows[: index + 1]], axis=0)
+
+    def __getitem__(self, key):
+        """Get the results of all steps for a key.
+
+        Args:
+            key (str): Result key
+
+        Returns:
+            _StepSequence: Lazy sequence of the results of all steps
+        """
+        if key not in self.result_keys:
+            raise KeyError(key)
+        return _StepSequence(self, key)
+
+    def __iter__(self):
+        """Iterate over the result keys."""
+        return iter(self.result_keys)
+
+    def __len__(self):
+        """Number of result keys."""
+        return len(self.result_keys)
+
+
+class _StepSequence(Sequence):
+    """Lazy sequence of the results of one key over all steps."""
+
+    def __init__(self, results, key):
+        """Initialize _StepSequence.
+
+        Args:
+            results (AdaptiveSamplingResults): Results the steps are loaded from
+            key (str): Result key
+        """
+        self.results = results
+        self.key = key
+
+    def __getitem__(self, index):
+        """Load the result of one or several steps.
+
+        Args:
+            index (int, slice): Step index
+
+        Returns:
+            Result of the step or list of results of the steps
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        index = range(len(self))[index]
+        if self.key in self.results.appended_keys:
+            return self.results.load_appended_rows(self.key, index)
+        return self.results.load_step(index)[self.key]
+
+    def __len__(self):
+        """Number of steps."""
+        return len(self.results.step_files)
+
+
+def cauchy_schwarz_divergence(samples_1, samples_2, max_block_elements=2**22):
     """Maximum Cauchy-Schwarz divergence between marginals of two sample sets.
 
+    The pairwise kernel sums are evaluated in blocks of rows of the first sample set, such that
+    at most *max_block_elements* pairwise entries are stored at once.
+
+    Args:
+        samples_1 (np.ndarray): Sample set 1
+        samples_2 (np.ndarray): Sample set 2
+        max_block_elements (int, opt): Maximum number of pairwise entries per block
+
+    Returns:
+        cs_div_max (np.ndarray): Maximum Cauchy-Schwarz divergence between marginals of two sample
+                                 sets.
+    """
+    num_dim = samples_1.shape[1]
+    num_samples = max(samples_1.shape[0], samples_2.shape[0])
+    block_size = int(max(1, min(num_samples, max_block_elements // (num_samples * num_dim))))
+    return _cauchy_schwarz_divergence(samples_1, samples_2, block_size)
+
+
+@partial(jit, static_argnames="block_size")
+def _cauchy_schwarz_divergence(samples_1, samples_2, block_size):
+    """Jitted blockwise Cauchy-Schwarz divergence between marginals of two sample sets.
+
     Args:
         samples_1 (np.ndarray): Sample set 1
         samples_2 (np.ndarray): Sample set 2
+        block_size (int): Number of rows of the first sample set per block
 
     Returns:
         cs_div_max (np.ndarray): Maximum Cauchy-Schwarz divergence between marginals of two sample
@@ -330,33 +554,54 @@ def cauchy_schwarz_divergence(samples_1, samples_2):
     def normalizing_factor(variance):
         return (2 * jnp.pi * variance) ** (-1 / 2)
 
-    def normal(x_1, x_2, variance):
-        d = x_1[:, jnp.newaxis, :] - x_2[jnp.newaxis, :, :]
-        norm = d**2 / variance
-        return normalizing_factor(variance), -0.5 * norm
-
-    z_1_2 = normal(samples_1, samples_2, var_1 + var_2)
-    z_1_1 = normal(samples_1, samples_1, var_1 + var_1)
-    z_1_1 = z_1_1[0] * jnp.exp(z_1_1[1])
-    z_2_2 = normal(samples_2, samples_2, var_2 + var_2)
-    z_2_2 = z_2_2[0] * jnp.exp(z_2_2[1])
-
-    max_1_2 = jnp.max(z_1_2[1], axis=(0, 1))
-    term_1 = (
-        -jnp.log(jnp.sum(1 / n_1 * 1 / n_2 * z_1_2[0] * jnp.exp(z_1_2[1] - max_1_2), axis=(0, 1)))
-        - max_1_2
-    )
+    log_sum_1_2 = _log_sum_exp_pairwise(samples_1, samples_2, var_1 + var_2, block_size, False)
+    log_sum_1_1 = _log_sum_exp_pairwise(samples_1, samples_1, var_1 + var_1, block_size, True)
+    log_sum_2_2 = _log_sum_exp_pairwise(samples_2, samples_2, var_2 + var_2, block_size, True)
+
+    term_1 = -jnp.log(1 / n_1 * 1 / n_2 * normalizing_factor(var_1 + var_2)) - log_sum_1_2
     term_2 = 0.5 * jnp.log(
         1 / n_1 * normalizing_factor(var_1)
-        + jnp.sum(
-            2 / n_1**2 * z_1_1 * jnp.tri(*z_1_1.shape[:2], k=-1)[:, :, jnp.newaxis], axis=(0, 1)
-        )
+        + 1 / n_1**2 * normalizing_factor(var_1 + var_1) * jnp.exp(log_sum_1_1)
     )
     term_3 = 0.5 * jnp.log(
         1 / n_2 * normalizing_factor(var_2)
-        + jnp.sum(
-            2 / n_2**2 * z_2_2 * jnp.tri(*z_1_1.shape[:2], k=-1)[:, :, jnp.newaxis], axis=(0, 1)
-        )
+        + 1 / n_2**2 * normalizing_factor(var_2 + var_2) * jnp.exp(log_sum_2_2)
     )
     cs_div_max = jnp.max(term_1 + term_2 + term_3)
     return cs_div_max
+
+
+def _log_sum_exp_pairwise(samples_1, samples_2, variance, block_size, exclude_diagonal):
+    """Log of the sum of Gaussian kernel terms over all pairs of samples per dimension.
+
+    Args:
+        samples_1 (np.ndarray): Sample set 1
+        samples_2 (np.ndarray): Sample set 2
+        variance (np.ndarray): Variance of the kernel per dimension
+        block_size (int): Number of rows of the first sample set per block
+        exclude_diagonal (bool): If True, pairs of identical indices are excluded
+
+    Returns:
+        np.ndarray: Log of the sum of the (unnormalized) kernel terms per dimension
+    """
+    n_1 = samples_1.shape[0]
+    num_blocks = -(-n_1 // block_size)
+    row_indices = jnp.arange(num_blocks * block_size).reshape(num_blocks, block_size)
+    blocks = jnp.pad(samples_1, ((0, num_blocks * block_size - n_1), (0, 0))).reshape(
+        num_blocks, block_size, -1
+    )
+    column_indices = jnp.arange(samples_2.shape[0])
+
+    def log_sum_exp_block(carry, block):
+        samples_block, rows = block
+        exponent = (
+            -0.5 * (samples_block[:, jnp.newaxis, :] - samples_2[jnp.newaxis]) ** 2 / variance
+        )
+        valid = jnp.broadcast_to((rows < n_1)[:, jnp.newaxis], exponent.shape[:2])
+        if exclude_diagonal:
+            valid = valid & (rows[:, jnp.newaxis] != column_indices[jnp.newaxis, :])
+        exponent = jnp.where(valid[:, :, jnp.newaxis], exponent, -jnp.inf)
+        return carry, jax.scipy.special.logsumexp(exponent, axis=(0, 1))
+
+    _, log_sums = jax.lax.scan(log_sum_exp_block, None, (blocks, row_indices))
+    return jax.scipy.special.logsumexp(log_sums, axis=0)
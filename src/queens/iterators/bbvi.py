@@ -53,7 +53,7 @@ class BBVI(VariationalInference):
     Attributes:
         control_variates_scaling_type (str): Flag to decide how to compute control variate scaling.
         loo_cv_bool (boolean): *True* if leave-one-out procedure is used for the control variate
-                               scaling estimations. Is quite slow!
+                               scaling estimations.
         random_seed (int): Seed for the random number generators.
         max_feval (int): Maximum number of simulation runs for this analysis.
         memory (int): Number of previous iterations that should be included in the MC ELBO
@@ -72,6 +72,10 @@ class BBVI(VariationalInference):
         parameter_list (list): List of parameters from previous iterations for the ISMC gradient.
         log_posterior_unnormalized_list (list): List of probabilistic model evaluations from
                                                 previous iterations for the ISMC gradient.
+        log_variational_memory (list): Logpdf evaluations of the variational distribution for
+                                       the samples in memory. Entry *[i][j]* contains the
+                                       logpdf for the parameters *parameter_list[i]* evaluated
+                                       at the samples *samples_list[j]*.
         ess (float): Effective sample size of the current iteration (in case IS is used).
         sampling_bool (bool): *True* if probabilistic model has to be sampled. If importance
                               sampling is used the forward model might not evaluated in
@@ -122,7 +126,7 @@ class BBVI(VariationalInference):
             control_variates_scaling_type (str): Flag to decide how to compute control variate
                                                 scaling
             loo_control_variates_scaling: True if leave-one-out procedure is used for the control
-                                          variate scaling estimations. Is quite slow!
+                                          variate scaling estimations.
             stochastic_optimizer (obj): QUEENS stochastic optimizer object
             variational_transformation (str): String encoding the transformation that will be
                                               applied to the variational density
@@ -189,6 +193,7 @@ class BBVI(VariationalInference):
         self.samples_list = []
         self.parameter_list = []
         self.log_posterior_unnormalized_list = []
+        self.log_variational_memory = []
         self.ess = 0
         self.sampling_bool = True
         self.sample_set = None
@@ -283,7 +288,52 @@ class BBVI(VariationalInference):
         return result_description
 
     @staticmethod
-    def _averaged_control_variates_scalings(f_mat, h_mat, weights_is):
+    def _weighted_covariances(x_mat, y_mat, weights, leave_one_out=False):
+        """Row-wise weighted covariances between two sample matrices.
+
+        Computes the same (unbiased) estimate as *np.cov* with *aweights* for every row pair
+        of *x_mat* and *y_mat* from weighted sums. For the leave-one-out estimates, the
+        contribution of each sample is subtracted from these sums, such that all
+        leave-one-out covariances are obtained at the cost of a single covariance.
+
+        Args:
+            x_mat (np.array): Samples (n_rows x n_samples)
+            y_mat (np.array): Samples (n_rows x n_samples)
+            weights (np.array): Sample weights (n_samples)
+            leave_one_out (bool, optional): *True* to compute the covariances without each
+                                            of the samples
+
+        Returns:
+            covariances (np.array): for loo: (n_rows x n_samples)
+                                    else: (n_rows x 1)
+        """
+        weights = np.asarray(weights, dtype=float).flatten()
+        sum_weights = np.sum(weights)
+
+        # center with the weighted mean to reduce cancellation in the sums (shift-invariant)
+        x_mat = x_mat - np.sum(weights * x_mat, axis=1, keepdims=True) / sum_weights
+        y_mat = y_mat - np.sum(weights * y_mat, axis=1, keepdims=True) / sum_weights
+
+        weighted_x_mat = weights * x_mat
+        weighted_y_mat = weights * y_mat
+        sum_x = np.sum(weighted_x_mat, axis=1, keepdims=True)
+        sum_y = np.sum(weighted_y_mat, axis=1, keepdims=True)
+        sum_xy = np.sum(weighted_x_mat * y_mat, axis=1, keepdims=True)
+        sum_squared_weights = np.sum(weights**2)
+
+        if leave_one_out:
+            sum_x = sum_x - weighted_x_mat
+            sum_y = sum_y - weighted_y_mat
+            sum_xy = sum_xy - weighted_x_mat * y_mat
+            sum_squared_weights = sum_squared_weights - weights**2
+            sum_weights = sum_weights - weights
+
+        normalization = sum_weights - sum_squared_weights / sum_weights
+        covariances = (sum_xy - sum_x * sum_y / sum_weights) / normalization
+        return covariances
+
+    @staticmethod
+    def _averaged_control_variates_scalings(f_mat, h_mat, weights_is, leave_one_out=False):
         """Averaged control variate scalings.
 
         This function computes the control variate scaling averaged over the
@@ -293,22 +343,27 @@ class BBVI(VariationalInference):
             f_mat (np.array): MC gradient samples (n_variational_parameters x n_samples)
             h_mat (np.array): Control variate samples (n_variational_parameters x n_samples)
             weights_is (np.array): importance sampling weights (1 x n_samples)
+            leave_one_out (bool, optional): *True* to compute the scalings without each of the
+                                            samples
 
         Returns:
-            cv_scaling (np.array): Control variate scalings (n_variational_parameters x 1)
+            cv_scaling (np.array): Control variate scalings
+                                   for loo: (n_variational_parameters x n_samples)
+                                   else: (n_variational_parameters x 1)
         """
         dim = len(h_mat)
-        cov_sum = 0
-        var_sum = 0
-        for ielbo, covariate in zip(f_mat, h_mat):
-            cov_sum += np.cov(ielbo, covariate, aweights=weights_is)[0, 1]
-            # Use cov instead of np.var to use weights
-            var_sum += float(np.cov(covariate, aweights=weights_is))
+        cov_sum = np.sum(
+            BBVI._weighted_covariances(f_mat, h_mat, weights_is, leave_one_out), axis=0
+        )
+        # Use the weighted covariance instead of np.var to use weights
+        var_sum = np.sum(
+            BBVI._weighted_covariances(h_mat, h_mat, weights_is, leave_one_out), axis=0
+        )
         cv_scaling = np.ones((dim, 1)) * cov_sum / var_sum
         return cv_scaling
 
     @staticmethod
-    def _componentwise_control_variates_scalings(f_mat, h_mat, weights_is):
+    def _componentwise_control_variates_scalings(f_mat, h_mat, weights_is, leave_one_out=False):
         """Computes the componentwise control variates scaling.
 
         I.e., every component of the control variate separately is computed separately.
@@ -317,16 +372,18 @@ class BBVI(VariationalInference):
             f_mat (np.array): MC gradient samples (n_variational_parameters x n_samples)
             h_mat (np.array): Control variate samples (n_variational_parameters x n_samples)
             weights_is (np.array): importance sampling weights (1 x n_samples)
+            leave_one_out (bool, optional): *True* to compute the scalings without each of the
+                                            samples
 
         Returns:
-            cv_scaling (np.array): Control variate scalings (n_variational_parameters x 1)
+            cv_scaling (np.array): Control variate scalings
+                                   for loo: (n_variational_parameters x n_samples)
+                                   else: (n_variational_parameters x 1)
         """
-        n_parameters = len(h_mat)
-        cv_scaling = np.ones((n_parameters, 1))
-        for i in range(n_parameters):
-            cv_scaling[i] = np.cov(f_mat[i], h_mat[i])[0, 1] / float(
-                np.cov(h_mat[i], aweights=weights_is)
-            )
+        n_samples = f_mat.shape[1]
+        cv_scaling = BBVI._weighted_covariances(
+            f_mat, h_mat, np.ones(n_samples), leave_one_out
+        ) / BBVI._weighted_covariances(h_mat, h_mat, weights_is, leave_one_out)
         return cv_scaling
 
     @staticmethod
@@ -337,7 +394,9 @@ class BBVI(VariationalInference):
         Ranganath proposed a leave-one-out procedure to estimate the control
         variate scalings. Each sample has its own scaling that is computed
         using f_mat and h_mat without the values related to itself. (see
-        http://arks.princeton.edu/ark:/88435/dsp01pr76f608w) Is slow!
+        http://arks.princeton.edu/ark:/88435/dsp01pr76f608w) The leave-one-out
+        covariances are obtained by subtracting the contribution of each sample
+        from the weighted sums of all samples.
 
         Args:
             cv_obj (control variate function): A control variate scaling function
@@ -348,12 +407,7 @@ class BBVI(VariationalInference):
         Returns:
             cv_scaling (np.array): Control variate scalings (n_variational_parameters x n_samples)
         """
-        cv_scaling = []
-        for i in range(f_mat.shape[1]):
-            scv = cv_obj(np.delete(f_mat, i, 1), np.delete(h_mat, i, 1), np.delete(weights_is, i))
-            cv_scaling.append(scv)
-        cv_scaling = np.concatenate(cv_scaling, axis=1)
-        return cv_scaling
+        return cv_obj(f_mat, h_mat, weights_is, leave_one_out=True)
 
     def _get_control_variates_scalings(self, f_mat, h_mat, weights_is):
         """Calculate the control variate scalings.
@@ -565,9 +619,7 @@ class BBVI(VariationalInference):
 
             # The number of iterations that we want to keep the samples and model evals
             if self.stochastic_optimizer.iteration > 0:
-                weights_is = self.get_importance_sampling_weights(
-                    self.parameter_list, self.sample_set
-                )
+                weights_is = self._get_importance_sampling_weights_from_memory()
 
                 # Self normalize weighs
                 normalizing_constant = np.sum(weights_is)
@@ -586,6 +638,7 @@ class BBVI(VariationalInference):
             self.parameter_list.append(self.variational_params)
             self.samples_list.append(self.sample_set)
             self.log_posterior_unnormalized_list.append(self.log_posterior_unnormalized)
+            self._update_log_variational_memory()
 
         # The number of iterations that we want to keep the samples and model evals
         if self.stochastic_optimizer.iteration >= self.memory:
@@ -594,12 +647,85 @@ class BBVI(VariationalInference):
             self.log_posterior_unnormalized_list = self.log_posterior_unnormalized_list[
                 -(self.memory + 1) :
             ]
+            self.log_variational_memory = [
+                log_variational_row[-(self.memory + 1) :]
+                for log_variational_row in self.log_variational_memory[-(self.memory + 1) :]
+            ]
 
             self.sample_set = np.concatenate(self.samples_list, axis=0)
             self.log_posterior_unnormalized = np.concatenate(
                 self.log_posterior_unnormalized_list, axis=0
             )
 
+    def _update_log_variational_memory(self):
+        """Evaluate the variational logpdfs for the newly stored parameters and samples.
+
+        The logpdfs of the previously stored parameters at the previously stored samples do
+        not change, such that only the new column (previous parameters at the new samples) and
+        the new row (new parameters at all stored samples) have to be evaluated.
+        """
+        for params, log_variational_row in zip(
+            self.parameter_list[:-1], self.log_variational_memory, strict=True
+        ):
+            log_variational_row.append(
+                self.variational_distribution.logpdf(params, self.sample_set)
+            )
+
+        log_variational_new_row = self.variational_distribution.logpdf(
+            self.parameter_list[-1], np.concatenate(self.samples_list, axis=0)
+        )
+        split_indices = np.cumsum([len(samples) for samples in self.samples_list[:-1]])
+        self.log_variational_memory.append(np.split(log_variational_new_row, split_indices))
+
+    def _get_importance_sampling_weights_from_memory(self):
+        """Get the importance sampling weights from the stored variational logpdfs.
+
+        Equivalent to *get_importance_sampling_weights* for the stored parameters and the
+        current sample set, but reuses the logpdfs in *log_variational_memory*.
+
+        Returns:
+            weights (np.array): (Unnormalized) weights for the ISMC evaluated for the
+            current sample set (1 x n_samples)
+        """
+        if self.stochastic_optimizer.iteration >= self.memory:
+            num_sample_blocks = len(self.samples_list)
+        else:
+            # the sample set only consists of the samples of the current iteration
+            num_sample_blocks = 1
+
+        log_pdf_mixture = np.array(
+            [
+                np.concatenate(log_variational_row[-num_sample_blocks:])
+                for log_variational_row in self.log_variational_memory
+            ]
+        )
+        if self.sampling_bool:
+            # the current parameters are the latest stored ones
+            log_pdf_current_iteration = log_pdf_mixture[-1]
+        else:
+            log_pdf_current_iteration = self.variational_distribution.logpdf(
+                self.variational_params, self.sample_set
+            )
+        return self._importance_sampling_weights(log_pdf_mixture, log_pdf_current_iteration)
+
+    @staticmethod
+    def _importance_sampling_weights(log_pdf_mixture, log_pdf_current_iteration):
+        """Compute the importance sampling weights from the logpdfs.
+
+        Args:
+            log_pdf_mixture (np.array): Logpdfs of the mixture components at the samples
+                                        (n_mixture x n_samples)
+            log_pdf_current_iteration (np.array): Logpdf of the current variational distribution
+                                                  at the samples (n_samples)
+
+        Returns:
+            weights (np.array): (Unnormalized) weights for the ISMC evaluated for the
+            given samples (1 x n_samples)
+        """
+        inv_weights = np.sum(np.exp(log_pdf_mixture - log_pdf_current_iteration), axis=0)
+        weights = len(log_pdf_mixture) / inv_weights
+        return weights
+
     def get_importance_sampling_weights(self, variational_params_list, samples):
         r"""Get the importance sampling weights for the MC gradient estimation.
 
@@ -620,17 +746,16 @@ class BBVI(VariationalInference):
             weights (np.array): (Unnormalized) weights for the ISMC evaluated for the
             given samples (1 x n_samples)
         """
-        inv_weights = 0
-        n_mixture = len(variational_params_list)
         log_pdf_current_iteration = self.variational_distribution.logpdf(
             self.variational_params, samples
         )
-        for params in variational_params_list:
-            inv_weights += np.exp(
-                self.variational_distribution.logpdf(params, samples) - log_pdf_current_iteration
-            )
-        weights = n_mixture / inv_weights
-        return weights
+        log_pdf_mixture = np.array(
+            [
+                self.variational_distribution.logpdf(params, samples)
+                for params in variational_params_list
+            ]
+        )
+        return self._importance_sampling_weights(log_pdf_mixture, log_pdf_current_iteration)
 
     def _filter_failed_simulations(self):
         """Filter samples failed simulations."""
@@ -352,11 +352,7 @@ class BMFIA(Iterator):
             assert (
                 gamma_mat.shape[0] == y_lf_mat.shape[0]
             ), "Dimensions of gamma_mat and y_lf_mat do not agree! Abort..."
-            z_lst = []
-            for y_per_coordinate in y_lf_mat.T:
-                z_lst.append(np.hstack([y_per_coordinate.reshape(-1, 1), gamma_mat]))
-
-            z_mat = np.array(z_lst).squeeze().T
+            z_mat = self._stack_lf_features(y_lf_mat, gamma_mat)
 
             assert z_mat.ndim == 3, "z_mat should be a 3d tensor if man features are used! Abort..."
 
@@ -417,11 +413,7 @@ class BMFIA(Iterator):
                 coord_feature.shape[0] == y_lf_mat.shape[0]
             ), "Dimensions of coords_feature and y_lf_mat do not agree! Abort..."
 
-            z_lst = []
-            for y_per_coordinate in y_lf_mat.T:
-                z_lst.append(np.hstack([y_per_coordinate.reshape(-1, 1), coord_feature]))
-
-            z_mat = np.array(z_lst).squeeze().T
+            z_mat = self._stack_lf_features(y_lf_mat, coord_feature)
             assert (
                 z_mat.ndim == 3
             ), "z_mat should be a 3d tensor if coord_features are used! Abort..."
@@ -462,9 +454,38 @@ class BMFIA(Iterator):
                               dimensions per column.
         """
         time_repeat = int(y_lf_mat.shape[0] / self.time_vec.size)
-        time_vec = np.repeat(self.time_vec.reshape(-1, 1), repeats=time_repeat, axis=0)
 
-        z_mat = np.hstack([y_lf_mat, time_vec])
+        z_mat = np.empty(
+            (y_lf_mat.shape[0], y_lf_mat.shape[1] + 1),
+            dtype=np.result_type(y_lf_mat, self.time_vec),
+        )
+        z_mat[:, :-1] = y_lf_mat
+        z_mat[:, -1] = np.repeat(self.time_vec.flatten(), repeats=time_repeat)
+        return z_mat
+
+    @staticmethod
+    def _stack_lf_features(y_lf_mat, feature_mat):
+        """Stack the low-fidelity outputs and the informative features.
+
+        The features are shared by all output coordinates, such that they are broadcast
+        into the feature tensor instead of being stacked per coordinate.
+
+        Args:
+            y_lf_mat (np.array): Low-fidelity output matrix with row-wise model realizations.
+                                 Columns are different dimensions of the output.
+            feature_mat (np.array): Informative features with row-wise data points and
+                                    column-wise feature dimensions.
+
+        Returns:
+            z_mat (np.array): Feature tensor with dimensions
+                              (1 + num_features) x num_samples x num_coordinates
+        """
+        z_mat = np.empty(
+            (1 + feature_mat.shape[1], *y_lf_mat.shape),
+            dtype=np.result_type(y_lf_mat, feature_mat),
+        )
+        z_mat[0] = y_lf_mat
+        z_mat[1:] = feature_mat.T[:, :, np.newaxis]
         return z_mat
 
     def update_probabilistic_mapping_with_features(self):
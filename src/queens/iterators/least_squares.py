@@ -45,6 +45,10 @@ class LeastSquares(Optimization):
                          - lm : Levenberg-Marquardt algorithm as implemented in MINPACK. Doesn’t
                                 handle bounds and sparse Jacobians. Usually the most  efficient
                                 method for small unconstrained problems.
+        broyden_updates (int): Number of Broyden rank-1 updates of the Jacobian between two
+                               finite difference evaluations of the Jacobian.
+        broyden_states (dict): Last position, residuals, Jacobian and number of consecutive
+                               Broyden updates per model evaluation function.
     """
 
     @log_init_args
@@ -62,6 +66,8 @@ class LeastSquares(Optimization):
         jac_method="2-point",
         jac_rel_step=None,
         objective_and_jacobian=True,
+        multi_start_tolerance=1e-6,
+        broyden_updates=0,
     ):
         """Initialize LeastSquares.
 
@@ -108,6 +114,14 @@ class LeastSquares(Optimization):
                                                 batching, but can lead to unnecessary evaluations of
                                                 the jacobian during line-search.
                                                 Default is true.
+            multi_start_tolerance (float, opt): Relative and absolute tolerance below which the
+                                                iterates or solutions of two starts are considered
+                                                identical. Only used for several starts.
+            broyden_updates (int, opt): Number of Broyden rank-1 updates of the Jacobian between
+                                        two finite difference evaluations of the Jacobian. The
+                                        residuals of a Broyden step are evaluated without the
+                                        finite difference stencil. Default is 0, i.e. the
+                                        Jacobian is always approximated by finite differences.
         """
         super().__init__(
             model=model,
@@ -122,21 +136,143 @@ class LeastSquares(Optimization):
             jac_method=jac_method,
             jac_rel_step=jac_rel_step,
             objective_and_jacobian=objective_and_jacobian,
+            multi_start_tolerance=multi_start_tolerance,
         )
         self.algorithm = algorithm  # We don't want algorithm.upper() here
+        self.broyden_updates = broyden_updates
+        self.broyden_states = {}
 
     def core_run(self):
         """Core run of LeastSquares iterator."""
-        self.solution = least_squares(
-            self.objective,  # pylint: disable=duplicate-code
-            self.initial_guess,
+        self.broyden_states = {}
+        super().core_run()
+
+    def objective(self, x0, eval_function=None):
+        """Evaluate the residuals at *x0*.
+
+        If the next Jacobian is obtained by a Broyden update, the finite difference stencil is
+        not evaluated together with the residuals.
+
+        Args:
+            x0 (np.array): position to evaluate the residuals at
+            eval_function (callable, opt): Function evaluating the model at positions. Defaults
+                                           to *eval_model*.
+
+        Returns:
+            f0 (np.array): Residuals evaluated at *x0*
+        """
+        if not self._broyden_update_due(eval_function):
+            return super().objective(x0, eval_function)
+
+        f0 = (eval_function or self.eval_model)(x0)
+        parameter_list = self.parameters.parameters_keys
+        _logger.info("The intermediate, iterated parameters %s are:\n\t%s", parameter_list, x0)
+        return f0
+
+    def jacobian(self, x0, eval_function=None):
+        """Evaluate the Jacobian of the residuals at *x0*.
+
+        Uses a Broyden rank-1 update of the last Jacobian if due, otherwise finite differences.
+
+        Args:
+            x0 (np.array): position to evaluate Jacobian at
+            eval_function (callable, opt): Function evaluating the model at positions. Defaults
+                                           to *eval_model*.
+
+        Returns:
+            jacobian (np.array): Jacobian matrix evaluated at *x0*
+        """
+        if not self.broyden_updates:
+            return super().jacobian(x0, eval_function)
+
+        # the residuals at x0 are precalculated at this point
+        f0 = np.atleast_1d((eval_function or self.eval_model)(x0))
+        jacobian = None
+        num_updates = 0
+        if self._broyden_update_due(eval_function):
+            state = self.broyden_states[eval_function]
+            jacobian = self._broyden_update(state["jacobian"], x0 - state["x"], f0 - state["f"])
+            num_updates = state["num_updates"] + 1
+        if jacobian is None:
+            jacobian = super().jacobian(x0, eval_function)
+            num_updates = 0
+
+        self.broyden_states[eval_function] = {
+            "x": np.array(x0, dtype=float),
+            "f": f0,
+            "jacobian": jacobian,
+            "num_updates": num_updates,
+        }
+        return jacobian
+
+    @staticmethod
+    def _broyden_update(jacobian, delta_x, delta_f, max_secant_error=0.5):
+        """Broyden rank-1 update of a Jacobian.
+
+        The update is rejected if the Jacobian predicts the change of the residuals poorly, i.e.
+        if the relative secant error exceeds *max_secant_error*.
+
+        Args:
+            jacobian (np.ndarray): Jacobian at the last position
+            delta_x (np.ndarray): Step from the last to the current position
+            delta_f (np.ndarray): Change of the residuals along the step
+            max_secant_error (float, opt): Maximal relative secant error
+
+        Returns:
+            np.ndarray: Updated Jacobian or *None* if the update is rejected
+        """
+        jacobian_2d = np.atleast_2d(jacobian)
+        secant_error = delta_f - np.matmul(jacobian_2d, delta_x)
+        if np.linalg.norm(secant_error) > max_secant_error * np.linalg.norm(delta_f):
+            return None
+        if np.any(delta_x):
+            jacobian_2d = jacobian_2d + np.outer(secant_error, delta_x) / np.dot(delta_x, delta_x)
+        return jacobian_2d.reshape(np.shape(jacobian))
+
+    def _broyden_update_due(self, eval_function):
+        """Check if the next Jacobian is obtained by a Broyden update.
+
+        Args:
+            eval_function (callable): Function evaluating the model at positions
+
+        Returns:
+            bool: True if the next Jacobian is obtained by a Broyden update
+        """
+        state = self.broyden_states.get(eval_function)
+        return state is not None and state["num_updates"] < self.broyden_updates
+
+    def run_optimizer(self, initial_guess, objective, jacobian):
+        """Run the least-squares algorithm from a single start point.
+
+        Args:
+            initial_guess (np.array): Start point of the optimization
+            objective (callable): Residual function
+            jacobian (callable): Jacobian of the residual function
+
+        Returns:
+            solution (OptimizeResult): Result of the optimization
+        """
+        return least_squares(
+            objective,  # pylint: disable=duplicate-code
+            initial_guess,
             method=self.algorithm,
-            jac=self.jacobian,
+            jac=jacobian,
             bounds=self.bounds,
             max_nfev=self.max_feval,
             verbose=int(self.verbose_output),
         )
 
+    def objective_value(self, f0):
+        """Least-squares cost used to compare the starts of a multi-start optimization.
+
+        Args:
+            f0 (np.ndarray): Residuals evaluated at a position
+
+        Returns:
+            float: Least-squares cost
+        """
+        return 0.5 * float(np.sum(np.square(f0)))
+
     def post_run(self):
         """Analyze the resulting optimum."""
         _logger.info("Optimality:\n\t%s", self.solution.optimality)
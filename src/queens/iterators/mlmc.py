@@ -15,6 +15,8 @@
 """Multilevel Monte Carlo Iterator."""
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -36,6 +38,17 @@ class MLMC(Iterator):
     optimal ratio of samples between the estimators. The number of samples on the highest-fidelity
     model is set by the user.
 
+    Alternatively, the iterator can be run in an adaptive continuation mode by providing a target
+    root-mean-square error (RMSE). Starting from the initial number of samples, the number of
+    samples on each estimator is then iteratively refined towards the optimal number of samples
+    for which the variance of the MLMC estimator meets the squared target RMSE, i.e., the
+    discretization bias of the finest model is not accounted for. If no cost_models are provided,
+    the costs of the estimators are measured from the wall-clock times of the model evaluations.
+
+    Model evaluations on different schedulers are submitted concurrently, so that cheap levels do
+    not wait for expensive ones. Evaluations on the same scheduler are submitted in the order of
+    the estimators.
+
     The multilevel Monte Carlo (MLMC) estimator is given by
     :math:`\hat{\mu}_\mathrm{MLMC} = \underbrace{\frac{1}{N_{0}} \sum_{i=1}^{N_{0}} f_{0}(x^{(0,
     i)})}_\textrm{estimator 0} + \sum_{l=1}^{L} \underbrace{\bigg \{ \frac{1}{N_{l}} \sum_{i=1}^{N_
@@ -69,6 +82,8 @@ class MLMC(Iterator):
                         * ``mean_estimators`` (list): Estimated mean of each estimator.
                         * ``var_estimators`` (list): Variance of each estimator.
                         * ``num_samples`` (list): Number of evaluated samples of each estimator.
+                        * ``wall_time_models`` (np.array): Wall-clock time spent on the
+                                                           evaluations of each model.
                         * ``std_bootstrap`` (float): Bootstrap approximation of the calculated MLMC
                                                      estimator standard deviation. This value is not
                                                      computed if num_bootstrap_samples is 0.
@@ -82,6 +97,11 @@ class MLMC(Iterator):
         num_bootstrap_samples (int): Number of resamples to use for bootstrap estimate of
                                      standard deviation of this estimator. If set to 0, the
                                      iterator won't compute a bootstrap estimate.
+        target_rmse (float): Target RMSE of the adaptive continuation mode. If None, the
+                             adaptive continuation mode is not used.
+        max_num_iterations (int): Maximum number of refinement iterations of the adaptive
+                                  continuation mode.
+        wall_time_models (np.array): Wall-clock time spent on the evaluations of each model.
     """
 
     @log_init_args
@@ -95,6 +115,8 @@ class MLMC(Iterator):
         cost_models=None,
         use_optimal_num_samples=False,
         num_bootstrap_samples=0,
+        target_rmse=None,
+        max_num_iterations=10,
     ):
         """Initialize the multilevel Monte Carlo iterator.
 
@@ -107,7 +129,9 @@ class MLMC(Iterator):
             num_samples (list(int)): Number of samples to evaluate on each estimator or initial
                                      number of model evaluations if use_optimal_num_samples is True.
             cost_models (list(float), optional): List with the relative cost of each model. Only
-                                                 needed if use_optimal_num_samples is True.
+                                                 needed if use_optimal_num_samples is True. In the
+                                                 adaptive continuation mode, the measured costs
+                                                 are used if not provided.
             use_optimal_num_samples (bool, optional): Sets the mode of the iterator to either use
                                                       num_samples as the number of model
                                                       evaluations on each estimator or use
@@ -117,10 +141,16 @@ class MLMC(Iterator):
                                                    estimate of standard deviation of this
                                                    estimator. If set to 0, the iterator won't
                                                    compute a bootstrap estimate.
+            target_rmse (float, optional): Target RMSE of the MLMC estimator. If provided, the
+                                           number of samples is adaptively refined, starting from
+                                           num_samples.
+            max_num_iterations (int, optional): Maximum number of refinement iterations of the
+                                                adaptive continuation mode.
 
         Raises:
             ValueError: If num_samples and models are not of same length.
                         If models is not a list or num_samples is not a list.
+                        If use_optimal_num_samples is True and a target_rmse is provided.
         """
         # Initialize parent iterator with no model.
         super().__init__(None, parameters, global_settings)
@@ -134,12 +164,16 @@ class MLMC(Iterator):
         if not len(num_samples) == len(models):
             raise ValueError("models and num_samples have to be lists of same size!")
 
-        if use_optimal_num_samples:
-            if cost_models is None:
-                raise ValueError(
-                    "cost_models needs to be specified to use optimal number of samples"
-                )
+        if use_optimal_num_samples and target_rmse is not None:
+            raise ValueError(
+                "use_optimal_num_samples and target_rmse can not be used at the same time!"
+            )
 
+        if use_optimal_num_samples and cost_models is None:
+            raise ValueError("cost_models needs to be specified to use optimal number of samples")
+
+        self.cost_estimators = None
+        if cost_models is not None:
             # The cost of one sample evaluation of estimator i is the sum of the cost of model i
             # and model i-1, since both have to be evaluated to compute the expectation of the i-th
             # estimator.
@@ -154,6 +188,9 @@ class MLMC(Iterator):
         self.output = None
         self.use_optimal_num_samples = use_optimal_num_samples
         self.num_bootstrap_samples = num_bootstrap_samples
+        self.target_rmse = target_rmse
+        self.max_num_iterations = max_num_iterations
+        self.wall_time_models = np.zeros(len(models))
 
         # Test if number of samples is decreasing with increasing index.
         for i in range(1, len(self.num_samples)):
@@ -180,6 +217,82 @@ class MLMC(Iterator):
 
         return samples
 
+    def _evaluate_estimators(self, samples):
+        """Evaluate the models on the samples of each estimator.
+
+        Evaluations of models that share a scheduler are submitted sequentially in the order of
+        the estimators. Evaluations on different schedulers are submitted concurrently.
+
+        Args:
+            samples (list(np.array)): Samples for each estimator.
+
+        Returns:
+            results_estimators (list(np.array)): Results of each estimator. The entry is None if
+                                                 the estimator has no samples.
+            evaluation_times (np.array): Wall-clock time spent on the evaluations of each
+                                         estimator.
+        """
+        # Model evaluations as tuples (estimator index, model index, sign)
+        evaluations = [(0, 0, 1)] + [
+            (i, j, sign) for i in range(1, len(samples)) for j, sign in ((i, 1), (i - 1, -1))
+        ]
+        evaluations = [evaluation for evaluation in evaluations if len(samples[evaluation[0]])]
+
+        evaluation_groups = {}
+        for evaluation in evaluations:
+            model = self.models[evaluation[1]]
+            scheduler = getattr(model, "scheduler", model)
+            evaluation_groups.setdefault(id(scheduler), []).append(evaluation)
+
+        def evaluate_group(evaluation_group):
+            outputs = []
+            for estimator_index, model_index, sign in evaluation_group:
+                start_time = time.perf_counter()
+                result = self.models[model_index].evaluate(samples[estimator_index])["result"]
+                evaluation_time = time.perf_counter() - start_time
+                outputs.append((estimator_index, model_index, sign * result, evaluation_time))
+            return outputs
+
+        if len(evaluation_groups) > 1:
+            with ThreadPoolExecutor(max_workers=len(evaluation_groups)) as executor:
+                group_outputs = list(executor.map(evaluate_group, evaluation_groups.values()))
+        else:
+            group_outputs = [evaluate_group(group) for group in evaluation_groups.values()]
+
+        results_estimators = [None] * len(samples)
+        evaluation_times = np.zeros(len(samples))
+        for outputs in group_outputs:
+            for estimator_index, model_index, result, evaluation_time in outputs:
+                self.wall_time_models[model_index] += evaluation_time
+                if results_estimators[estimator_index] is None:
+                    results_estimators[estimator_index] = result
+                else:
+                    results_estimators[estimator_index] = (
+                        results_estimators[estimator_index] + result
+                    )
+                evaluation_times[estimator_index] += evaluation_time
+
+        return results_estimators, evaluation_times
+
+    @staticmethod
+    def _append_results(results_estimators, additional_results_estimators):
+        """Append additional results to the results of each estimator.
+
+        Args:
+            results_estimators (list(np.array)): Results of each estimator.
+            additional_results_estimators (list(np.array)): Additional results of each estimator.
+                                                            Entries without results are None.
+
+        Returns:
+            list(np.array): Combined results of each estimator.
+        """
+        return [
+            results if additional_results is None else np.concatenate((results, additional_results))
+            for results, additional_results in zip(
+                results_estimators, additional_results_estimators
+            )
+        ]
+
     def _compute_estimator_statistics(self, results_estimators):
         """Computes mean and variance for each estimator.
 
@@ -223,18 +336,7 @@ class MLMC(Iterator):
 
     def core_run(self):
         """Perform multilevel Monte Carlo analysis."""
-        # List of all estimator results.
-        results_estimators = []
-
-        # Estimator 0
-        results_estimators.append(self.models[0].evaluate(self.samples[0])["result"])
-
-        # Estimator 1,2,3 ... n
-        for i, samples in enumerate(self.samples[1:], 1):
-            results_estimators.append(
-                self.models[i].evaluate(samples)["result"]
-                - self.models[i - 1].evaluate(samples)["result"]
-            )
+        results_estimators, evaluation_times = self._evaluate_estimators(self.samples)
 
         mean_estimators, var_estimators, mean, std = self._compute_estimator_statistics(
             results_estimators
@@ -266,29 +368,25 @@ class MLMC(Iterator):
             ).astype(int)
 
             additional_samples = self._draw_samples(num_samples_additional)
-
-            # Iteration on estimator 0
-            results_estimators[0] = np.concatenate(
-                (results_estimators[0], self.models[0].evaluate(additional_samples[0])["result"])
+            additional_results_estimators, _ = self._evaluate_estimators(additional_samples)
+            results_estimators = self._append_results(
+                results_estimators, additional_results_estimators
             )
 
-            # Iteration on estimators 1,2,3 ... n
-            for i, samples in enumerate(additional_samples[1:], 1):
-                if num_samples_additional[i] > 0:
-                    results_estimators[i] = np.concatenate(
-                        (
-                            results_estimators[i],
-                            self.models[i].evaluate(samples)["result"]
-                            - self.models[i - 1].evaluate(samples)["result"],
-                        )
-                    )
-
             # Update num_samples with additional samples and update estimator statistics.
             self.num_samples = self.num_samples + num_samples_additional
             mean_estimators, var_estimators, mean, std = self._compute_estimator_statistics(
                 results_estimators
             )
 
+        if self.target_rmse is not None:
+            results_estimators = self._run_adaptive_continuation(
+                results_estimators, var_estimators, evaluation_times
+            )
+            mean_estimators, var_estimators, mean, std = self._compute_estimator_statistics(
+                results_estimators
+            )
+
         self.output = {
             "mean": mean,
             "var": std**2,
@@ -297,11 +395,67 @@ class MLMC(Iterator):
             "mean_estimators": mean_estimators,
             "var_estimators": var_estimators,
             "num_samples": self.num_samples,
+            "wall_time_models": self.wall_time_models,
         }
 
         if self.num_bootstrap_samples > 0:
             self.output["std_bootstrap"] = self._bootstrap(results_estimators)
 
+    def _run_adaptive_continuation(self, results_estimators, var_estimators, evaluation_times):
+        r"""Refine the number of samples of each estimator towards the target RMSE.
+
+        In each iteration, the optimal number of samples of each estimator is computed via
+        :math:`N_l = \epsilon^{-2} \sqrt{V_l / C_l} \sum_{k=0}^{L} \sqrt{V_k C_k}` with the target
+        RMSE :math:`\epsilon`, the variance :math:`V_l` and the cost :math:`C_l` of estimator
+        :math:`l`. Only the missing samples are evaluated. The iteration stops if no additional
+        samples are required or the maximum number of iterations is reached.
+
+        Args:
+            results_estimators (list(np.array)): Results of each estimator.
+            var_estimators (np.array): Variance of each estimator.
+            evaluation_times (np.array): Wall-clock time spent on the evaluations of each
+                                         estimator.
+
+        Returns:
+            results_estimators (list(np.array)): Refined results of each estimator.
+        """
+        num_samples = np.array(self.num_samples, dtype=int)
+        for iteration in range(self.max_num_iterations):
+            if self.cost_estimators is not None:
+                cost_estimators = np.array(self.cost_estimators, dtype=float)
+            else:
+                cost_estimators = evaluation_times / np.maximum(num_samples, 1)
+            cost_estimators = np.maximum(cost_estimators, np.finfo(float).tiny)
+
+            optimal_num_samples = np.ceil(
+                np.sqrt(var_estimators / cost_estimators)
+                * np.sum(np.sqrt(var_estimators * cost_estimators))
+                / self.target_rmse**2
+            ).astype(int)
+            num_samples_additional = np.maximum(optimal_num_samples - num_samples, 0)
+
+            if not num_samples_additional.any():
+                break
+
+            _logger.info(
+                "MLMC adaptive continuation iteration %d: additional samples %s",
+                iteration + 1,
+                num_samples_additional.tolist(),
+            )
+            additional_samples = self._draw_samples(num_samples_additional)
+            additional_results_estimators, additional_evaluation_times = self._evaluate_estimators(
+                additional_samples
+            )
+            results_estimators = self._append_results(
+                results_estimators, additional_results_estimators
+            )
+            num_samples += num_samples_additional
+            evaluation_times = evaluation_times + additional_evaluation_times
+            _, var_estimators, _, _ = self._compute_estimator_statistics(results_estimators)
+
+        self.num_samples = num_samples
+        return results_estimators
+
     def post_run(self):
         """Write results to result file."""
         write_results(
@@ -15,15 +15,19 @@
 """Deterministic optimization toolbox."""
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import numpy as np
-from scipy.optimize import Bounds, minimize
+from scipy.optimize import Bounds, OptimizeResult, minimize
 from scipy.optimize._numdiff import _prepare_bounds
 
 from queens.iterators._iterator import Iterator
 from queens.utils.fd_jacobian import fd_jacobian, get_positions
 from queens.utils.logger_settings import log_init_args
+from queens.utils.numpy_array import row_keys
 from queens.utils.process_outputs import write_results
 
 _logger = logging.getLogger(__name__)
@@ -72,7 +76,8 @@ class Optimization(Iterator):
                          Only for COBYLA, SLSQP and trust-constr
                          (see SciPy documentation for details)
         initial_guess (np.array): Initial guess, i.e. start point of
-                                  optimization.
+                                  optimization. A two-dimensional array contains one start
+                                  point per row.
         jac_method (str): Method to calculate a finite difference based approximation of the
                           Jacobian matrix:
 
@@ -87,12 +92,17 @@ class Optimization(Iterator):
                               printed by the optimizers.
         precalculated_positions (dict): Dictionary containing precalculated positions and
                                         corresponding model responses.
+        precalculated_index (dict): Index of every precalculated position (as bytes) in
+                                    *precalculated_positions*.
         solution (np.array): Solution obtained from the optimization process.
         objective_and_jacobian (bool): If true, every time the objective is evaluated also the
                                        jacobian is evaluated. This leads to improved batching, but
                                        can lead to unnecessary evaluations of the jacobian during
                                        line-search. This option is only available for gradient
                                        methods. Default is false.
+        multi_start_tolerance (float): Relative and absolute tolerance below which the iterates
+                                       or solutions of two starts are considered identical.
+        solutions (list): Results of the individual starts of a multi-start optimization.
     """
 
     @log_init_args
@@ -111,6 +121,7 @@ class Optimization(Iterator):
         jac_method="2-point",
         jac_rel_step=None,
         objective_and_jacobian=False,
+        multi_start_tolerance=1e-6,
     ):
         """Initialize an Optimization.
 
@@ -119,7 +130,10 @@ class Optimization(Iterator):
             parameters (Parameters): Parameters object
             global_settings (GlobalSettings): settings of the QUEENS experiment including its name
                                               and the output directory
-            initial_guess (array like): initial position at which the optimization starts
+            initial_guess (array like): initial position at which the optimization starts. If
+                                        two-dimensional, every row is the start point of an
+                                        independent optimization run. The runs are advanced in
+                                        lock-step such that their model evaluations are batched.
             result_description (dict): Description of desired post-processing.
             verbose_output (int): Integer encoding which kind of verbose information should be
                                   printed by the optimizers.
@@ -172,10 +186,16 @@ class Optimization(Iterator):
                                                 the jacobian during line-search.
                                                 This option is only available for gradient methods.
                                                 Default is false.
+            multi_start_tolerance (float, opt): Relative and absolute tolerance below which the
+                                                iterates or solutions of two starts are considered
+                                                identical. A start whose current iterate coincides
+                                                with the iterate of a start with a lower objective
+                                                is stopped early. Only used for several starts.
         """
         super().__init__(model, parameters, global_settings)
 
         initial_guess = np.atleast_1d(np.array(initial_guess))
+        first_initial_guess = np.atleast_2d(initial_guess)[0]
 
         # check sanity of bounds and extract array of lower and upper bounds to unify the bounds
         if not isinstance(bounds, Bounds):
@@ -184,7 +204,7 @@ class Optimization(Iterator):
                 # lb or ub can be scalars which don't have a len attribute
                 if hasattr(lb, "__len__") and hasattr(ub, "__len__"):
                     # warn if definition of bounds is not unique
-                    if len(lb) == 2 and len(ub) == 2 and len(initial_guess) == 2:
+                    if len(lb) == 2 and len(ub) == 2 and len(first_initial_guess) == 2:
                         _logger.warning(
                             "Definition of 'bounds' is not unique. "
                             "Make sure to use the 'new' definition of bounds: "
@@ -205,7 +225,7 @@ class Optimization(Iterator):
         # unify the bounds:
         # make sure that each array contains number of variable entries
         # i.e. we need one lower bound and one upper bound per variable
-        lb, ub = _prepare_bounds((lb, ub), initial_guess)
+        lb, ub = _prepare_bounds((lb, ub), first_initial_guess)
 
         # convert to Bounds object to ensure correct handling by scipy.optimize
         bounds = Bounds(lb=lb, ub=ub)
@@ -229,39 +249,49 @@ class Optimization(Iterator):
         self.result_description = result_description
         self.verbose_output = verbose_output
         self.precalculated_positions = {"position": [], "output": []}
+        self.precalculated_index = {}
         self.solution = None
         self.objective_and_jacobian = objective_and_jacobian
         if self.algorithm in ["COBYLA", "NELDER-MEAD", "POWELL"]:
             self.objective_and_jacobian = False
+        self.multi_start_tolerance = multi_start_tolerance
+        self.solutions = []
 
-    def objective(self, x0):
+    def objective(self, x0, eval_function=None):
         """Evaluate objective function at *x0*.
 
         Args:
             x0 (np.array): position to evaluate objective at
+            eval_function (callable, opt): Function evaluating the model at positions. Defaults
+                                           to *eval_model*.
 
         Returns:
             f0 (float): Objective function evaluated at *x0*
         """
         if self.objective_and_jacobian:
-            f0 = self.evaluate_fd_positions(x0)[0]
+            f0 = self.evaluate_fd_positions(x0, eval_function)[0]
         else:
-            f0 = self.eval_model(x0)
+            f0 = (eval_function or self.eval_model)(x0)
 
         parameter_list = self.parameters.parameters_keys
         _logger.info("The intermediate, iterated parameters %s are:\n\t%s", parameter_list, x0)
 
         return f0
 
-    def jacobian(self, x0):
+    def jacobian(self, x0, eval_function=None):
         """Evaluate Jacobian of objective function at *x0*.
 
         Args:
             x0 (np.array): position to evaluate Jacobian at
+            eval_function (callable, opt): Function evaluating the model at positions. Defaults
+                                           to *eval_model*.
+
         Returns:
             jacobian (np.array): Jacobian matrix evaluated at *x0*
         """
-        f0, f_perturbed, delta_positions, use_one_sided = self.evaluate_fd_positions(x0)
+        f0, f_perturbed, delta_positions, use_one_sided = self.evaluate_fd_positions(
+            x0, eval_function
+        )
         jacobian = fd_jacobian(
             f0, f_perturbed, delta_positions, use_one_sided, method=self.jac_method
         )
@@ -278,11 +308,13 @@ class Optimization(Iterator):
                 )
         return jacobian
 
-    def evaluate_fd_positions(self, x0):
+    def evaluate_fd_positions(self, x0, eval_function=None):
         """Evaluate objective function at finite difference positions.
 
         Args:
             x0 (np.array): Position at which the Jacobian is computed.
+            eval_function (callable, opt): Function evaluating the model at positions. Defaults
+                                           to *eval_model*.
 
         Returns:
             f0 (ndarray): Objective function value at *x0*
@@ -300,7 +332,7 @@ class Optimization(Iterator):
 
         # model response should now correspond to objective function evaluated at positions
         positions = np.vstack((x0, additional_positions))
-        f_batch = self.eval_model(positions)
+        f_batch = (eval_function or self.eval_model)(positions)
 
         f0 = f_batch[0].reshape(-1)  # first entry corresponds to f(x0)
         f_perturbed = f_batch[1:].reshape(-1, f0.size)
@@ -315,22 +347,47 @@ class Optimization(Iterator):
         _logger.info("Welcome to Optimization core run.")
         start = time.time()
 
+        initial_guesses = np.atleast_2d(self.initial_guess)
+        if len(initial_guesses) == 1:
+            self.solution = self.run_optimizer(initial_guesses[0], self.objective, self.jacobian)
+            self.solutions = [self.solution]
+        else:
+            self.solutions = self.run_multi_start(initial_guesses)
+            self.solution = min(
+                (solution for solution in self.solutions if solution.status != -1),
+                key=lambda solution: self.objective_value(solution.fun),
+            )
+        end = time.time()
+        _logger.info("Optimization took %E seconds.", end - start)
+
+    def run_optimizer(self, initial_guess, objective, jacobian):
+        """Run the optimization algorithm from a single start point.
+
+        Args:
+            initial_guess (np.array): Start point of the optimization
+            objective (callable): Objective function
+            jacobian (callable): Jacobian of the objective function
+
+        Returns:
+            solution (OptimizeResult): Result of the optimization
+        """
+        solution = None
         # minimization with bounds using Jacobian
         if self.algorithm in {"L-BFGS-B", "TNC"}:
-            self.solution = minimize(
-                self.objective,
-                self.initial_guess,
+            solution = minimize(
+                objective,
+                initial_guess,
                 method=self.algorithm,
-                jac=self.jacobian,
+                jac=jacobian,
                 bounds=self.bounds,
                 options={"maxiter": int(1e4), "disp": self.verbose_output},
             )
         # Constrained Optimization BY Linear Approximation:
         # minimization with constraints without Jacobian
         elif self.algorithm in {"COBYLA"}:
-            self.solution = minimize(
-                self.objective,
-                self.initial_guess,
+            solution = minimize(
+                objective,
+                initial_guess,
                 method=self.algorithm,
                 constraints=self.cons,
                 options={"disp": self.verbose_output},
@@ -338,34 +395,118 @@ class Optimization(Iterator):
         # Sequential Least SQuares Programming:
         # minimization with bounds and constraints using Jacobian
         elif self.algorithm in {"SLSQP"}:
-            self.solution = minimize(
-                self.objective,
-                self.initial_guess,
+            solution = minimize(
+                objective,
+                initial_guess,
                 method=self.algorithm,
-                jac=self.jacobian,
+                jac=jacobian,
                 bounds=self.bounds,
                 constraints=self.cons,
                 options={"disp": self.verbose_output},
             )
         # minimization (unconstrained, unbounded) without Jacobian
         elif self.algorithm in {"NELDER-MEAD", "POWELL"}:
-            self.solution = minimize(
-                self.objective,
-                self.initial_guess,
+            solution = minimize(
+                objective,
+                initial_guess,
                 method=self.algorithm,
                 options={"disp": self.verbose_output},
             )
         # minimization (unconstrained, unbounded) using Jacobian
         elif self.algorithm in {"CG", "BFGS"}:
-            self.solution = minimize(
-                self.objective,
-                self.initial_guess,
+            solution = minimize(
+                objective,
+                initial_guess,
                 method=self.algorithm,
-                jac=self.jacobian,
+                jac=jacobian,
                 options={"disp": self.verbose_output},
             )
-        end = time.time()
-        _logger.info("Optimization took %E seconds.", end - start)
+        return solution
+
+    def run_multi_start(self, initial_guesses):
+        """Run independent optimizations from several start points in lock-step.
+
+        Every start runs its optimizer in a separate thread. The model evaluations requested by
+        the starts are collected and evaluated in a single batch per round. Starts whose current
+        iterate coincides with the iterate or solution of a start with a lower objective are
+        stopped early.
+
+        COBYLA starts are run one after another, as scipy serializes all COBYLA runs of a process
+        with a module-wide lock. They are still stopped early once they coincide with a previous
+        start.
+
+        Args:
+            initial_guesses (np.array): Start points of the optimizations (one per row)
+
+        Returns:
+            solutions (list): Results of the starts. Stopped starts are marked by status -1 and
+                              contain their best evaluated point.
+        """
+        lockstep_evaluator = _LockstepEvaluator(
+            self.eval_model, self.objective_value, self.multi_start_tolerance
+        )
+
+        def run_start(start_id):
+            eval_function = partial(lockstep_evaluator.evaluate, start_id)
+            solution = None
+            try:
+                solution = self.run_optimizer(
+                    initial_guesses[start_id],
+                    partial(self.objective, eval_function=eval_function),
+                    partial(self.jacobian, eval_function=eval_function),
+                )
+            except _StartStoppedError as stop:
+                x, fun = lockstep_evaluator.best_evaluation(start_id)
+                solution = OptimizeResult(x=x, fun=fun, success=False, status=-1, message=str(stop))
+            finally:
+                lockstep_evaluator.finish(start_id, solution)
+            return solution
+
+        if self.algorithm == "COBYLA":
+            solutions = []
+            for start_id in range(len(initial_guesses)):
+                lockstep_evaluator.activate([start_id])
+                solutions.append(run_start(start_id))
+        else:
+            lockstep_evaluator.activate(range(len(initial_guesses)))
+            with ThreadPoolExecutor(max_workers=len(initial_guesses)) as executor:
+                solutions = list(executor.map(run_start, range(len(initial_guesses))))
+
+        unique_solutions = []
+        for solution in sorted(
+            (solution for solution in solutions if solution.status != -1),
+            key=lambda solution: self.objective_value(solution.fun),
+        ):
+            if not any(
+                np.allclose(
+                    solution.x,
+                    unique_solution.x,
+                    rtol=self.multi_start_tolerance,
+                    atol=self.multi_start_tolerance,
+                )
+                for unique_solution in unique_solutions
+            ):
+                unique_solutions.append(solution)
+        _logger.info(
+            "%d starts found %d distinct solutions, %d starts were stopped early after %d "
+            "batched evaluation rounds.",
+            len(solutions),
+            len(unique_solutions),
+            sum(solution.status == -1 for solution in solutions),
+            lockstep_evaluator.num_rounds,
+        )
+        return solutions
+
+    def objective_value(self, f0):
+        """Scalar objective value used to compare the starts of a multi-start optimization.
+
+        Args:
+            f0 (np.ndarray): Objective function evaluated at a position
+
+        Returns:
+            float: Scalar objective value
+        """
+        return float(np.squeeze(f0))
 
     def post_run(self):
         """Analyze the resulting optimum."""
@@ -403,7 +544,11 @@ class Optimization(Iterator):
             f_new = self.model.evaluate(new_positions_to_evaluate)["result"]
             for position_id, output in zip(new_positions_batch_id, f_new):
                 f_batch[position_id] = output
-            self.precalculated_positions["position"].extend(new_positions_to_evaluate)
+            for position in new_positions_to_evaluate:
+                self.precalculated_index.setdefault(
+                    row_keys(position)[0].tobytes(), len(self.precalculated_positions["position"])
+                )
+                self.precalculated_positions["position"].append(position)
             self.precalculated_positions["output"].extend(f_new)
         f_batch = np.array(f_batch).squeeze()
         return f_batch
@@ -417,7 +562,156 @@ class Optimization(Iterator):
         Returns:
             np.ndarray: Precalculated model response or *None*
         """
-        for i, precalculated_position in enumerate(self.precalculated_positions["position"]):
-            if np.equal(position, precalculated_position).all():
-                return self.precalculated_positions["output"][i]
-        return None
+        i = self.precalculated_index.get(row_keys(position)[0].tobytes())
+        if i is None:
+            return None
+        return self.precalculated_positions["output"][i]
+
+
+class _StartStoppedError(Exception):
+    """Signal that a start of a multi-start optimization is stopped early."""
+
+
+class _LockstepEvaluator:
+    """Batch the model evaluations of several optimization starts.
+
+    Every active start submits its positions and waits. As soon as all active starts have
+    submitted, the unique positions of all starts are evaluated in one batch.
+
+    The first position of a request may be a trial point, e.g., of a line search. Hence, the best
+    evaluated position of a start serves as its current iterate when comparing starts.
+
+    Attributes:
+        eval_model (callable): Function evaluating the model at positions
+        objective_value (callable): Function mapping an objective to a scalar value
+        tolerance (float): Tolerance below which two iterates are considered identical
+        condition (threading.Condition): Condition synchronizing the starts
+        active_starts (set): Ids of the starts that did not finish yet
+        requests (dict): Positions submitted by the starts in the current round
+        results (dict): Model responses for the starts of the last round
+        stopped_starts (dict): Ids of the stopped starts and the ids of the dominating starts
+        iterates (dict): Best evaluated position (or solution) and its objective value of every
+                         start
+        best_evaluations (dict): Best evaluated position and objective of every start
+        num_rounds (int): Number of batched evaluation rounds
+    """
+
+    def __init__(self, eval_model, objective_value, tolerance):
+        """Initialize the lock-step evaluator.
+
+        Args:
+            eval_model (callable): Function evaluating the model at positions
+            objective_value (callable): Function mapping an objective to a scalar value
+            tolerance (float): Tolerance below which two iterates are considered identical
+        """
+        self.eval_model = eval_model
+        self.objective_value = objective_value
+        self.tolerance = tolerance
+        self.condition = threading.Condition()
+        self.active_starts = set()
+        self.requests = {}
+        self.results = {}
+        self.stopped_starts = {}
+        self.iterates = {}
+        self.best_evaluations = {}
+        self.num_rounds = 0
+
+    def activate(self, start_ids):
+        """Add starts to the lock-step evaluation.
+
+        Args:
+            start_ids (iterable): Ids of the starts
+        """
+        with self.condition:
+            self.active_starts.update(start_ids)
+
+    def evaluate(self, start_id, positions):
+        """Evaluate the model at the positions of a start in the next batch.
+
+        Args:
+            start_id (int): Id of the start
+            positions (np.ndarray): Positions at which the model is evaluated
+
+        Returns:
+            f_batch (np.ndarray): Model response
+        """
+        with self.condition:
+            self._raise_if_stopped(start_id)
+            self.requests[start_id] = np.atleast_2d(positions)
+            self._evaluate_round()
+            while start_id not in self.results and start_id not in self.stopped_starts:
+                self.condition.wait()
+            f_batch = self.results.pop(start_id, None)
+            self._raise_if_stopped(start_id)
+            return f_batch
+
+    def finish(self, start_id, solution):
+        """Remove a finished start from the lock-step evaluation.
+
+        Args:
+            start_id (int): Id of the start
+            solution (OptimizeResult): Result of the start
+        """
+        with self.condition:
+            self.active_starts.discard(start_id)
+            self.requests.pop(start_id, None)
+            if solution is not None and start_id not in self.stopped_starts:
+                self.iterates[start_id] = (solution.x, self.objective_value(solution.fun))
+            self._evaluate_round()
+
+    def best_evaluation(self, start_id):
+        """Get the best evaluated position of a start.
+
+        Args:
+            start_id (int): Id of the start
+
+        Returns:
+            x (np.ndarray): Best evaluated position
+            fun (np.ndarray): Objective function at the best evaluated position
+        """
+        with self.condition:
+            x, _, fun = self.best_evaluations[start_id]
+            return x, fun
+
+    def _raise_if_stopped(self, start_id):
+        """Raise if a start was stopped.
+
+        Args:
+            start_id (int): Id of the start
+        """
+        if start_id in self.stopped_starts:
+            raise _StartStoppedError(
+                f"Stopped: iterate coincides with start {self.stopped_starts[start_id]}."
+            )
+
+    def _evaluate_round(self):
+        """Evaluate the submitted positions once all active starts have submitted."""
+        if not self.requests or set(self.requests) != self.active_starts:
+            return
+        self.num_rounds += 1
+        self.eval_model(np.unique(np.vstack(list(self.requests.values())), axis=0))
+        for start_id, positions in self.requests.items():
+            # all positions are precalculated now
+            self.results[start_id] = self.eval_model(positions)
+            x0 = positions[0]
+            f0 = self.eval_model(x0)
+            value = self.objective_value(f0)
+            if start_id not in self.best_evaluations or value < self.best_evaluations[start_id][1]:
+                self.best_evaluations[start_id] = (x0, value, f0)
+            self.iterates[start_id] = self.best_evaluations[start_id][:2]
+        self._stop_dominated_starts()
+        self.requests = {}
+        self.condition.notify_all()
+
+    def _stop_dominated_starts(self):
+        """Stop starts whose iterate coincides with the iterate of a better start."""
+        for start_id in sorted(self.requests):
+            x, value = self.iterates[start_id]
+            for other_id, (other_x, other_value) in self.iterates.items():
+                if other_id == start_id or other_id in self.stopped_starts:
+                    continue
+                if (other_value, other_id) < (value, start_id) and np.allclose(
+                    x, other_x, rtol=self.tolerance, atol=self.tolerance
+                ):
+                    self.stopped_starts[start_id] = other_id
+                    break
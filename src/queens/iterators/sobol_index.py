@@ -15,12 +15,14 @@
 """Estimate Sobol indices."""
 
 import logging
+import math
 
 import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
 from SALib.analyze import sobol
 from SALib.sample import saltelli
+from scipy.stats import norm, qmc
 
 from queens.iterators._iterator import Iterator
 from queens.utils.logger_settings import log_init_args
@@ -33,7 +35,10 @@ _logger = logging.getLogger(__name__)
 class SobolIndex(Iterator):
     """Sobol Index Iterator.
 
-    This class essentially provides a wrapper around the SALib library.
+    This class essentially provides a wrapper around the SALib library. Optionally, the Saltelli
+    design is streamed: blocks of base samples are generated, evaluated and folded into running
+    estimator sums one chunk at a time, such that the full design is never held in memory and the
+    analysis can stop early once the indices have converged.
 
     Attributes:
         seed (int): Seed for random number generator.
@@ -50,6 +55,10 @@ class SobolIndex(Iterator):
         num_params (int): Number of parameters.
         parameter_names (list): List of parameter names.
         sensitivity_indices (dict): Sensitivity indices from Sobol analysis.
+        chunk_size (int or None): Number of base samples evaluated per chunk in streaming mode.
+        convergence_tolerance (float or None): Largest admissible confidence half-width of the
+                                               first-order and total indices to stop streaming.
+        convergence_history (list): Indices and confidence intervals after each streamed chunk.
     """
 
     @log_init_args
@@ -65,6 +74,8 @@ class SobolIndex(Iterator):
         confidence_level,
         result_description,
         skip_values=None,
+        chunk_size=None,
+        convergence_tolerance=None,
     ):
         """Initialize Saltelli SALib iterator object.
 
@@ -82,6 +93,15 @@ class SobolIndex(Iterator):
                                        of base 2. None triggers the SALib default value:
                                        a power of 2 >= N, or 16; whichever is greater.
                                        (default: None).
+            chunk_size (int or None): Number of base samples evaluated per chunk. If provided, the
+                                      Saltelli design is streamed and the indices are estimated
+                                      from running sums with confidence intervals from the delta
+                                      method instead of bootstrapping. None evaluates the full
+                                      design at once (default: None).
+            convergence_tolerance (float or None): Stop streaming once the confidence half-widths
+                                                   of all first-order and total indices are below
+                                                   this value. None evaluates all *num_samples*
+                                                   base samples (default: None).
         """
         super().__init__(model, parameters, global_settings)
 
@@ -99,6 +119,9 @@ class SobolIndex(Iterator):
         self.num_params = self.parameters.num_parameters
         self.parameter_names = self.parameters.names
         self.sensitivity_indices = None
+        self.chunk_size = chunk_size
+        self.convergence_tolerance = convergence_tolerance
+        self.convergence_history = []
 
     def pre_run(self):
         """Generate samples for subsequent analysis and update model."""
@@ -121,6 +144,10 @@ class SobolIndex(Iterator):
             "dists": distribution_types,
         }
 
+        if self.chunk_size is not None:
+            # samples are drawn chunk by chunk in core_run
+            return
+
         _logger.info("Draw %s samples...", self.num_samples)
         self.samples = saltelli.sample(
             self.salib_problem,
@@ -139,6 +166,10 @@ class SobolIndex(Iterator):
 
     def core_run(self):
         """Run Analysis on model."""
+        if self.chunk_size is not None:
+            self.core_run_streaming()
+            return
+
         _logger.info("Evaluate model...")
         self.output = self.model.evaluate(self.samples)
 
@@ -153,6 +184,84 @@ class SobolIndex(Iterator):
             seed=self.seed,
         )
 
+    def core_run_streaming(self):
+        """Evaluate the Saltelli design chunk-wise and estimate indices from running sums.
+
+        The base Sobol' sequence coincides with the one of *SALib.sample.saltelli*. As the mean of
+        all outputs is unknown while streaming, the outputs are centered with the mean of the first
+        chunk instead.
+        """
+        skip_values = self.skip_values
+        if skip_values is None:
+            skip_values = max(int(2 ** math.ceil(math.log2(self.num_samples))), 16)
+        base_sequence = qmc.Sobol(d=2 * self.num_params, scramble=False)
+        base_sequence.fast_forward(skip_values)
+
+        estimates = _StreamingSobolEstimates(self.num_params, self.calc_second_order)
+        self.convergence_history = []
+        num_evaluated = 0
+        while num_evaluated < self.num_samples:
+            num_chunk = min(self.chunk_size, self.num_samples - num_evaluated)
+            samples = self.saltelli_block(base_sequence.random(num_chunk))
+            samples = self.parameters.inverse_cdf_transform(samples)
+            output = self.model.evaluate(samples)["result"]
+            estimates.update(np.reshape(output, (num_chunk, -1)))
+            num_evaluated += num_chunk
+
+            self.sensitivity_indices = estimates.indices(self.confidence_level)
+            max_conf = max(
+                np.max(self.sensitivity_indices["S1_conf"]),
+                np.max(self.sensitivity_indices["ST_conf"]),
+            )
+            self.convergence_history.append(
+                {
+                    "num_samples": num_evaluated,
+                    **{
+                        key: self.sensitivity_indices[key].copy()
+                        for key in ["S1", "S1_conf", "ST", "ST_conf"]
+                    },
+                }
+            )
+            _logger.info(
+                "Sobol indices after %d/%d base samples (max. confidence half-width %.3e):",
+                num_evaluated,
+                self.num_samples,
+                max_conf,
+            )
+            _logger.info("S1 = %s", self.sensitivity_indices["S1"])
+            _logger.info("ST = %s", self.sensitivity_indices["ST"])
+
+            if self.convergence_tolerance is not None and max_conf <= self.convergence_tolerance:
+                _logger.info("Sobol indices converged after %d base samples.", num_evaluated)
+                break
+
+    def saltelli_block(self, base_samples):
+        """Arrange base samples in the Saltelli design.
+
+        The rows of each base sample are ordered as in *SALib.sample.saltelli*:
+        A, AB_1, ..., AB_D, (BA_1, ..., BA_D), B.
+
+        Args:
+            base_samples (np.ndarray): Base samples of dimension 2D in the unit hypercube
+
+        Returns:
+            np.ndarray: Saltelli samples in the unit hypercube
+        """
+        sample_a = base_samples[:, : self.num_params]
+        sample_b = base_samples[:, self.num_params :]
+        diagonal = np.arange(self.num_params)
+
+        sample_ab = np.repeat(sample_a[:, np.newaxis], self.num_params, axis=1)
+        sample_ab[:, diagonal, diagonal] = sample_b
+        blocks = [sample_a[:, np.newaxis], sample_ab]
+        if self.calc_second_order:
+            sample_ba = np.repeat(sample_b[:, np.newaxis], self.num_params, axis=1)
+            sample_ba[:, diagonal, diagonal] = sample_a
+            blocks.append(sample_ba)
+        blocks.append(sample_b[:, np.newaxis])
+
+        return np.concatenate(blocks, axis=1).reshape(-1, self.num_params)
+
     def post_run(self):
         """Analyze the results."""
         results = self.process_results()
@@ -237,6 +346,7 @@ class SobolIndex(Iterator):
             "second_order": self.calc_second_order,
             "samples": self.samples,
             "output": self.output,
+            "convergence_history": self.convergence_history,
         }
 
         return results
@@ -323,3 +433,125 @@ class SobolIndex(Iterator):
 
             fig = go.Figure(data=data, layout=layout)
             fig.write_html(chart_path)
+
+
+class _StreamingSobolEstimates:
+    """Running sums of the Saltelli estimators of Sobol indices.
+
+    Each index is the ratio of the mean of a per-sample term and the output variance, following the
+    estimators of *SALib.analyze.sobol*. Confidence intervals follow from the delta method applied
+    to this ratio.
+
+    Attributes:
+        num_params (int): Number of parameters.
+        calc_second_order (bool): Whether to estimate second-order indices.
+        output_shift (float or None): Mean of the first chunk used to center the outputs.
+        num_samples (int): Number of base samples processed so far.
+        sums (dict): Running sums of the estimator terms and their products.
+    """
+
+    def __init__(self, num_params, calc_second_order):
+        """Initialize the running sums.
+
+        Args:
+            num_params (int): Number of parameters.
+            calc_second_order (bool): Whether to estimate second-order indices.
+        """
+        self.num_params = num_params
+        self.calc_second_order = calc_second_order
+        self.output_shift = None
+        self.num_samples = 0
+        self.sums = {}
+
+    def update(self, output):
+        """Add the outputs of a chunk of base samples to the running sums.
+
+        Args:
+            output (np.ndarray): Outputs of the Saltelli design arranged per base sample
+        """
+        if self.output_shift is None:
+            self.output_shift = np.mean(output)
+        output = output - self.output_shift
+
+        output_a = output[:, :1]
+        output_b = output[:, -1:]
+        output_ab = output[:, 1 : self.num_params + 1]
+        terms = [output_b * (output_ab - output_a), 0.5 * (output_a - output_ab) ** 2]
+        if self.calc_second_order:
+            output_ba = output[:, self.num_params + 1 : 2 * self.num_params + 1]
+            j, k = np.triu_indices(self.num_params, k=1)
+            terms.append(
+                output_ba[:, j] * output_ab[:, k]
+                - output_a * output_b
+                - output_b * (output_ab[:, j] - output_a)
+                - output_b * (output_ab[:, k] - output_a)
+            )
+        terms = np.concatenate(terms, axis=1)
+        # first and second moment of the output per base sample for the variance
+        mean = 0.5 * (output_a + output_b)[:, 0]
+        square = 0.5 * (output_a**2 + output_b**2)[:, 0]
+
+        chunk_sums = {
+            "mean": np.sum(mean),
+            "square": np.sum(square),
+            "mean_mean": mean @ mean,
+            "square_square": square @ square,
+            "mean_square": mean @ square,
+            "terms": np.sum(terms, axis=0),
+            "terms_terms": np.sum(terms**2, axis=0),
+            "terms_mean": mean @ terms,
+            "terms_square": square @ terms,
+        }
+        for key, value in chunk_sums.items():
+            self.sums[key] = self.sums.get(key, 0.0) + value
+        self.num_samples += output.shape[0]
+
+    def indices(self, confidence_level):
+        """Estimate the Sobol indices from the running sums.
+
+        Args:
+            confidence_level (float): Confidence level for intervals
+
+        Returns:
+            dict: Indices and confidence half-widths with the keys of *SALib.analyze.sobol*
+        """
+        means = {key: value / self.num_samples for key, value in self.sums.items()}
+
+        def covariance(key_1, key_2):
+            return means[f"{key_1}_{key_2}"] - means[key_1] * means[key_2]
+
+        mean = means["mean"]
+        variance = means["square"] - mean**2
+        ratio = means["terms"] / variance
+
+        # linearization of the variance w.r.t. the per-sample moments
+        variance_variance = (
+            covariance("square", "square")
+            - 4 * mean * covariance("mean", "square")
+            + 4 * mean**2 * covariance("mean", "mean")
+        )
+        covariance_terms_variance = covariance("terms", "square") - 2 * mean * covariance(
+            "terms", "mean"
+        )
+        ratio_variance = (
+            covariance("terms", "terms")
+            - 2 * ratio * covariance_terms_variance
+            + ratio**2 * variance_variance
+        ) / variance**2
+        conf = norm.ppf(0.5 + confidence_level / 2) * np.sqrt(
+            np.maximum(ratio_variance, 0.0) / self.num_samples
+        )
+
+        num_params = self.num_params
+        sensitivity_indices = {
+            "S1": ratio[:num_params],
+            "S1_conf": conf[:num_params],
+            "ST": ratio[num_params : 2 * num_params],
+            "ST_conf": conf[num_params : 2 * num_params],
+        }
+        if self.calc_second_order:
+            upper_triangle = np.triu_indices(num_params, k=1)
+            for key, values in [("S2", ratio), ("S2_conf", conf)]:
+                sensitivity_indices[key] = np.full((num_params, num_params), np.nan)
+                sensitivity_indices[key][upper_triangle] = values[2 * num_params :]
+        return sensitivity_indices
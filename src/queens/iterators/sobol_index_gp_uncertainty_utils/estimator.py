@@ -17,20 +17,158 @@
 import logging
 import multiprocessing as mp
 import time
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
 
 import numpy as np
 import xarray as xr
 
 from queens.iterators.sobol_index_gp_uncertainty_utils.utils_estimate_indices import (
-    calculate_indices_first_total_order,
-    calculate_indices_second_order_gp_mean,
-    calculate_indices_second_order_gp_realizations,
+    calculate_indices,
     calculate_indices_third_order,
 )
 from queens.utils.logger_settings import log_init_args
 
 _logger = logging.getLogger(__name__)
 
+# prediction and bootstrap indices of a worker process of the shared prediction pool
+_WORKER_DATA = {}
+
+
+@contextmanager
+def shared_prediction_pool(prediction, bootstrap_idx, num_procs):
+    """Start a worker pool sharing the prediction via shared memory.
+
+    The prediction is copied into shared memory once and the bootstrap indices are sent once per
+    worker, such that the tasks only carry the chunks of Gaussian process realizations and
+    bootstrap samples to evaluate. Tasks are evaluated with *estimate_from_shared_prediction*.
+
+    Args:
+        prediction (xr.DataArray): prediction from Gaussian process
+        bootstrap_idx (ndarray): index for bootstrapping
+        num_procs (int): number of processors
+
+    Yields:
+        pool (multiprocessing.pool.Pool): worker pool
+    """
+    data = prediction.transpose("gp_realization", ...).data
+    shared_memory = SharedMemory(create=True, size=max(data.nbytes, 1))
+    try:
+        shared_data = np.ndarray(data.shape, dtype=data.dtype, buffer=shared_memory.buf)
+        shared_data[...] = data
+        del shared_data
+        with mp.get_context("spawn").Pool(
+            num_procs,
+            initializer=_init_shared_prediction_worker,
+            initargs=(shared_memory.name, data.shape, data.dtype, bootstrap_idx),
+        ) as pool:
+            yield pool
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+
+
+def _init_shared_prediction_worker(shared_memory_name, shape, dtype, bootstrap_idx):
+    """Attach a worker process to the shared prediction.
+
+    Args:
+        shared_memory_name (str): name of the shared memory block of the prediction
+        shape (tuple): shape of the prediction (gp_realization first)
+        dtype (np.dtype): data type of the prediction
+        bootstrap_idx (ndarray): index for bootstrapping
+    """
+    shared_memory = SharedMemory(name=shared_memory_name)
+    _WORKER_DATA["shared_memory"] = shared_memory
+    _WORKER_DATA["prediction"] = np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf)
+    _WORKER_DATA["bootstrap_idx"] = bootstrap_idx
+
+
+def estimate_from_shared_prediction(
+    estimate_function, gp_realizations, bootstrap_samples, *estimate_args
+):
+    """Evaluate an estimate function on the shared prediction of a worker.
+
+    Args:
+        estimate_function (obj): function object for estimate calculation
+        gp_realizations (slice): Gaussian process realizations to evaluate
+        bootstrap_samples (slice): bootstrap samples to evaluate
+        estimate_args: additional arguments of the estimate function
+
+    Returns:
+        estimates: output of the estimate function
+    """
+    prediction = _WORKER_DATA["prediction"][gp_realizations]
+    bootstrap_idx = _WORKER_DATA["bootstrap_idx"][bootstrap_samples]
+    return estimate_function(prediction, bootstrap_idx, *estimate_args)
+
+
+def evaluate_estimates(prediction, bootstrap_idx, input_list, num_procs):
+    """Evaluate the tasks of an estimator.
+
+    Several tasks are evaluated in a shared prediction pool with at most one process per task. A
+    single task is evaluated directly, such that no processes are started and the prediction is
+    not copied.
+
+    Args:
+        prediction (xr.DataArray): prediction from Gaussian process
+        bootstrap_idx (ndarray): index for bootstrapping
+        input_list (list): list of input for *estimate_from_shared_prediction*
+        num_procs (int): number of processors
+
+    Returns:
+        raw_output (list): output of the estimate function per task
+    """
+    if len(input_list) == 1:
+        estimate_function, gp_realizations, bootstrap_samples, *estimate_args = input_list[0]
+        data = prediction.transpose("gp_realization", ...).data
+        return [
+            estimate_function(
+                data[gp_realizations], bootstrap_idx[bootstrap_samples], *estimate_args
+            )
+        ]
+
+    num_procs = min(num_procs, len(input_list))
+    with shared_prediction_pool(prediction, bootstrap_idx, num_procs) as pool:
+        return pool.starmap(estimate_from_shared_prediction, input_list)
+
+
+def split_estimate_chunks(number_gp_realizations, number_bootstrap_samples, num_procs):
+    """Split the estimates into contiguous chunks of about one per process.
+
+    The Gaussian process realizations are split first. If there are fewer realizations than
+    processes, e.g., for the Gaussian process mean, the bootstrap samples are split as well.
+
+    Args:
+        number_gp_realizations (int): number of Gaussian process realizations
+        number_bootstrap_samples (int): number of bootstrap samples
+        num_procs (int): number of processors
+
+    Returns:
+        chunks (list): pairs of slices of the Gaussian process realizations and bootstrap samples
+    """
+    num_gp_chunks = min(max(num_procs, 1), number_gp_realizations)
+    num_bootstrap_chunks = min(max(num_procs // num_gp_chunks, 1), number_bootstrap_samples)
+    return [
+        (gp_realizations, bootstrap_samples)
+        for gp_realizations in _split_contiguous(number_gp_realizations, num_gp_chunks)
+        for bootstrap_samples in _split_contiguous(number_bootstrap_samples, num_bootstrap_chunks)
+    ]
+
+
+def _split_contiguous(number, num_chunks):
+    """Split a range into contiguous chunks.
+
+    Args:
+        number (int): length of the range
+        num_chunks (int): number of chunks
+
+    Returns:
+        chunks (list): slices of the chunks
+    """
+    return [
+        slice(chunk[0], chunk[-1] + 1) for chunk in np.array_split(np.arange(number), num_chunks)
+    ]
+
 
 class SobolIndexEstimator:
     """Sobol Index Estimator class.
@@ -144,29 +282,20 @@ class SobolIndexEstimator:
             estimates (dict): dictionary of Sobol index estimates of different order
         """
         bootstrap_idx = self._draw_bootstrap_index()
-        cross_parameter_names = self.parameter_names.copy()
-
-        # start multiprocessing pool
-        pool = mp.get_context("spawn").Pool(num_procs)
-
-        for input_dim, parameter_name in enumerate(self.parameter_names):
-            # adapt index so that for second-order indices redundant indices are not calculated
-            # twice since S_ij == S_ji
-            cross_parameter_names.remove(parameter_name)
-            start_time = time.time()
-
-            # calculate estimates in parallel (either over realizations or bootstrapping samples)
-            estimate_function, input_list = self._setup_parallelization(
-                prediction, input_dim, bootstrap_idx
-            )
-            raw_output = pool.starmap(estimate_function, input_list)
+        start_time = time.time()
 
-            # sort raw output from parallel processes
-            self._sort_output(raw_output, parameter_name, cross_parameter_names)
+        # calculate estimates of all parameters in parallel over chunks of Gaussian process
+        # realizations and bootstrap samples
+        chunks = split_estimate_chunks(
+            self.number_gp_realizations, self.number_bootstrap_samples, num_procs
+        )
+        input_list = self._setup_parallelization(chunks)
+        raw_output = evaluate_estimates(prediction, bootstrap_idx, input_list, num_procs)
 
-            _logger.info("Time for parameter %s: %f", parameter_name, time.time() - start_time)
+        # sort raw output from parallel processes
+        self._sort_output(chunks, raw_output)
 
-        pool.close()
+        _logger.info("Time for Sobol index estimates: %f", time.time() - start_time)
 
         _logger.debug("First-order estimates: %s", self.estimates_first_order.values)
         _logger.debug("Total-order estimates: %s", self.estimates_total_order.values)
@@ -256,114 +385,46 @@ class SobolIndexEstimator:
 
         return estimates_first_order, estimates_second_order, estimates_total_order
 
-    def _setup_parallelization(self, prediction, input_dim, bootstrap_idx):
+    def _setup_parallelization(self, chunks):
         """Setup parallelization for calculation of estimates.
 
-        The parallelization scheme is chosen as follows:
-        - If we sample realizations of the GP, parallelize over those realizations.
-        - If we use the GP mean, parallelize over the bootstrap samples.
+        Every task estimates the indices of all parameters for a chunk of Gaussian process
+        realizations and bootstrap samples. The tasks only contain the chunks, the prediction and
+        bootstrap indices are shared by the worker pool.
 
         Args:
-            prediction (xr.DataArray): prediction
-            input_dim (int): input parameter
-            bootstrap_idx (ndarray): random index for bootstrapping
+            chunks (list): pairs of slices of the Gaussian process realizations and bootstrap
+                           samples
 
         Returns:
-            estimate_function (obj): function object for estimate calculation
-            input_list (list): list of input for estimate_function
+            input_list (list): list of input for *estimate_from_shared_prediction*
         """
-        if self.calculate_second_order:
-            if self.number_gp_realizations == 1:
-                estimate_function = calculate_indices_second_order_gp_mean
-                input_list = [
-                    (
-                        prediction.data.squeeze(),
-                        bootstrap_idx[b, :],
-                        input_dim,
-                        self.number_parameters,
-                        self.first_order_estimator,
-                    )
-                    for b in np.arange(int(self.number_bootstrap_samples))
-                ]
-            else:
-                estimate_function = calculate_indices_second_order_gp_realizations
-                input_list = [
-                    (
-                        prediction.loc[{"gp_realization": k}].data,
-                        bootstrap_idx,
-                        input_dim,
-                        self.number_bootstrap_samples,
-                        self.number_parameters,
-                        self.first_order_estimator,
-                    )
-                    for k in np.arange(self.number_gp_realizations)
-                ]
-        else:
-            estimate_function = calculate_indices_first_total_order
-            input_list = [
-                (
-                    prediction.loc[{"gp_realization": k}].data,
-                    bootstrap_idx,
-                    input_dim,
-                    self.number_bootstrap_samples,
-                    self.first_order_estimator,
-                )
-                for k in np.arange(self.number_gp_realizations)
-            ]
-
-        return estimate_function, input_list
+        input_list = [
+            (
+                calculate_indices,
+                gp_realizations,
+                bootstrap_samples,
+                self.number_parameters,
+                self.first_order_estimator,
+                self.calculate_second_order,
+            )
+            for gp_realizations, bootstrap_samples in chunks
+        ]
+        return input_list
 
-    def _sort_output(self, raw_output, parameter_name, cross_parameter_names):
+    def _sort_output(self, chunks, raw_output):
         """Sort raw output into DataArray.
 
         Args:
+            chunks (list): pairs of slices of the Gaussian process realizations and bootstrap
+                           samples
             raw_output (list): raw output data from parallel runs
-            parameter_name (str): parameter name
-            cross_parameter_names (list): cross-parameter names (for second-order indices)
         """
-        if self.calculate_second_order and self.number_gp_realizations == 1:
-            self._parallel_over_bootstrapping(raw_output, parameter_name, cross_parameter_names)
-        else:
-            self._parallel_over_realizations(raw_output, parameter_name, cross_parameter_names)
-
-    def _parallel_over_bootstrapping(self, raw_output, i, j):
-        """Output from parallelization over index b.
-
-        Args:
-            raw_output (list): raw output data from parallel runs
-            i (str): index for S_i, S_Ti
-            j (list): list of all index for S_ij (interactions with all other parameters)
-        """
-        for bootstrap_sample_id in np.arange(self.number_bootstrap_samples):
-            output_index = {"parameter": i, "gp_realization": 0, "bootstrap": bootstrap_sample_id}
-            self.estimates_first_order.loc[output_index] = raw_output[bootstrap_sample_id][0]
-            self.estimates_total_order.loc[output_index] = raw_output[bootstrap_sample_id][1]
-
-            if self.calculate_second_order:
-                output_index = {
-                    "parameter": i,
-                    "gp_realization": 0,
-                    "bootstrap": bootstrap_sample_id,
-                    "crossparameter": j,
-                }
-                self.estimates_second_order.loc[output_index] = raw_output[bootstrap_sample_id][2]
-
-    def _parallel_over_realizations(self, raw_output, i, j):
-        """Output from parallelization over index k.
-
-        Args:
-            raw_output (list): raw output data from parallel runs
-            i (str): index for S_i, S_Ti
-            j (list): list of all index for S_ij (interactions with all other parameters)
-        """
-        for k in np.arange(self.number_gp_realizations):
-            output_index = {"parameter": i, "gp_realization": k}
-            self.estimates_first_order.loc[output_index] = raw_output[k][0]
-            self.estimates_total_order.loc[output_index] = raw_output[k][1]
-
+        for chunk, (first_order, total_order, second_order) in zip(chunks, raw_output, strict=True):
+            self.estimates_first_order.values[chunk] = first_order
+            self.estimates_total_order.values[chunk] = total_order
             if self.calculate_second_order:
-                output_index = {"parameter": i, "gp_realization": k, "crossparameter": j}
-                self.estimates_second_order.loc[output_index] = raw_output[k][2]
+                self.estimates_second_order.values[chunk] = second_order
 
 
 class SobolIndexEstimatorThirdOrder(SobolIndexEstimator):
@@ -488,16 +549,16 @@ class SobolIndexEstimatorThirdOrder(SobolIndexEstimator):
         bootstrap_idx = self._draw_bootstrap_index()
 
         start_time = time.time()
-        # calculate estimates in parallel over Gaussian process realizations
-        estimate_function, input_list = self._setup_parallelization(prediction, 0, bootstrap_idx)
-
-        # start multiprocessing pool
-        pool = mp.get_context("spawn").Pool(num_procs)
-        raw_output = pool.starmap(estimate_function, input_list)
-        pool.close()
+        # calculate estimates in parallel over chunks of Gaussian process realizations and
+        # bootstrap samples
+        chunks = split_estimate_chunks(
+            self.number_gp_realizations, self.number_bootstrap_samples, num_procs
+        )
+        input_list = self._setup_parallelization(chunks)
+        raw_output = evaluate_estimates(prediction, bootstrap_idx, input_list, num_procs)
 
         # sort raw output from parallel processes
-        self._sort_output(raw_output, "", [])
+        self._sort_output(chunks, raw_output)
 
         _logger.info("Time for third-order indices: %f", time.time() - start_time)
 
@@ -533,38 +594,35 @@ class SobolIndexEstimatorThirdOrder(SobolIndexEstimator):
         )
         return estimates_third_order
 
-    def _setup_parallelization(self, prediction, input_dim, bootstrap_idx):
+    def _setup_parallelization(self, chunks):
         """Setup parallelization for calculation of estimates.
 
         Args:
-            prediction (xr.DataArray): prediction
-            input_dim (int): input parameter
-            bootstrap_idx (ndarray): random index for bootstrapping
+            chunks (list): pairs of slices of the Gaussian process realizations and bootstrap
+                           samples
 
         Returns:
-            estimate_function (obj): function object for estimate calculation
-            input_list (list): list of input for estimate_function
+            input_list (list): list of input for *estimate_from_shared_prediction*
         """
-        estimate_function = calculate_indices_third_order
         input_list = [
             (
-                prediction.loc[{"gp_realization": k}].data,
-                bootstrap_idx,
-                self.number_bootstrap_samples,
+                calculate_indices_third_order,
+                gp_realizations,
+                bootstrap_samples,
                 len(self.third_order_parameters),
                 self.first_order_estimator,
             )
-            for k in np.arange(self.number_gp_realizations)
+            for gp_realizations, bootstrap_samples in chunks
         ]
-        return estimate_function, input_list
+        return input_list
 
-    def _sort_output(self, raw_output, parameter_name, cross_parameter_names):
+    def _sort_output(self, chunks, raw_output):
         """Sort raw output into DataArray.
 
         Args:
+            chunks (list): pairs of slices of the Gaussian process realizations and bootstrap
+                           samples
             raw_output (list): raw output data from parallel runs
-            parameter_name (str): parameter name
-            cross_parameter_names (list): cross-parameter names (for second-order indices)
         """
-        for k in np.arange(self.number_gp_realizations):
-            self.estimates_third_order.loc[{"gp_realization": k}] = raw_output[k]
+        for chunk, third_order in zip(chunks, raw_output, strict=True):
+            self.estimates_third_order.values[chunk] = third_order
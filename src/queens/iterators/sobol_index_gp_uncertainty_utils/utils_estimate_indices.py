@@ -17,171 +17,93 @@
 All functions below are independent functions so that they can be used for parallel computations
 with multiprocessing.
 
+The estimates are vectorized over all bootstrap samples and, optionally, over stacked Gaussian
+process realizations. Predictions have the shape (..., monte_carlo, sample_matrix), where the
+leading dimensions enumerate Gaussian process realizations. The bootstrap indices have the shape
+(bootstrap, monte_carlo) or (monte_carlo,) for a single bootstrap sample. Only single sample
+matrices are bootstrapped at a time to keep the memory footprint low.
+
 Important: Do not use XArrays in parallel processes as they are very slow!
 """
 
 import numpy as np
 
 
-def bootstrap(prediction, bootstrap_indices):
-    """Bootstrap samples.
+def bootstrap(prediction, bootstrap_indices, sample_matrix):
+    """Bootstrap the results of a sample matrix.
 
     Args:
-        prediction (ndarray): realizations of Gaussian process
+        prediction (ndarray): realizations of Gaussian process (..., monte_carlo, sample_matrix)
         bootstrap_indices (ndarray): bootstrap indices
+        sample_matrix (int): index of the sample matrix
 
     Returns:
-        current_bootstrap_sample (ndarray): current bootstrap sample
+        bootstrap_samples (ndarray): bootstrap samples of the sample matrix with the Monte-Carlo
+                                     samples along the last axis
     """
-    current_bootstrap_sample = prediction[bootstrap_indices]
-    return current_bootstrap_sample
-
-
-def calculate_indices_first_total_order(
-    prediction, bootstrap_idx, input_dim, number_bootstrap_samples, first_order_estimator
-):
-    """Estimate first and total-order Sobol indices.
-
-    Args:
-        prediction (ndarray): realizations of Gaussian process
-        bootstrap_idx (ndarray): bootstrap indices
-        input_dim (int): input-parameter index
-        number_bootstrap_samples (int): number of bootstrap samples
-        first_order_estimator (str): estimator for first-order indices
+    bootstrap_samples = np.take(prediction[..., sample_matrix], bootstrap_indices, axis=-1)
+    return bootstrap_samples
 
-    Returns:
-        estimates_first_order (ndarray): estimates of first-order Sobol index
-        estimates_total_order (ndarray): estimates of total-order Sobol index
-    """
-    estimates_first_order = np.empty(number_bootstrap_samples)
-    estimates_total_order = np.empty(number_bootstrap_samples)
-
-    bootstrap_samples = bootstrap(prediction, bootstrap_idx)
-    for idx_bootstrap in np.arange(number_bootstrap_samples):
-        current_bootstrap_sample = bootstrap_samples[idx_bootstrap, :]
-        sample_matrix_a, sample_matrix_b, sample_matrix_ab = _extract_sample_matrices(
-            current_bootstrap_sample, input_dim
-        )
-        estimates_first_order[idx_bootstrap] = _estimate_first_order_index(
-            sample_matrix_a, sample_matrix_b, sample_matrix_ab, first_order_estimator
-        )
-        estimates_total_order[idx_bootstrap] = _estimate_total_order_index(
-            sample_matrix_a, sample_matrix_b, sample_matrix_ab
-        )
 
-    return estimates_first_order, estimates_total_order
-
-
-def calculate_indices_second_order_gp_realizations(
+def calculate_indices(
     prediction,
     bootstrap_indices,
-    input_dim_i,
-    number_bootstrap_samples,
     number_parameters,
     first_order_estimator,
+    calculate_second_order=False,
 ):
-    """Estimate first, second and total-order Sobol indices.
-
-    Based on Gaussian process realizations and parallelized over those realizations.
+    """Estimate first, total and optionally second-order Sobol indices of all parameters.
 
     Args:
         prediction (ndarray): realizations of Gaussian process
         bootstrap_indices (ndarray): bootstrap indices
-        input_dim_i (int): input-parameter index
-        number_bootstrap_samples (int): number of bootstrap samples
         number_parameters (int): number of input-space dimensions
         first_order_estimator (str): estimator for first-order indices
+        calculate_second_order (bool, opt): true if second-order indices are calculated
 
     Returns:
-        estimates_first_order (ndarray): estimates of first-order Sobol index
-        estimates_second_order (ndarray): estimates of second-order Sobol index
-        estimates_total_order (ndarray): estimates of total-order Sobol index
+        estimates_first_order (ndarray): estimates of first-order Sobol indices
+                                         (..., bootstrap, parameter)
+        estimates_total_order (ndarray): estimates of total-order Sobol indices
+                                         (..., bootstrap, parameter)
+        estimates_second_order (ndarray): estimates of second-order Sobol indices
+                                          (..., bootstrap, parameter, crossparameter) with NaN
+                                          for redundant entries, or *None*
     """
-    estimates_first_order, estimates_total_order = calculate_indices_first_total_order(
-        prediction, bootstrap_indices, input_dim_i, number_bootstrap_samples, first_order_estimator
-    )
+    sample_matrix_a, sample_matrix_b = _extract_sample_matrices(prediction, bootstrap_indices)
+    variance = _total_variance(sample_matrix_a, sample_matrix_b)
 
-    estimates_second_order = np.empty(
-        (number_bootstrap_samples, number_parameters - (input_dim_i + 1))
-    )
-    bootstrap_samples = bootstrap(prediction, bootstrap_indices)
-    for b in np.arange(number_bootstrap_samples):
-        current_bootstrap_sample = bootstrap_samples[b, :]
-        idx_loop = 0
-        for input_dim_j in range(input_dim_i + 1, number_parameters):
-            (
+    estimates_first_order = []
+    estimates_total_order = []
+    for i in range(number_parameters):
+        sample_matrix_ab_i = bootstrap(prediction, bootstrap_indices, i)
+        estimates_first_order.append(
+            _estimate_first_order_index(
                 sample_matrix_a,
                 sample_matrix_b,
                 sample_matrix_ab_i,
-                sample_matrix_ab_j,
-                sample_matrix_ba_i,
-            ) = _extract_sample_matrices_second_order(
-                current_bootstrap_sample, input_dim_i, input_dim_j, number_parameters
-            )
-            estimates_second_order[b, idx_loop] = _estimate_second_order_index(
-                sample_matrix_a,
-                sample_matrix_ab_i,
-                sample_matrix_ab_j,
-                sample_matrix_ba_i,
-                sample_matrix_b,
                 first_order_estimator,
+                variance,
+            )
+        )
+        estimates_total_order.append(
+            _estimate_total_order_index(
+                sample_matrix_a, sample_matrix_b, sample_matrix_ab_i, variance
             )
-            idx_loop += 1
-
-    return estimates_first_order, estimates_total_order, estimates_second_order
-
-
-def calculate_indices_second_order_gp_mean(
-    prediction, bootstrap_indices, input_dim_i, number_parameters, first_order_estimator
-):
-    """Estimate first, second and total-order Sobol indices.
-
-    Based on Gaussian process mean and parallelized over bootstrapping samples.
-
-    Args:
-        prediction (ndarray): prediction
-        bootstrap_indices (ndarray): bootstrap indices
-        input_dim_i (int): input-parameter index
-        number_parameters (int): number of input-space dimensions
-        first_order_estimator (str): estimator for first-order indices
-
-    Returns:
-        estimates_first_order (ndarray): estimates of first-order Sobol index
-        estimates_second_order (ndarray): estimates of second-order Sobol index
-        estimates_total_order (ndarray): estimates of total-order Sobol index
-    """
-    bootstrap_sample = bootstrap(prediction, bootstrap_indices)
-    sample_matrix_a, sample_matrix_b, sample_matrix_ab = _extract_sample_matrices(
-        bootstrap_sample, input_dim_i
-    )
-    estimates_first_order = _estimate_first_order_index(
-        sample_matrix_a, sample_matrix_b, sample_matrix_ab, first_order_estimator
-    )
-    estimates_total_order = _estimate_total_order_index(
-        sample_matrix_a, sample_matrix_b, sample_matrix_ab
-    )
-
-    estimates_second_order = np.empty(number_parameters - (input_dim_i + 1))
-    idx_loop = 0
-    for input_dim_j in range(input_dim_i + 1, number_parameters):
-        (
-            sample_matrix_a,
-            sample_matrix_b,
-            sample_matrix_ab_i,
-            sample_matrix_ab_j,
-            sample_matrix_ba_i,
-        ) = _extract_sample_matrices_second_order(
-            bootstrap_sample, input_dim_i, input_dim_j, number_parameters
         )
-        estimates_second_order[idx_loop] = _estimate_second_order_index(
+    estimates_first_order = np.stack(estimates_first_order, axis=-1)
+    estimates_total_order = np.stack(estimates_total_order, axis=-1)
+
+    estimates_second_order = None
+    if calculate_second_order:
+        estimates_second_order = _calculate_indices_second_order(
+            prediction,
+            bootstrap_indices,
             sample_matrix_a,
-            sample_matrix_ab_i,
-            sample_matrix_ab_j,
-            sample_matrix_ba_i,
             sample_matrix_b,
-            first_order_estimator,
+            estimates_first_order,
+            variance,
         )
-        idx_loop += 1
 
     return estimates_first_order, estimates_total_order, estimates_second_order
 
@@ -189,163 +111,109 @@ def calculate_indices_second_order_gp_mean(
 def calculate_indices_third_order(
     prediction,
     bootstrap_indices,
-    number_boostrap_samples,
     number_parameters,
     first_order_estimator,
 ):
     """Estimate third-order Sobol indices.
 
-    Based on Gaussian process realizations and parallelized over those realizations.
-
     Args:
         prediction (ndarray): realizations of Gaussian process
         bootstrap_indices (ndarray): bootstrap indices
-        number_boostrap_samples (int): number of bootstrap samples
         number_parameters (int): number of input-space dimensions
         first_order_estimator (str): estimator for first-order indices
 
     Returns:
-        estimates_third_order (ndarray): estimates for third-order Sobol index
+        estimates_third_order (ndarray): estimates for third-order Sobol index (..., bootstrap)
     """
-    # 1. Estimate first-order Sobol indices
-    estimates_first_order = np.empty((number_boostrap_samples, number_parameters))
-    estimates_total_order = np.empty((number_boostrap_samples, number_parameters))
-    for i in range(number_parameters):
-        (
-            estimates_first_order[:, i],
-            estimates_total_order[:, i],
-        ) = calculate_indices_first_total_order(
-            prediction, bootstrap_indices, i, number_boostrap_samples, first_order_estimator
-        )
+    # 1. Estimate first and second-order Sobol indices
+    estimates_first_order, _, estimates_second_order = calculate_indices(
+        prediction,
+        bootstrap_indices,
+        number_parameters,
+        first_order_estimator,
+        calculate_second_order=True,
+    )
 
-    # 2. Estimate second-order Sobol indices
-    estimates_second_order = np.empty((number_boostrap_samples, number_parameters))
-    bootstrap_samples = bootstrap(prediction, bootstrap_indices)
-    for b in np.arange(number_boostrap_samples):
-        current_bootstrap_sample = bootstrap_samples[b, :]
-        idx_loop = 0
-        for idx_i, i in enumerate(range(number_parameters)):
-            for j in range(idx_i + 1, number_parameters):
-                (
-                    sample_matrix_a,
-                    sample_matrix_b,
-                    sample_matrix_ab_i,
-                    sample_matrix_ab_j,
-                    sample_matrix_ba_i,
-                ) = _extract_sample_matrices_second_order(
-                    current_bootstrap_sample, i, j, number_parameters
-                )
-                estimates_second_order[b, idx_loop] = _estimate_second_order_index(
-                    sample_matrix_a,
-                    sample_matrix_ab_i,
-                    sample_matrix_ab_j,
-                    sample_matrix_ba_i,
-                    sample_matrix_b,
-                    first_order_estimator,
-                )
-                idx_loop += 1
-
-    # 3. Estimate closed third-order Sobol indices (includes lower order indices)
-    closed_estimates_third_order = np.empty((number_boostrap_samples, 1))
-    for b in np.arange(number_boostrap_samples):
-        current_bootstrap_sample = bootstrap_samples[b, :]
-        (
-            sample_matrix_a,
-            sample_matrix_b,
-            sample_matrix_ab_ijk,
-        ) = _extract_sample_matrices_third_order(current_bootstrap_sample)
-        closed_estimates_third_order[b, 0] = _estimate_closed_third_order_index(
-            sample_matrix_b, sample_matrix_ab_ijk
-        )
+    # 2. Estimate closed third-order Sobol indices (includes lower order indices)
+    sample_matrix_b = bootstrap(prediction, bootstrap_indices, -1)
+    sample_matrix_ab_ijk = bootstrap(prediction, bootstrap_indices, -3)
+    closed_estimates_third_order = _estimate_closed_third_order_index(
+        sample_matrix_b, sample_matrix_ab_ijk
+    )
 
-    # 4. Subtract lower order indices
+    # 3. Subtract lower order indices
     estimates_third_order = (
-        closed_estimates_third_order.flatten()
-        - estimates_second_order.sum(axis=1)
-        - estimates_first_order.sum(axis=1)
+        closed_estimates_third_order
+        - np.nansum(estimates_second_order, axis=(-2, -1))
+        - estimates_first_order.sum(axis=-1)
     )
 
     return estimates_third_order
 
 
-def _extract_sample_matrices(prediction, i):
-    """Extract sampling matrices A, B, AB from Gaussian process prediction.
-
-    Format:
-        [AB_1, AB_2, ..., AB_D, BA_1, ..., BA_D, A, B]
-
-    Args:
-        prediction (ndarray): realizations of Gaussian process
-        i (int): index to calculate
-
-    Returns:
-        sample_matrix_a (ndarray): Saltelli A sample matrix
-        sample_matrix_b (ndarray): Saltelli B sample matrix
-        sample_matrix_ab (ndarray): Saltelli AB sample matrix
-    """
-    sample_matrix_ab = prediction[:, i]
-    sample_matrix_a = prediction[:, -2]
-    sample_matrix_b = prediction[:, -1]
-
-    return sample_matrix_a, sample_matrix_b, sample_matrix_ab
-
-
-def _extract_sample_matrices_second_order(prediction, i, j, number_parameters):
-    """Extract sampling matrices A, B, AB from Gaussian process prediction.
-
-    Format:
-        [AB_1, AB_2, ..., AB_D, BA_1, ..., BA_D, A, B]
+def _calculate_indices_second_order(
+    prediction,
+    bootstrap_indices,
+    sample_matrix_a,
+    sample_matrix_b,
+    estimates_first_order,
+    variance,
+):
+    """Estimate second-order Sobol indices of all parameter combinations.
 
     Args:
         prediction (ndarray): realizations of Gaussian process
-        i (int): index to calculate
-        j (int): index to calculate
-        number_parameters (int): number of input space dimensions
+        bootstrap_indices (ndarray): bootstrap indices
+        sample_matrix_a (ndarray): bootstrapped results corresponding to A sample matrix
+        sample_matrix_b (ndarray): bootstrapped results corresponding to B sample matrix
+        estimates_first_order (ndarray): estimates of first-order Sobol indices
+        variance (ndarray): variance estimate
 
     Returns:
-        sample_matrix_a (ndarray): Saltelli A sample matrix
-        sample_matrix_b (ndarray): Saltelli B sample matrix
-        sample_matrix_ab_i (ndarray): Saltelli ABi sample matrix
-        sample_matrix_ab_j (ndarray): Saltelli ABj sample matrix
-        sample_matrix_ba_i (ndarray): Saltelli BAi sample matrix
+        estimates_second_order (ndarray): estimates of second-order Sobol indices
+                                          (..., bootstrap, parameter, crossparameter) with NaN
+                                          for redundant entries
     """
-    sample_matrix_ab_i = prediction[:, i]
-    sample_matrix_ab_j = prediction[:, j]
-    sample_matrix_ba_i = prediction[:, number_parameters + i]
-    sample_matrix_a = prediction[:, -2]
-    sample_matrix_b = prediction[:, -1]
-
-    return (
-        sample_matrix_a,
-        sample_matrix_b,
-        sample_matrix_ab_i,
-        sample_matrix_ab_j,
-        sample_matrix_ba_i,
-    )
+    number_parameters = estimates_first_order.shape[-1]
+    estimates_second_order = np.full(estimates_first_order.shape + (number_parameters,), np.nan)
+    for i in range(number_parameters):
+        sample_matrix_ba_i = bootstrap(prediction, bootstrap_indices, number_parameters + i)
+        for j in range(i + 1, number_parameters):
+            estimates_second_order[..., i, j] = _estimate_second_order_index(
+                sample_matrix_a,
+                bootstrap(prediction, bootstrap_indices, j),
+                sample_matrix_ba_i,
+                sample_matrix_b,
+                estimates_first_order[..., i],
+                estimates_first_order[..., j],
+                variance,
+            )
+    return estimates_second_order
 
 
-def _extract_sample_matrices_third_order(prediction):
-    """Extract sampling matrices A, B, AB from Gaussian process prediction.
+def _extract_sample_matrices(prediction, bootstrap_indices):
+    """Extract the bootstrapped A and B sample matrices from Gaussian process prediction.
 
     Format:
-        [AB_1, AB_2, ..., AB_D, BA_1, ..., BA_D, AB_123, A, B]
+        [AB_1, AB_2, ..., AB_D, BA_1, ..., BA_D, (AB_123,) A, B]
 
     Args:
         prediction (ndarray): realizations of Gaussian process
+        bootstrap_indices (ndarray): bootstrap indices
 
     Returns:
         sample_matrix_a (ndarray): Saltelli A sample matrix
         sample_matrix_b (ndarray): Saltelli B sample matrix
-        sample_matrix_ab_ijk (ndarray): Saltelli AB_ijk sample matrix
     """
-    sample_matrix_ab_ijk = prediction[:, -3]
-    sample_matrix_a = prediction[:, -2]
-    sample_matrix_b = prediction[:, -1]
+    sample_matrix_a = bootstrap(prediction, bootstrap_indices, -2)
+    sample_matrix_b = bootstrap(prediction, bootstrap_indices, -1)
 
-    return sample_matrix_a, sample_matrix_b, sample_matrix_ab_ijk
+    return sample_matrix_a, sample_matrix_b
 
 
-def _estimate_first_order_index(sample_matrix_a, sample_matrix_b, sample_matrix_ab, estimator):
+def _estimate_first_order_index(
+    sample_matrix_a, sample_matrix_b, sample_matrix_ab, estimator, variance=None
+):
     """Compute first-order Sobol indices.
 
     References for estimators:
@@ -367,6 +235,7 @@ def _estimate_first_order_index(sample_matrix_a, sample_matrix_b, sample_matrix_
         sample_matrix_b (ndarray): results corresponding B sample matrix
         sample_matrix_ab (ndarray): results corresponding to AB sample matrix
         estimator (str): estimator for first-order indices
+        variance (ndarray, opt): precomputed variance estimate (used by Saltelli2010)
 
     Returns:
         first_order (ndarray): first-order Sobol index estimates
@@ -374,35 +243,39 @@ def _estimate_first_order_index(sample_matrix_a, sample_matrix_b, sample_matrix_
     if estimator == "Janon2014":
         # [Janon2014] Equation (2.5)
         first_order = (
-            np.mean(sample_matrix_b * sample_matrix_ab)
-            - (0.5 * np.mean(sample_matrix_b + sample_matrix_ab)) ** 2
+            np.mean(sample_matrix_b * sample_matrix_ab, axis=-1)
+            - (0.5 * np.mean(sample_matrix_b + sample_matrix_ab, axis=-1)) ** 2
         ) / (
-            np.mean(sample_matrix_b * sample_matrix_b)
-            - (0.5 * np.mean(sample_matrix_b + sample_matrix_ab)) ** 2
+            np.mean(sample_matrix_b * sample_matrix_b, axis=-1)
+            - (0.5 * np.mean(sample_matrix_b + sample_matrix_ab, axis=-1)) ** 2
         )
 
     elif estimator == "Janon2014alt":
         # [Janon2014] Equation (2.8)
-        first_order = np.sum(
-            (sample_matrix_b - 0.5 * (sample_matrix_b.mean() + sample_matrix_ab.mean()))
-            * (sample_matrix_ab - 0.5 * (sample_matrix_b.mean() + sample_matrix_ab.mean()))
-        ) / np.sum(
-            0.5 * (sample_matrix_b**2 + sample_matrix_ab**2)
-            - (0.5 * (sample_matrix_b.mean() + sample_matrix_ab.mean())) ** 2
+        mean = 0.5 * (
+            sample_matrix_b.mean(axis=-1, keepdims=True)
+            + sample_matrix_ab.mean(axis=-1, keepdims=True)
         )
+        first_order = np.sum(
+            (sample_matrix_b - mean) * (sample_matrix_ab - mean), axis=-1
+        ) / np.sum(0.5 * (sample_matrix_b**2 + sample_matrix_ab**2) - mean**2, axis=-1)
 
     elif estimator == "Gratiet2014":
         # [Gratiet2014] Equation (4.1)
         first_order = (
-            np.mean(sample_matrix_b * sample_matrix_ab)
-            - sample_matrix_b.mean() * sample_matrix_ab.mean()
-        ) / (np.mean(sample_matrix_b * sample_matrix_b) - sample_matrix_b.mean() ** 2)
+            np.mean(sample_matrix_b * sample_matrix_ab, axis=-1)
+            - sample_matrix_b.mean(axis=-1) * sample_matrix_ab.mean(axis=-1)
+        ) / (
+            np.mean(sample_matrix_b * sample_matrix_b, axis=-1) - sample_matrix_b.mean(axis=-1) ** 2
+        )
 
     elif estimator == "Saltelli2010":
         # [Saltelli2010] also used in SALib library
-        first_order = np.mean(
-            sample_matrix_b * (sample_matrix_ab - sample_matrix_a), axis=0
-        ) / np.var(np.r_[sample_matrix_a, sample_matrix_b], axis=0)
+        if variance is None:
+            variance = _total_variance(sample_matrix_a, sample_matrix_b)
+        first_order = (
+            np.mean(sample_matrix_b * (sample_matrix_ab - sample_matrix_a), axis=-1) / variance
+        )
 
     else:
         raise ValueError(
@@ -413,7 +286,7 @@ def _estimate_first_order_index(sample_matrix_a, sample_matrix_b, sample_matrix_
     return first_order
 
 
-def _estimate_total_order_index(sample_matrix_a, sample_matrix_b, sample_matrix_ab):
+def _estimate_total_order_index(sample_matrix_a, sample_matrix_b, sample_matrix_ab, variance=None):
     """Estimate total-order Sobol indices.
 
     Reference:
@@ -425,27 +298,27 @@ def _estimate_total_order_index(sample_matrix_a, sample_matrix_b, sample_matrix_
         sample_matrix_a (ndarray): results corresponding to A sample matrix
         sample_matrix_b (ndarray): results corresponding to B sample matrix
         sample_matrix_ab (ndarray): results corresponding to AB sample matrix
+        variance (ndarray, opt): precomputed variance estimate
 
     Returns:
         total_order (ndarray): total-order Sobol index estimates
     """
+    if variance is None:
+        variance = _total_variance(sample_matrix_a, sample_matrix_b)
     # from SALib library [Saltelli2010]
-    total_order = (
-        0.5
-        * np.mean((sample_matrix_a - sample_matrix_ab) ** 2, axis=0)
-        / np.var(np.r_[sample_matrix_a, sample_matrix_b], axis=0)
-    )
+    total_order = 0.5 * np.mean((sample_matrix_a - sample_matrix_ab) ** 2, axis=-1) / variance
 
     return total_order
 
 
 def _estimate_second_order_index(
     sample_matrix_a,
-    sample_matrix_ab_j,
     sample_matrix_ab_k,
     sample_matrix_ba_j,
     sample_matrix_b,
-    first_order_estimator,
+    first_order_index_j,
+    first_order_index_k,
+    variance,
 ):
     """Estimate second-order Sobol indices.
 
@@ -455,24 +328,22 @@ def _estimate_second_order_index(
 
     Args:
         sample_matrix_a (ndarray): results corresponding to A sample matrix
-        sample_matrix_ab_j (ndarray): results corresponding to AB sample matrix
         sample_matrix_ab_k (ndarray): results corresponding to AB sample matrix
         sample_matrix_ba_j (ndarray): results corresponding to BA sample matrix
         sample_matrix_b (ndarray): results corresponding to B sample matrix
-        first_order_estimator (str): estimator for first-order indices
+        first_order_index_j (ndarray): first-order Sobol index estimates of parameter j
+        first_order_index_k (ndarray): first-order Sobol index estimates of parameter k
+        variance (ndarray): variance estimate
 
     Returns:
         second_order (ndarray): second-order Sobol index estimates
     """
     # from SALib library [Saltelli2010]
-    total_second_order_effect_jk = np.mean(
-        sample_matrix_ba_j * sample_matrix_ab_k - sample_matrix_a * sample_matrix_b, axis=0
-    ) / np.var(np.r_[sample_matrix_a, sample_matrix_b], axis=0)
-    first_order_index_j = _estimate_first_order_index(
-        sample_matrix_a, sample_matrix_b, sample_matrix_ab_j, first_order_estimator
-    )
-    first_order_index_k = _estimate_first_order_index(
-        sample_matrix_a, sample_matrix_b, sample_matrix_ab_k, first_order_estimator
+    total_second_order_effect_jk = (
+        np.mean(
+            sample_matrix_ba_j * sample_matrix_ab_k - sample_matrix_a * sample_matrix_b, axis=-1
+        )
+        / variance
     )
     second_order = total_second_order_effect_jk - first_order_index_j - first_order_index_k
 
@@ -497,8 +368,22 @@ def _estimate_closed_third_order_index(sample_matrix_b, sample_matrix_ab_ijk):
         second_order (ndarray): second-order Sobol index estimates
     """
     closed_third_order = (
-        np.mean(sample_matrix_b * sample_matrix_ab_ijk)
-        - sample_matrix_b.mean() * sample_matrix_ab_ijk.mean()
-    ) / (np.mean(sample_matrix_b * sample_matrix_b) - sample_matrix_b.mean() ** 2)
+        np.mean(sample_matrix_b * sample_matrix_ab_ijk, axis=-1)
+        - sample_matrix_b.mean(axis=-1) * sample_matrix_ab_ijk.mean(axis=-1)
+    ) / (np.mean(sample_matrix_b * sample_matrix_b, axis=-1) - sample_matrix_b.mean(axis=-1) ** 2)
 
     return closed_third_order
+
+
+def _total_variance(sample_matrix_a, sample_matrix_b):
+    """Estimate the output variance from the A and B sample matrices.
+
+    Args:
+        sample_matrix_a (ndarray): results corresponding to A sample matrix
+        sample_matrix_b (ndarray): results corresponding to B sample matrix
+
+    Returns:
+        variance (ndarray): variance estimate
+    """
+    variance = np.var(np.concatenate((sample_matrix_a, sample_matrix_b), axis=-1), axis=-1)
+    return variance
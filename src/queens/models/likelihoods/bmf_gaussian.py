@@ -18,6 +18,7 @@ import copy
 import logging
 import multiprocessing as mp
 import time
+from contextlib import contextmanager
 from multiprocessing import get_context
 
 import numpy as np
@@ -247,24 +248,13 @@ class BMFGaussian(Likelihood):
             m_f_mat.shape[1], np.atleast_2d(self.y_obs).shape[1]
         ), "Column dimension of the probab. regression output and y_obs do not agree!"
 
-        # here we iterate over samples meaning we
-        # iterate here over all surrogates simultaneously such that
-        # the new m is a vector of all e.g. first entries in all surrogates
-        log_lik_mf_lst = []
-        grad_log_lik_lst = []
-        for m_f_vec, variance_vec, grad_m_f, grad_var_y in zip(
-            m_f_mat, var_y_mat, grad_m_f_mat, grad_var_y_mat, strict=True
-        ):
-            self.normal_distribution.update_variance(
-                variance_vec.flatten() + self.noise_var.flatten()
-            )
-            log_lik_mf_lst.append(self.normal_distribution.logpdf(m_f_vec.reshape(1, -1)))
-            grad_log_lik_lst.append(
-                self.grad_log_pdf_d_ylf(m_f_vec, grad_m_f, grad_var_y).flatten()
-            )
-
-        log_lik_mf_output = np.array(log_lik_mf_lst).reshape(-1, 1)
-        grad_out = np.array(grad_log_lik_lst)
+        # evaluate all samples and surrogates at once, as the mean-field normal is diagonal
+        log_lik_mf_output, d_log_lik_d_m_f, d_log_lik_d_var = self.log_likelihood_and_partials(
+            m_f_mat, var_y_mat
+        )
+        grad_out = d_log_lik_d_m_f * grad_m_f_mat.reshape(
+            m_f_mat.shape
+        ) + d_log_lik_d_var * grad_var_y_mat.reshape(m_f_mat.shape)
 
         if self.min_log_lik_mf is None:
             self.min_log_lik_mf = np.min(log_lik_mf_output)
@@ -329,46 +319,56 @@ class BMFGaussian(Likelihood):
             m_f_mat.shape[1], np.atleast_2d(self.y_obs).shape[1]
         ), "Column dimension of the probab. regression output and y_obs do not agree! Abort..."
 
-        # iterate here over all surrogates simultaneously such that the
-        # new m is a vector of all, e.g., first entries in all surrogates
-        log_lik_mf_lst = []
-        for m_f_vec, variance_vec in zip(m_f_mat, var_y_mat, strict=True):
-            self.normal_distribution.update_variance(
-                variance_vec.flatten() + self.noise_var.flatten()
-            )
-            log_lik_mf_lst.append(self.normal_distribution.logpdf(m_f_vec.reshape(1, -1)))
-        log_lik_mf_output = np.array(log_lik_mf_lst).reshape(-1)
+        # evaluate all samples and surrogates at once, as the mean-field normal is diagonal
+        log_lik_mf_output, _, _ = self.log_likelihood_and_partials(
+            m_f_mat, var_y_mat, compute_partials=False
+        )
 
         if self.min_log_lik_mf is None:
             self.min_log_lik_mf = np.min(log_lik_mf_output)
 
         return log_lik_mf_output
 
-    def grad_log_pdf_d_ylf(self, m_f_vec, grad_m_f_dy, grad_var_y_dy):
-        """Calculate the gradient of the logpdf w.r.t. to the LF model output.
+    def log_likelihood_and_partials(self, m_f_mat, var_y_mat, compute_partials=True):
+        """Evaluate the multi-fidelity log-likelihood for a batch of samples.
 
-        The gradient is calculated from the individual partial derivatives
-        and then composed in this method.
+        The mean-field normal distribution is diagonal, such that the log-likelihood and its
+        partial derivatives w.r.t. the mean and variance of the probabilistic regression model
+        can be evaluated for all samples and coordinates in one array expression.
 
         Args:
-            m_f_vec (np.array): mean vector of the probabilistic surrogate evaluated at sample
-                                points
-            grad_m_f_dy (np.array): gradient of the mean function/vector of the probabilistic
-                                 regression model w.r.t. the regression model's input
-            grad_var_y_dy (np.array): gradient of the variance function/vector of the probabilistic
-                                   regression model w.r.t. the regression model's input
+            m_f_mat (np.array): Mean predictions of the probabilistic regression model. Rows
+                                correspond to samples, columns to coordinates.
+            var_y_mat (np.array): Variance predictions of the probabilistic regression model.
+                                  Same layout as *m_f_mat*.
+            compute_partials (bool, optional): Whether to compute the partial derivatives.
+                                               Defaults to True.
 
         Returns:
-            d_log_lik_d_z (np.array): gradient of the logpdf w.r.t. y_lf
+            log_lik_mf (np.array): Vector of log-likelihood values per sample
+            d_log_lik_d_m_f (np.array): Partial derivative of the log-likelihood w.r.t. the
+                                        mean prediction (None if not computed)
+            d_log_lik_d_var (np.array): Partial derivative of the log-likelihood w.r.t. the
+                                        variance prediction (None if not computed)
         """
-        d_log_lik_d_m_f = self.normal_distribution.grad_logpdf(m_f_vec).reshape(1, -1)
-        d_log_lik_d_var = self.normal_distribution.grad_logpdf_var(m_f_vec).reshape(1, -1)
+        m_f_mat = np.atleast_2d(m_f_mat)
+        variance_mat = var_y_mat.reshape(m_f_mat.shape) + self.noise_var.flatten()
+        residual_mat = m_f_mat - self.normal_distribution.mean
+        weighted_residual_mat = residual_mat / variance_mat
+
+        log_lik_mf = (
+            -0.5 * self.normal_distribution.dimension * np.log(2 * np.pi)
+            - 0.5 * np.sum(np.log(variance_mat), axis=1)
+            - 0.5 * np.sum(weighted_residual_mat * residual_mat, axis=1)
+        )
 
-        d_log_lik_d_y = d_log_lik_d_m_f * grad_m_f_dy.reshape(
-            1, -1
-        ) + d_log_lik_d_var * grad_var_y_dy.reshape(1, -1)
+        if not compute_partials:
+            return log_lik_mf, None, None
 
-        return d_log_lik_d_y
+        d_log_lik_d_m_f = -weighted_residual_mat
+        d_log_lik_d_var = 0.5 * (weighted_residual_mat**2 - 1 / variance_mat)
+
+        return log_lik_mf, d_log_lik_d_m_f, d_log_lik_d_var
 
     @staticmethod
     def initialize_bmfia_iterator(coords_mat, time_vec, y_obs, bmfia_subiterator):
@@ -437,6 +437,7 @@ class BmfiaInterface:
     Attributes:
         num_processors_multi_processing (int): Number of processors that should be used in the
                                                multi-processing pool.
+        seed (int): Base seed for the training of the probabilistic mappings
         evaluate_method (method): Configured method to evaluate the probabilistic mapping
         evaluate_and_gradient_method (method): Configured method to evaluate the probabilistic
                                                 mapping and its gradient
@@ -916,6 +917,7 @@ class BmfiaInterface:
         self,
         num_processors_multi_processing=1,
         probabilistic_mapping_type="per_coordinate",
+        seed=None,
     ):
         """Instantiate a BMFIA interface.
 
@@ -924,6 +926,10 @@ class BmfiaInterface:
                                                    multi-processing pool.
             probabilistic_mapping_type (str): Configured method to instantiate the  probabilistic
                                               mapping objects
+            seed (int, optional): Base seed for the training of the probabilistic mappings. The
+                                  i-th mapping is trained with seed *seed + i*, such that the
+                                  result does not depend on the number of processors. Defaults
+                                  to None (no seeding).
         """
         # instantiate probabilistic mapping objects
         (
@@ -937,6 +943,7 @@ class BmfiaInterface:
 
         self.instantiate_probabilistic_mappings = instantiate_probabilistic_mappings
         self.num_processors_multi_processing = num_processors_multi_processing
+        self.seed = seed
         self.probabilistic_mapping_obj_lst = []
         self.evaluate_method = evaluate_method
         self.evaluate_and_gradient_method = evaluate_and_gradient_method
@@ -1085,7 +1092,10 @@ class BmfiaInterface:
             # Conduct training of probabilistic mappings in parallel
             num_coords = z_lf_train.T.shape[2]
             optimized_mapping_states_lst = BmfiaInterface.train_probabilistic_mappings_in_parallel(
-                num_coords, self.num_processors_multi_processing, self.probabilistic_mapping_obj_lst
+                num_coords,
+                self.num_processors_multi_processing,
+                self.probabilistic_mapping_obj_lst,
+                seeds=self.training_seeds(),
             )
             # Set the optimized hyper-parameters for probabilistic regression model
             self.set_optimized_state_of_probabilistic_mappings(optimized_mapping_states_lst)
@@ -1098,9 +1108,12 @@ class BmfiaInterface:
         t_s = time.time()
 
         num_map = len(self.probabilistic_mapping_obj_lst)
-        for num, probabilistic_model in enumerate(self.probabilistic_mapping_obj_lst):
+        for num, (probabilistic_model, seed) in enumerate(
+            zip(self.probabilistic_mapping_obj_lst, self.training_seeds(), strict=True)
+        ):
             _logger.info("Starting training of probabilistic mapping %d of %d...", num + 1, num_map)
-            probabilistic_model.train()
+            with BmfiaInterface.seeded_global_rng(seed):
+                probabilistic_model.train()
             _logger.info(
                 "Finished training of probabilistic mapping '%d' of '%d'!\n",
                 num + 1,
@@ -1111,9 +1124,20 @@ class BmfiaInterface:
         t_total = t_e - t_s
         _logger.info("Total time for training of all probabilistic mappings: %d s", t_total)
 
+    def training_seeds(self):
+        """Get the seeds for the training of the probabilistic mappings.
+
+        Returns:
+            seeds (lst): Seed per probabilistic mapping (None if no seed is configured)
+        """
+        num_mappings = len(self.probabilistic_mapping_obj_lst)
+        if self.seed is None:
+            return [None] * num_mappings
+        return [self.seed + num for num in range(num_mappings)]
+
     @staticmethod
     def train_probabilistic_mappings_in_parallel(
-        num_coords, num_processors_multi_processing, probabilistic_mapping_obj_lst
+        num_coords, num_processors_multi_processing, probabilistic_mapping_obj_lst, seeds=None
     ):
         """Train the probabilistic regression models in parallel.
 
@@ -1125,6 +1149,7 @@ class BmfiaInterface:
             num_processors_multi_processing (int): number of processors to use for
                                                     the multi-processing pool
             probabilistic_mapping_obj_lst (list): List of probabilistic mapping objects
+            seeds (list, optional): Seed per probabilistic mapping for the training
 
         Returns:
             optimized_mapping_states_lst (lst): List of updated / trained states for
@@ -1160,12 +1185,18 @@ class BmfiaInterface:
             num_processors_for_job,
         )
 
+        if seeds is None:
+            seeds = [None] * len(probabilistic_mapping_obj_lst)
+
         # Init multi-processing pool
         with get_context("spawn").Pool(processes=num_processors_for_job) as pool:
             # Actual parallel training of the models
             optimized_mapping_states_lst = list(
                 tqdm.tqdm(
-                    pool.imap(BmfiaInterface.optimize_hyper_params, probabilistic_mapping_obj_lst),
+                    pool.imap(
+                        BmfiaInterface.optimize_hyper_params_with_seed,
+                        zip(probabilistic_mapping_obj_lst, seeds, strict=True),
+                    ),
                     total=len(probabilistic_mapping_obj_lst),
                 )
             )
@@ -1185,20 +1216,62 @@ class BmfiaInterface:
             mapping.set_state(optimized_state_dict)
 
     @staticmethod
-    def optimize_hyper_params(probabilistic_mapping):
+    @contextmanager
+    def seeded_global_rng(seed):
+        """Seed the global random number generator temporarily.
+
+        The probabilistic mappings draw from the global numpy random number generator during
+        training. Its state is restored afterwards, such that the rest of the run is not affected.
+
+        Args:
+            seed (int, None): Seed for the global random number generator. If None, the generator
+                              is left untouched.
+
+        Yields:
+            None
+        """
+        if seed is None:
+            yield
+            return
+        state = np.random.get_state()
+        np.random.seed(seed)
+        try:
+            yield
+        finally:
+            np.random.set_state(state)
+
+    @staticmethod
+    def optimize_hyper_params(probabilistic_mapping, seed=None):
         """Train one probabilistic surrogate model.
 
         Args:
             probabilistic_mapping (obj): Instantiated but untrained probabilistic mapping
+            seed (int, optional): Seed for the random number generator used during training
 
         Returns:
             optimized_mapping_state_dict (dict): Dictionary with optimized state of the trained
                                                  probabilistic regression model
         """
-        probabilistic_mapping.train()
+        with BmfiaInterface.seeded_global_rng(seed):
+            probabilistic_mapping.train()
         optimized_mapping_state_dict = probabilistic_mapping.get_state()
         return optimized_mapping_state_dict
 
+    @staticmethod
+    def optimize_hyper_params_with_seed(mapping_and_seed):
+        """Train one probabilistic surrogate model with its seed.
+
+        Single-argument version of *optimize_hyper_params* for the multi-processing pool.
+
+        Args:
+            mapping_and_seed (tuple): Probabilistic mapping and its seed
+
+        Returns:
+            optimized_mapping_state_dict (dict): Dictionary with optimized state of the trained
+                                                 probabilistic regression model
+        """
+        return BmfiaInterface.optimize_hyper_params(*mapping_and_seed)
+
     @staticmethod
     def check_coordinates_return_dimensions(z_lf, time_vec, coords_mat):
         """Check the compliance of Z_LF with the coordinates and time vector.
@@ -15,7 +15,9 @@
 """GPLogpdf model."""
 
 import logging
+import multiprocessing as mp
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 import jax
@@ -23,13 +25,14 @@ import jax.numpy as jnp
 import jax.scipy as jsp
 import numpy as np
 import tensorflow_probability.substrates.jax as tfp
-from jax import jit, vmap
+from jax import grad, jit, vmap
 from scipy import stats
+from scipy.linalg import cho_solve
 
 from queens.models._model import Model
 from queens.utils import jax_minimize_wrapper
 from queens.utils.gpflow_transformations import init_scaler
-from queens.utils.numpy_linalg import safe_cholesky
+from queens.utils.numpy_linalg import extend_cholesky, safe_cholesky
 
 _logger = logging.getLogger(__name__)
 jax.config.update("jax_enable_x64", True)
@@ -42,6 +45,9 @@ class LogpdfGaussianProcess(Model):
         approx_type (str): Approximation type (GPMAP-I', 'CGPMAP-II' or 'CFBGP')
         num_hyper (int): Number of hyperparameter samples (if CFBGP)
         num_optimizations (int): Number of hyperparameter optimization restarts
+        num_optimization_workers (int): Number of optimization restarts that run concurrently
+        num_converged_optimizations (int): Number of restarts that need to reach the same optimum
+                                           to skip the remaining restarts
         hmc_burn_in (int): Number of HMC burn-in steps (if CFBGP)
         hmc_steps (int): Number of HMC steps (if CFBGP)
         prior_rate (np.ndarray): Rates of exponential priors for hyperparameters
@@ -62,10 +68,27 @@ class LogpdfGaussianProcess(Model):
                                          training samples
         v_train (np.ndarray): Matrix product of inverse of Gram matrix evaluated at training
                               samples and training output samples
-        jit_func_generate_output (obj): Jitted partial 'generate_output_*' function
-        partial_hyperparameter_log_prob (obj): Jitted partial function of hyperparameter log
-                                               posterior probability
+        jit_generate_output (obj): Jitted 'generate_output_*' function with the training data as
+                                   arguments
+        jit_func_generate_output (obj): Partial of the jitted 'generate_output_*' function with
+                                        the padded training data
+        jit_hyperparameter_log_prob (obj): Jitted hyperparameter log posterior probability with
+                                           the training data as arguments
+        jit_grad_hyperparameter_loss (obj): Jitted gradient of the hyperparameter loss with the
+                                            training data as arguments
+        jit_run_chain (obj): Jitted HMC chain with the training data as arguments (if CFBGP)
+        train_bucket_size (int): The training data is padded to a multiple of this size such that
+                                 the jitted functions are only recompiled when the padded size
+                                 changes
         batch_size (int): Batch size for concurrent prediction evaluations
+        refit_interval (int): Number of initializations after which the data scaling and the
+                              hyperparameters are fully refitted. In between, new training samples
+                              are appended to the Cholesky decomposition of the Gram matrix.
+        num_updates_since_refit (int): Number of incremental updates since the last full refit
+        optimal_hyperparameters (np.ndarray): Optimized hyperparameters of the last full refit,
+                                              used as warm start of the next optimization
+        x_train_unscaled (np.ndarray): Unscaled training input samples of the last initialization
+        y_train_unscaled (np.ndarray): Unscaled training output samples of the last initialization
     """
 
     def __init__(
@@ -80,6 +103,10 @@ class LogpdfGaussianProcess(Model):
         upper_bound=None,
         quantile=0.9,
         jitter=1.0e-16,
+        refit_interval=1,
+        num_optimization_workers=None,
+        num_converged_optimizations=None,
+        train_bucket_size=None,
     ):
         """Initialize LogpdfGP.
 
@@ -97,12 +124,33 @@ class LogpdfGaussianProcess(Model):
                                       observations.
             quantile (float, opt): Confidence quantile
             jitter (float, opt): Nugget term for numerical stability of Cholesky decomposition
+            refit_interval (int, opt): Number of initializations after which the data scaling and
+                                       the hyperparameters are fully refitted. In between, new
+                                       training samples are appended to the Cholesky
+                                       decomposition of the Gram matrix with fixed
+                                       hyperparameters. The default refits at every
+                                       initialization.
+            num_optimization_workers (int, opt): Number of optimization restarts that run
+                                                 concurrently in threads. Defaults to the number
+                                                 of restarts, bounded by the number of CPUs.
+            num_converged_optimizations (int, opt): Number of restarts that need to reach the same
+                                                    optimum to skip the remaining restarts. If
+                                                    None, all restarts are run.
+            train_bucket_size (int, opt): The training data is padded to a multiple of this size
+                                          and masked, such that the jitted functions are reused
+                                          until the padded size changes. If None, no padding is
+                                          applied and every new number of training samples
+                                          triggers a recompilation.
         """
         if approx_type not in ["GPMAP-I", "CGPMAP-II", "CFBGP"]:
             raise ValueError(f"Invalid approximation type: {approx_type}")
         self.approx_type = approx_type
         self.num_hyper = num_hyper
         self.num_optimizations = num_optimizations
+        if num_optimization_workers is None:
+            num_optimization_workers = min(num_optimizations, mp.cpu_count())
+        self.num_optimization_workers = num_optimization_workers
+        self.num_converged_optimizations = num_converged_optimizations
         self.hmc_burn_in = hmc_burn_in
         self.hmc_steps = hmc_steps
         self.prior_rate = np.array(prior_rate)
@@ -121,14 +169,63 @@ class LogpdfGaussianProcess(Model):
         self.chol_k_train_train = None
         self.v_train = None
         self.jit_func_generate_output = None
-        self.partial_hyperparameter_log_prob = None
+        self.train_bucket_size = train_bucket_size
         self.batch_size = int(4e8)
+        self.refit_interval = refit_interval
+        self.num_updates_since_refit = 0
+        self.optimal_hyperparameters = None
+        self.x_train_unscaled = None
+        self.y_train_unscaled = None
+
+        self.jit_hyperparameter_log_prob = jit(
+            partial(
+                self.hyperparameter_log_prob,
+                jitter=self.jitter,
+                log_likelihood_func=self.hyperparameter_log_likelihood,
+                log_prior_func=self.hyperparameter_log_prior,
+                prior_rate=self.prior_rate,
+            )
+        )
+        self.jit_grad_hyperparameter_loss = jit(grad(self.hyperparameter_loss))
+        self.jit_run_chain = jit(
+            partial(
+                self.run_chain,
+                log_prob_func=self.jit_hyperparameter_log_prob,
+                hmc_burn_in=self.hmc_burn_in,
+                hmc_steps=self.hmc_steps,
+            )
+        )
+        eval_mean_and_std = partial(self.evaluate_mean_and_std, prior_gp_mean=self.prior_gp_mean)
+        if self.approx_type == "CFBGP":
+            self.jit_generate_output = jit(
+                partial(
+                    self.generate_output_cfbgp,
+                    eval_mean_and_std=vmap(eval_mean_and_std, in_axes=(None, 0, 0, 0, None, None)),
+                    quantile=self.quantile,
+                )
+            )
+        elif self.approx_type == "CGPMAP-II":
+            self.jit_generate_output = jit(
+                partial(
+                    self.generate_output_cgpmap_2,
+                    eval_mean_and_std=eval_mean_and_std,
+                    quantile=self.quantile,
+                )
+            )
+        else:
+            self.jit_generate_output = jit(
+                partial(self.generate_output_gpmap_1, prior_gp_mean=self.prior_gp_mean)
+            )
 
         super().__init__()
 
     def initialize(self, x_train, y_train, num_observations):
         """Initialize Gaussian process model.
 
+        If the training samples of the previous initialization are a subset of the current ones
+        and no full refit is due according to the refit interval, the new samples are appended
+        incrementally. Otherwise, the data is rescaled and the hyperparameters are re-optimized.
+
         Args:
             x_train (np.ndarray): Training input samples
             y_train (np.ndarray): Training likelihood output samples
@@ -137,10 +234,6 @@ class LogpdfGaussianProcess(Model):
         x_train = x_train.reshape(y_train.size, -1)
         y_train = y_train.reshape(-1, 1)
 
-        self.num_dim = x_train.shape[1]
-        self.scaler_x, self.x_train = init_scaler(x_train)
-        self.scaler_y = np.max(np.abs(y_train))
-        self.y_train = y_train / self.scaler_y - self.prior_gp_mean
         if self.upper_bound is None:
             self.upper_bound = -0.5 * stats.chi2(num_observations).ppf(0.05)
         self.upper_bound = np.array(max(y_train.max(), self.upper_bound))
@@ -152,19 +245,126 @@ class LogpdfGaussianProcess(Model):
             y_train.size,
         )
 
-        self.partial_hyperparameter_log_prob = jit(
-            partial(
-                self.hyperparameter_log_prob,
-                x_train=self.x_train,
-                y_train=self.y_train,
-                jitter=self.jitter,
-                log_likelihood_func=self.hyperparameter_log_likelihood,
-                log_prior_func=self.hyperparameter_log_prior,
-                prior_rate=self.prior_rate,
+        if self.is_incremental_update(x_train, y_train):
+            self.num_updates_since_refit += 1
+            num_previous = self.y_train_unscaled.size
+            _logger.info(
+                "Incremental update %i / %i with %i new training samples",
+                self.num_updates_since_refit,
+                self.refit_interval - 1,
+                y_train.size - num_previous,
             )
+            self.update_training_data(x_train[num_previous:], y_train[num_previous:])
+        else:
+            self.num_updates_since_refit = 0
+            self.refit(x_train, y_train)
+        self.x_train_unscaled = x_train
+        self.y_train_unscaled = y_train
+
+        num_hyper = self.num_hyper if self.approx_type == "CFBGP" else 1
+        self.batch_size = int(4e8 / (y_train.size * self.num_dim * num_hyper))
+
+        x_train_padded, _, train_mask = self.pad_training_data()
+        chol_k_train_train_padded, v_train_padded = self.pad_train_factor(
+            self.chol_k_train_train, self.v_train, train_mask.size - self.y_train.size
         )
+        if self.approx_type in ["CFBGP", "CGPMAP-II"]:
+            self.jit_func_generate_output = partial(
+                self.jit_generate_output,
+                x_train=x_train_padded,
+                hyperparameters=self.hyperparameters,
+                v_train=v_train_padded,
+                chol_k_train_train=chol_k_train_train_padded,
+                train_mask=train_mask,
+                scaler_y=self.scaler_y,
+                upper_bound=self.upper_bound,
+            )
+        else:
+            self.jit_func_generate_output = partial(
+                self.jit_generate_output,
+                x_train=x_train_padded,
+                hyperparameters=self.hyperparameters,
+                v_train=v_train_padded,
+                scaler_y=self.scaler_y,
+            )
+
+    def pad_training_data(self):
+        """Pad the scaled training data to a multiple of the bucket size.
+
+        Returns:
+            x_train (np.ndarray): Padded training input samples
+            y_train (np.ndarray): Padded training output samples
+            train_mask (np.ndarray): Mask which is one for actual and zero for padded samples
+        """
+        num_train = self.y_train.size
+        num_padding = 0
+        if self.train_bucket_size is not None:
+            num_padding = -num_train % self.train_bucket_size
+        x_train = np.pad(self.x_train, ((0, num_padding), (0, 0)))
+        y_train = np.pad(self.y_train, ((0, num_padding), (0, 0)))
+        train_mask = np.pad(np.ones(num_train), (0, num_padding))
+        return x_train, y_train, train_mask
+
+    @staticmethod
+    def pad_train_factor(chol_k_train_train, v_train, num_padding):
+        """Pad the training factors consistently with the padded training data.
+
+        The padded part of the Cholesky decomposition is the identity and the padded part of
+        *v_train* is zero, such that padded samples do not contribute to predictions.
+
+        Args:
+            chol_k_train_train (np.ndarray): Cholesky decomposition(s) of Gram matrix evaluated at
+                                             the training samples
+            v_train (np.ndarray): Matrix product(s) of inverse of Gram matrix evaluated at training
+                                  samples and training output samples
+            num_padding (int): Number of padded samples
+
+        Returns:
+            chol_k_train_train (np.ndarray): Padded Cholesky decomposition(s)
+            v_train (np.ndarray): Padded matrix product(s)
+        """
+        batch_padding = [(0, 0)] * (np.ndim(chol_k_train_train) - 2)
+        num_train = np.shape(chol_k_train_train)[-1]
+        chol_k_train_train = np.pad(
+            chol_k_train_train, batch_padding + [(0, num_padding), (0, num_padding)]
+        )
+        chol_k_train_train[..., num_train:, num_train:] = np.eye(num_padding)
+        v_train = np.pad(v_train, batch_padding + [(0, num_padding), (0, 0)])
+        return chol_k_train_train, v_train
+
+    def is_incremental_update(self, x_train, y_train):
+        """Check whether the new training data can be appended incrementally.
+
+        Args:
+            x_train (np.ndarray): Training input samples
+            y_train (np.ndarray): Training likelihood output samples
+
+        Returns:
+            bool: True if the previous training samples are the leading part of the current ones
+            and no full refit is due
+        """
+        if self.y_train_unscaled is None or self.num_updates_since_refit + 1 >= self.refit_interval:
+            return False
+        num_previous = self.y_train_unscaled.size
+        return (
+            y_train.size > num_previous
+            and np.array_equal(x_train[:num_previous], self.x_train_unscaled)
+            and np.array_equal(y_train[:num_previous], self.y_train_unscaled)
+        )
+
+    def refit(self, x_train, y_train):
+        """Rescale the training data and fit the hyperparameters from scratch.
+
+        Args:
+            x_train (np.ndarray): Training input samples
+            y_train (np.ndarray): Training likelihood output samples
+        """
+        self.num_dim = x_train.shape[1]
+        self.scaler_x, self.x_train = init_scaler(x_train)
+        self.scaler_y = np.max(np.abs(y_train))
+        self.y_train = y_train / self.scaler_y - self.prior_gp_mean
+
         if self.approx_type == "CFBGP":
-            self.batch_size = int(4e8 / (y_train.size * self.num_dim * self.num_hyper))
             with jax.default_device(jax.devices("cpu")[0]):
                 hyperparameters = self.sample_hyperparameters()
             _logger.info(
@@ -184,49 +384,71 @@ class LogpdfGaussianProcess(Model):
             for i, hyperparameter in enumerate(self.hyperparameters):
                 self.chol_k_train_train[i], self.v_train[i] = self.calc_train_factor(hyperparameter)
         else:
-            self.batch_size = int(4e8 / (y_train.size * self.num_dim))
             with jax.default_device(jax.devices("cpu")[0]):
                 self.hyperparameters = self.optimize_hyperparameters()
             self.chol_k_train_train, self.v_train = self.calc_train_factor(self.hyperparameters)
 
-        eval_mean_and_std = partial(
-            self.evaluate_mean_and_std,
-            prior_gp_mean=self.prior_gp_mean,
-            scaler_y=self.scaler_y,
-        )
+    def update_training_data(self, x_train_new, y_train_new):
+        """Append new training samples with fixed scaling and hyperparameters.
 
-        if self.approx_type in ["CFBGP", "CGPMAP-II"]:
-            if self.approx_type == "CFBGP":
-                eval_mean_and_std = vmap(eval_mean_and_std, in_axes=(None, 0, 0, 0))
-                generate_output_func = self.generate_output_cfbgp
-            else:
-                generate_output_func = self.generate_output_cgpmap_2
+        The Cholesky decompositions of the Gram matrix are extended by the new samples instead of
+        being recomputed.
 
-            self.jit_func_generate_output = jit(
-                partial(
-                    generate_output_func,
-                    x_train=self.x_train,
-                    hyperparameters=self.hyperparameters,
-                    v_train=self.v_train,
-                    chol_k_train_train=self.chol_k_train_train,
-                    upper_bound=self.upper_bound,
-                    eval_mean_and_std=eval_mean_and_std,
-                    quantile=self.quantile,
-                )
-            )
+        Args:
+            x_train_new (np.ndarray): New training input samples
+            y_train_new (np.ndarray): New training likelihood output samples
+        """
+        x_train_new = self.scaler_x.transform(x_train_new)
+        x_train_previous = self.x_train
+        self.x_train = np.concatenate([x_train_previous, x_train_new], axis=0)
+        self.y_train = np.concatenate(
+            [self.y_train, y_train_new / self.scaler_y - self.prior_gp_mean], axis=0
+        )
 
-        else:
-            self.jit_func_generate_output = jit(
-                partial(
-                    self.generate_output_gpmap_1,
-                    x_train=self.x_train,
-                    hyperparameters=self.hyperparameters,
-                    v_train=self.v_train,
-                    prior_gp_mean=self.prior_gp_mean,
-                    scaler_y=self.scaler_y,
+        if self.approx_type == "CFBGP":
+            chol_k_train_train = np.zeros((self.num_hyper, self.y_train.size, self.y_train.size))
+            v_train = np.zeros((self.num_hyper, self.y_train.size, 1))
+            for i, hyperparameter in enumerate(self.hyperparameters):
+                chol_k_train_train[i], v_train[i] = self.extend_train_factor(
+                    hyperparameter, self.chol_k_train_train[i], x_train_previous, x_train_new
                 )
+            self.chol_k_train_train, self.v_train = chol_k_train_train, v_train
+        else:
+            self.chol_k_train_train, self.v_train = self.extend_train_factor(
+                self.hyperparameters, self.chol_k_train_train, x_train_previous, x_train_new
             )
 
+    def extend_train_factor(
+        self, hyperparameters, chol_k_train_train, x_train_previous, x_train_new
+    ):
+        """Extend training factors by new training samples.
+
+        Args:
+            hyperparameters (np.ndarray): Hyperparameters
+            chol_k_train_train (np.ndarray): Cholesky decomposition of Gram matrix evaluated at the
+                                             previous training samples
+            x_train_previous (np.ndarray): Previous scaled training input samples
+            x_train_new (np.ndarray): New scaled training input samples
+
+        Returns:
+            chol_k_train_train (np.ndarray): Cholesky decomposition of Gram matrix evaluated at the
+                                             training samples
+            v_train (np.ndarray): Matrix product of inverse of Gram matrix evaluated at training
+                                  samples and training output samples
+        """
+        k_new_train = np.asarray(rbf(x_train_new, x_train_previous, hyperparameters[:-1]))
+        k_new_new = np.asarray(rbf(x_train_new, x_train_new, hyperparameters[:-1]))
+        k_new_new = k_new_new + np.eye(k_new_new.shape[0]) * (hyperparameters[-1] + self.jitter)
+        # as in calc_train_factor, the jitter of a failed decomposition starts at the noise variance
+        chol_k_train_train = extend_cholesky(
+            np.asarray(chol_k_train_train),
+            k_new_train,
+            k_new_new,
+            jitter_start_value=hyperparameters[-1],
+        )
+        v_train = cho_solve((chol_k_train_train, True), self.y_train, check_finite=False)
+        return chol_k_train_train, v_train
+
     def calc_train_factor(self, hyperparameters):
         """Calculate training factors.
 
@@ -280,12 +502,16 @@ class LogpdfGaussianProcess(Model):
     def optimize_hyperparameters(self):
         """Optimize hyperparameters.
 
+        If hyperparameters have been optimized before, the first optimization restart is
+        warm-started from the previous optimum. The restarts are run concurrently in batches of
+        *num_optimization_workers*. The remaining batches are skipped as soon as
+        *num_converged_optimizations* restarts reach the same optimal loss value.
+
         Returns:
             hyperparameters (np.ndarray): Optimized hyperparameters
         """
-
-        def loss(x):
-            return -self.partial_hyperparameter_log_prob(x)  # pylint: disable=not-callable
+        loss = self.hyperparameter_loss
+        training_data = self.pad_training_data()
 
         initial_samples = np.random.exponential(
             scale=1.0e0, size=(self.num_optimizations, self.num_dim + 2)
@@ -294,28 +520,94 @@ class LogpdfGaussianProcess(Model):
         initial_samples[:, -2] = initial_samples[:, -2] / self.prior_rate[1]
         initial_samples[:, -1] = initial_samples[:, -1] / self.prior_rate[2]
         initial_samples_unconstrained = np.log(initial_samples)
-        loss(initial_samples_unconstrained[0])
-        jax.grad(loss)(initial_samples_unconstrained[0])
+        if self.optimal_hyperparameters is not None:
+            initial_samples_unconstrained[0] = np.log(self.optimal_hyperparameters)
+        # compile once before the restarts run concurrently
+        loss(initial_samples_unconstrained[0], *training_data)
+        # pylint: disable-next=not-callable
+        self.jit_grad_hyperparameter_loss(initial_samples_unconstrained[0], *training_data)
+
+        def run_optimization(initial_sample_unconstrained):
+            result = jax_minimize_wrapper.minimize(
+                loss,
+                initial_sample_unconstrained,
+                "L-BFGS-B",
+                args=training_data,
+                jac=self.jit_grad_hyperparameter_loss,
+            )
+            return result["x"], result["fun"]
+
         start = time.time()
         positions = np.zeros((self.num_optimizations, self.num_dim + 2))
         objectives = np.zeros(self.num_optimizations)
-        for i in range(self.num_optimizations):
-            result = jax_minimize_wrapper.minimize(
-                loss, initial_samples_unconstrained[i], "L-BFGS-B"
-            )
-            positions[i] = result["x"]
-            objectives[i] = result["fun"]
+        num_runs = 0
+        with ThreadPoolExecutor(max_workers=self.num_optimization_workers) as executor:
+            while num_runs < self.num_optimizations:
+                batch = slice(
+                    num_runs, min(num_runs + self.num_optimization_workers, self.num_optimizations)
+                )
+                for i, (position, objective) in enumerate(
+                    executor.map(run_optimization, initial_samples_unconstrained[batch]),
+                    start=num_runs,
+                ):
+                    positions[i] = position
+                    objectives[i] = objective
+                num_runs = batch.stop
+                if self.optimum_converged(objectives[:num_runs]):
+                    _logger.info(
+                        "%i optimizations converged to the same optimum. Skipping remaining %i "
+                        "optimizations.",
+                        self.num_converged_optimizations,
+                        self.num_optimizations - num_runs,
+                    )
+                    break
+        positions = positions[:num_runs]
+        objectives = objectives[:num_runs]
         _logger.info("Optimization Time: %f s", time.time() - start)
         _logger.info("Optimized Loss Value: %f", np.nanmin(np.array(objectives)))
         _logger.info(
             "Number of failed optimizations: %i / %i",
             np.sum(np.isnan(np.array(objectives))),
-            self.num_optimizations,
+            num_runs,
         )
         hyperparameters = np.exp(positions[np.nanargmin(objectives)])
         _logger.info("Optimized hyperparameters: %s", hyperparameters)
+        self.optimal_hyperparameters = hyperparameters
         return hyperparameters
 
+    def hyperparameter_loss(self, transformed_hyperparameters, x_train, y_train, train_mask):
+        """Negative log joint probability of the hyperparameters.
+
+        Args:
+            transformed_hyperparameters (np.ndarray): Transformed hyperparameters
+            x_train (np.ndarray): Padded training input samples
+            y_train (np.ndarray): Padded training output samples
+            train_mask (np.ndarray): Mask which is one for actual and zero for padded samples
+
+        Returns:
+            np.ndarray: Negative log joint probability of hyperparameters
+        """
+        # pylint: disable-next=not-callable
+        return -self.jit_hyperparameter_log_prob(
+            transformed_hyperparameters, x_train=x_train, y_train=y_train, train_mask=train_mask
+        )
+
+    def optimum_converged(self, objectives, rtol=1e-6, atol=1e-8):
+        """Check whether enough optimizations reached the same optimal loss value.
+
+        Args:
+            objectives (np.ndarray): Final loss values of the finished optimizations
+            rtol (float, opt): Relative tolerance for identical loss values
+            atol (float, opt): Absolute tolerance for identical loss values
+
+        Returns:
+            bool: True if at least *num_converged_optimizations* loss values match the minimum
+        """
+        if self.num_converged_optimizations is None or np.all(np.isnan(objectives)):
+            return False
+        num_converged = np.sum(np.isclose(objectives, np.nanmin(objectives), rtol=rtol, atol=atol))
+        return num_converged >= self.num_converged_optimizations
+
     def sample_hyperparameters(self):
         """Draw samples from hyperparameter posterior.
 
@@ -324,37 +616,59 @@ class LogpdfGaussianProcess(Model):
         """
         initial_hyperparameters = self.optimize_hyperparameters()
 
+        start = time.time()
+        x_train_padded, y_train_padded, train_mask = self.pad_training_data()
+        # pylint: disable-next=not-callable
+        hyperparameter_samples = self.jit_run_chain(
+            np.log(initial_hyperparameters), x_train_padded, y_train_padded, train_mask
+        )
+        _logger.info("Sampling Time: %f s", time.time() - start)
+        hyperparameter_samples = np.exp(hyperparameter_samples)
+        return hyperparameter_samples
+
+    @staticmethod
+    def run_chain(
+        initial_state, x_train, y_train, train_mask, log_prob_func, hmc_burn_in, hmc_steps
+    ):
+        """Run adaptive NUTS chain on the hyperparameter posterior.
+
+        Args:
+            initial_state (np.ndarray): Initial transformed hyperparameters
+            x_train (np.ndarray): Training input samples
+            y_train (np.ndarray): Training output samples
+            train_mask (np.ndarray): Mask which is one for actual and zero for padded samples
+            log_prob_func (obj): Log joint probability function of transformed hyperparameters
+            hmc_burn_in (int): Number of HMC burn-in steps
+            hmc_steps (int): Number of HMC steps
+
+        Returns:
+            np.ndarray: Samples of transformed hyperparameters
+        """
         nuts = tfp.mcmc.NoUTurnSampler(
-            target_log_prob_fn=self.partial_hyperparameter_log_prob,
+            target_log_prob_fn=partial(
+                log_prob_func, x_train=x_train, y_train=y_train, train_mask=train_mask
+            ),
             max_tree_depth=10,
             step_size=0.01,
         )
         adaptive_nuts = tfp.mcmc.SimpleStepSizeAdaptation(
             nuts,
-            num_adaptation_steps=int(0.8 * self.hmc_burn_in),
+            num_adaptation_steps=int(0.8 * hmc_burn_in),
             target_accept_prob=jnp.float64(0.75),
             adaptation_rate=0.1,
         )
 
         _, sample_key = jax.random.split(jax.random.PRNGKey(0))
 
-        @jit
-        def run_chain_fn(initial_state):
-            return tfp.mcmc.sample_chain(
-                num_results=self.hmc_steps,
-                num_burnin_steps=self.hmc_burn_in,
-                current_state=initial_state,
-                kernel=adaptive_nuts,
-                trace_fn=None,
-                return_final_kernel_results=False,
-                seed=sample_key,
-            )
-
-        start = time.time()
-        hyperparameter_samples = run_chain_fn(np.log(initial_hyperparameters))
-        _logger.info("Sampling Time: %f s", time.time() - start)
-        hyperparameter_samples = np.exp(hyperparameter_samples)
-        return hyperparameter_samples
+        return tfp.mcmc.sample_chain(
+            num_results=hmc_steps,
+            num_burnin_steps=hmc_burn_in,
+            current_state=initial_state,
+            kernel=adaptive_nuts,
+            trace_fn=None,
+            return_final_kernel_results=False,
+            seed=sample_key,
+        )
 
     @staticmethod
     def evaluate_mean_and_std(
@@ -362,8 +676,9 @@ class LogpdfGaussianProcess(Model):
         hyperparameters,
         v_train,
         chol_k_train_train,
-        prior_gp_mean,
+        train_mask,
         scaler_y,
+        prior_gp_mean,
     ):
         """Mean and standard deviation of unconstrained GP at test samples.
 
@@ -374,14 +689,15 @@ class LogpdfGaussianProcess(Model):
                                   samples and training output samples
             chol_k_train_train (np.ndarray): Cholesky decomposition of Gram matrix evaluated at the
                                              training samples
-            prior_gp_mean (float, opt): Transformed prior GP mean. Range: [-1, 0]
+            train_mask (np.ndarray): Mask which is one for actual and zero for padded samples
             scaler_y (float): Scaler for training likelihood output samples
+            prior_gp_mean (float, opt): Transformed prior GP mean. Range: [-1, 0]
 
         Returns:
             mean (np.ndarray): Mean of unconstrained GP at test samples
             std (np.ndarray): Standard deviation of unconstrained GP at test samples.
         """
-        k_test_train = rbf_by_dists(dists_test_train, hyperparameters[:-1])
+        k_test_train = rbf_by_dists(dists_test_train, hyperparameters[:-1]) * train_mask
         k_test_test = hyperparameters[-2] ** 2
         mean = jnp.dot(k_test_train, v_train)
         var = k_test_test - jnp.sum(
@@ -401,6 +717,8 @@ class LogpdfGaussianProcess(Model):
         hyperparameters,
         v_train,
         chol_k_train_train,
+        train_mask,
+        scaler_y,
         eval_mean_and_std,
         upper_bound,
         quantile,
@@ -415,6 +733,8 @@ class LogpdfGaussianProcess(Model):
                                   samples and training output samples
             chol_k_train_train (np.ndarray): Cholesky decomposition of Gram matrix evaluated at the
                                              training samples
+            train_mask (np.ndarray): Mask which is one for actual and zero for padded samples
+            scaler_y (float): Scaler for training likelihood output samples
             eval_mean_and_std (obj): eval_mean_and_std function
             upper_bound (float): Transformed upper bound for Gaussian process
             quantile (float): Confidence quantile
@@ -424,7 +744,7 @@ class LogpdfGaussianProcess(Model):
         """
         dists_test_train = distances(x_test, x_train)
         mean, std = eval_mean_and_std(
-            dists_test_train, hyperparameters, v_train, chol_k_train_train
+            dists_test_train, hyperparameters, v_train, chol_k_train_train, train_mask, scaler_y
         )
 
         erfc_arg = (mean - upper_bound) / (jnp.sqrt(2) * std)
@@ -443,6 +763,8 @@ class LogpdfGaussianProcess(Model):
         hyperparameters,
         v_train,
         chol_k_train_train,
+        train_mask,
+        scaler_y,
         eval_mean_and_std,
         upper_bound,
         quantile,
@@ -457,6 +779,8 @@ class LogpdfGaussianProcess(Model):
                                   samples and training output samples
             chol_k_train_train (np.ndarray): Cholesky decomposition of Gram matrix evaluated at the
                                              training samples
+            train_mask (np.ndarray): Mask which is one for actual and zero for padded samples
+            scaler_y (float): Scaler for training likelihood output samples
             eval_mean_and_std (obj): eval_mean_and_std function
             upper_bound (float): Transformed upper bound for Gaussian process
             quantile (float): Confidence quantile
@@ -466,7 +790,7 @@ class LogpdfGaussianProcess(Model):
         """
         dists_test_train = distances(x_test, x_train)
         mean, std = eval_mean_and_std(
-            dists_test_train, hyperparameters, v_train, chol_k_train_train
+            dists_test_train, hyperparameters, v_train, chol_k_train_train, train_mask, scaler_y
         )
         mean = mean.reshape(-1, x_test.shape[0])
         std = std.reshape(-1, x_test.shape[0])
@@ -507,25 +831,33 @@ class LogpdfGaussianProcess(Model):
         return log_likelihood
 
     @staticmethod
-    def hyperparameter_log_likelihood(hyperparameters, x_train, y_train, jitter):
+    def hyperparameter_log_likelihood(hyperparameters, x_train, y_train, jitter, train_mask=None):
         """Log likelihood function for hyperparameters.
 
+        Padded samples are decoupled from the actual samples by replacing their rows and columns
+        of the Gram matrix with the identity. Together with zero padded outputs, they do not
+        contribute to the log likelihood.
+
         Args:
             hyperparameters (np.ndarray): Hyperparameters
             x_train (np.ndarray): Training input samples
             y_train (np.ndarray): Training output samples
             jitter (float): Nugget term for numerical stability of Cholesky decomposition
+            train_mask (np.ndarray, opt): Mask which is one for actual and zero for padded samples
 
         Returns:
             log_likelihood (np.ndarray): Log likelihood of data given hyperparameters
         """
+        if train_mask is None:
+            train_mask = jnp.ones(y_train.size)
         k_train_train = rbf(x_train, x_train, hyperparameters[:-1])
         k_train_train = k_train_train + jnp.eye(k_train_train.shape[0]) * hyperparameters[-1]
         k_train_train = k_train_train + jnp.eye(k_train_train.shape[0]) * jitter
+        k_train_train = jnp.outer(train_mask, train_mask) * k_train_train + jnp.diag(1 - train_mask)
         v_train = jsp.linalg.solve(k_train_train, y_train, assume_a="pos")
         logdet = jnp.linalg.slogdet(k_train_train)[1]
         log_likelihood = -0.5 * (jnp.sum(y_train * v_train) + logdet)
-        log_likelihood = log_likelihood - v_train.size / 2 * jnp.log(2 * jnp.pi)
+        log_likelihood = log_likelihood - jnp.sum(train_mask) / 2 * jnp.log(2 * jnp.pi)
         return log_likelihood
 
     @staticmethod
@@ -556,6 +888,7 @@ class LogpdfGaussianProcess(Model):
         log_likelihood_func,
         log_prior_func,
         prior_rate,
+        train_mask=None,
     ):
         """Log joint probability function for hyperparameters.
 
@@ -568,12 +901,13 @@ class LogpdfGaussianProcess(Model):
             log_prior_func (obj): log prior function of hyperparameters
             prior_rate (np.ndarray): prior_rate (np.ndarray): Rates of exponential priors for
                                                               hyperparameters
+            train_mask (np.ndarray, opt): Mask which is one for actual and zero for padded samples
 
         Returns:
             np.ndarray: Log joint probability of hyperparameters
         """
         hyperparameters = jnp.exp(transformed_hyperparameters)
-        log_likelihood = log_likelihood_func(hyperparameters, x_train, y_train, jitter)
+        log_likelihood = log_likelihood_func(hyperparameters, x_train, y_train, jitter, train_mask)
         log_prior = log_prior_func(hyperparameters, prior_rate)
         forward_log_det = jnp.sum(transformed_hyperparameters)
         return log_likelihood + log_prior + forward_log_det
@@ -22,6 +22,7 @@ from scipy.linalg import cho_solve
 import queens.models.surrogates.utils.kernel_jitted as utils_jitted
 from queens.models.surrogates._surrogate import Surrogate
 from queens.utils.logger_settings import log_init_args
+from queens.utils.numpy_linalg import extend_cholesky
 from queens.utils.scaling import VALID_SCALER
 from queens.utils.valid_options import get_option
 from queens.visualization.gnuplot_vis import gnuplot_gp_convergence
@@ -37,10 +38,22 @@ class JittedGaussianProcess(Surrogate):
     but only computes the MAP estimate and does not
     marginalize the hyper-parameters.
 
+    The inverse of the covariance matrix is never stored. Instead, the weights of the training
+    points and the Cholesky decomposition are used for predictions, which are evaluated in blocks
+    of testing points.
+
+    Training points can be appended to a trained GP with *update*. The Cholesky decomposition is
+    then extended by the new points, and the hyper-parameters are only re-optimized every
+    *refit_interval* updates, warm-started from the current optimum.
+
     Attributes:
-        k_mat_inv (np.array): Inverse of the assembled covariance matrix.
+        alpha (np.array): Weights of the training points, i.e., the inverse of the covariance
+                          matrix applied to the training outputs.
         cholesky_k_mat (np.array): Lower Cholesky decomposition of the covariance matrix.
         k_mat (np.array): Assembled covariance matrix of the GP.
+        squared_distance_mat (np.array): Squared distances between the training inputs. They are
+                                         computed once in the setup and reused for every kernel
+                                         assembly during training.
         partial_derivatives_hyper_params (list): List of partial derivatives of the
                                                  kernel function w.r.t. the hyper-parameters.
         mean_function (function): Mean function of the GP
@@ -54,8 +67,17 @@ class JittedGaussianProcess(Surrogate):
         noise_variance_lower_bound (float): Lower bound for Gaussian noise variance in RBF kernel.
         plot_refresh_rate (int): Refresh rate of the plot (every n-iterations).
         kernel_type (str): Type of kernel function.
+        prediction_block_size (int): Maximum number of testing points evaluated at once.
+        refit_interval (int): Number of updates after which the hyper-parameters are re-optimized.
+                              If None, the hyper-parameters are kept fixed during updates.
+        num_updates (int): Number of updates since the last training.
     """
 
+    valid_covariance_functions_dict = {
+        "squared_exponential": utils_jitted.covariance_squared_exponential,
+        "matern_3_2": utils_jitted.covariance_matern_3_2,
+    }
+
     valid_kernels_dict = {
         "squared_exponential": (
             utils_jitted.squared_exponential,
@@ -85,6 +107,8 @@ class JittedGaussianProcess(Surrogate):
         mean_function_type="zero",
         plot_refresh_rate=None,
         noise_var_lb=None,
+        prediction_block_size=1000,
+        refit_interval=None,
     ):
         """Instantiate the jitted Gaussian Process.
 
@@ -96,6 +120,10 @@ class JittedGaussianProcess(Surrogate):
             mean_function_type (str): Mean function type of the GP
             plot_refresh_rate (int): Refresh rate of the plot (every n-iterations).
             noise_var_lb (float): Lower bound for Gaussian noise variance in RBF kernel.
+            prediction_block_size (int): Maximum number of testing points evaluated at once.
+            refit_interval (int): Number of updates after which the hyper-parameters are
+                                  re-optimized. If None, the hyper-parameters are kept fixed
+                                  during updates.
         """
         super().__init__()
         if initial_hyper_params_lst is None:
@@ -127,9 +155,10 @@ class JittedGaussianProcess(Surrogate):
             valid_mean_function_types, mean_function_type
         )
 
-        self.k_mat_inv = None
+        self.alpha = None
         self.cholesky_k_mat = None
         self.k_mat = None
+        self.squared_distance_mat = None
         self.partial_derivatives_hyper_params = []
         self.mean_function = mean_function
         self.gradient_mean_function = gradient_mean_function
@@ -141,6 +170,9 @@ class JittedGaussianProcess(Surrogate):
         self.noise_variance_lower_bound = noise_var_lb
         self.plot_refresh_rate = plot_refresh_rate
         self.kernel_type = kernel_type
+        self.prediction_block_size = prediction_block_size
+        self.refit_interval = refit_interval
+        self.num_updates = 0
 
     def log_evidence(self):
         """Log evidence/log marginal likelihood of the GP.
@@ -150,7 +182,7 @@ class JittedGaussianProcess(Surrogate):
                                   hyper-parameters
         """
         log_evidence = (
-            -0.5 * np.dot(np.dot(self.y_train.T, self.k_mat_inv), self.y_train)
+            -0.5 * np.dot(self.y_train.T, self.alpha)
             - (np.sum(np.log(np.diag(self.cholesky_k_mat))))
             - self.k_mat.shape[0] / 2 * np.log(2 * np.pi)
         )
@@ -170,6 +202,7 @@ class JittedGaussianProcess(Surrogate):
         self.x_train = self.scaler_x.transform(x_train.T).T
         self.scaler_y.fit(y_train)
         self.y_train = self.scaler_y.transform(y_train)
+        self.squared_distance_mat = utils_jitted.squared_distances(self.x_train, self.x_train)
 
     def train(self):
         """Train the Gaussian Process.
@@ -185,16 +218,28 @@ class JittedGaussianProcess(Surrogate):
         self._set_jitted_kernel(jitted_kernel)
 
         _logger.info("Initiating training of the GP model...")
+        self.num_updates = 0
 
         # set-up stochastic optimizer
         self.stochastic_optimizer.current_variational_parameters = x_0
 
         def gradient_fn(param_vec):
+            # The trace term tr(K^-1 dK/dtheta) of the gradient depends on every entry of the
+            # inverse of the covariance matrix, so it cannot be replaced by the weights alpha.
+            # Forming it from the Cholesky decomposition costs O(n^3) like the factorization
+            # itself. Avoiding it would require a stochastic trace estimator, which changes the
+            # optimization and is therefore not done here. The inverse is not stored.
+            k_mat_inv = cho_solve(
+                (self.cholesky_k_mat, True),
+                np.eye(self.k_mat.shape[0]),
+                check_finite=False,
+                overwrite_b=True,
+            )
             return grad_log_evidence(
                 param_vec,
                 self.y_train,
                 self.x_train,
-                self.k_mat_inv,
+                k_mat_inv,
                 self.partial_derivatives_hyper_params,
             )
 
@@ -205,7 +250,7 @@ class JittedGaussianProcess(Surrogate):
         iterations = []
         params_ev_max = None
         k_mat_ev_max = None
-        k_mat_inv_ev_max = None
+        alpha_ev_max = None
         cholesky_k_mat_ev_max = None
         for params in self.stochastic_optimizer:
             rel_l2_change_params = self.stochastic_optimizer.rel_l2_change
@@ -250,7 +295,7 @@ class JittedGaussianProcess(Surrogate):
                 log_evidence_max = log_evidence
                 params_ev_max = params
                 k_mat_ev_max = self.k_mat
-                k_mat_inv_ev_max = self.k_mat_inv
+                alpha_ev_max = self.alpha
                 cholesky_k_mat_ev_max = self.cholesky_k_mat
 
         # use the params that yielded the max log evidence
@@ -261,11 +306,61 @@ class JittedGaussianProcess(Surrogate):
         self.hyper_params[-1] = np.maximum(self.noise_variance_lower_bound, self.hyper_params[-1])
 
         self.k_mat = k_mat_ev_max
-        self.k_mat_inv = k_mat_inv_ev_max
+        self.alpha = alpha_ev_max
         self.cholesky_k_mat = cholesky_k_mat_ev_max
 
         _logger.info("GP model trained successfully!")
 
+    def update(self, x_train_new, y_train_new):
+        """Append new training points to the trained Gaussian Process.
+
+        The data scaling of the last setup is kept. The squared distances and the Cholesky
+        decomposition of the covariance matrix are extended by the new points, which avoids the
+        refactorization of the whole covariance matrix. Every *refit_interval* updates, the GP is
+        retrained starting from the current hyper-parameters.
+
+        Args:
+            x_train_new (np.array): new training inputs
+            y_train_new (np.array): new training outputs
+        """
+        y_train_new = y_train_new - self.mean_function(x_train_new)
+        x_train_new = self.scaler_x.transform(x_train_new.T).T
+        y_train_new = self.scaler_y.transform(y_train_new)
+
+        squared_distance_new_train = utils_jitted.squared_distances(x_train_new, self.x_train)
+        squared_distance_new_new = utils_jitted.squared_distances(x_train_new, x_train_new)
+        self.squared_distance_mat = np.block(
+            [
+                [self.squared_distance_mat, squared_distance_new_train.T],
+                [squared_distance_new_train, squared_distance_new_new],
+            ]
+        )
+        self.x_train = np.concatenate([self.x_train, x_train_new], axis=0)
+        self.y_train = np.concatenate([self.y_train, y_train_new], axis=0)
+
+        self.num_updates += 1
+        if self.refit_interval is not None and self.num_updates >= self.refit_interval:
+            self.train()
+            return
+
+        covariance_function = JittedGaussianProcess.valid_covariance_functions_dict[
+            self.kernel_type
+        ]
+        hyper_params = np.array(self.hyper_params)
+        k_mat_new_train = covariance_function(squared_distance_new_train, hyper_params)
+        k_mat_new_new = covariance_function(squared_distance_new_new, hyper_params)
+        np.fill_diagonal(k_mat_new_new, hyper_params[0] + hyper_params[-1])
+
+        # the full decomposition in train adds no jitter, so a failed decomposition of the new block
+        # is only stabilized by the smallest default jitter
+        self.cholesky_k_mat = extend_cholesky(self.cholesky_k_mat, k_mat_new_train, k_mat_new_new)
+        self.k_mat = np.block([[self.k_mat, k_mat_new_train.T], [k_mat_new_train, k_mat_new_new]])
+        self.alpha = cho_solve(
+            (self.cholesky_k_mat, True),
+            self.y_train.flatten(),
+            check_finite=False,
+        )
+
     def _get_jitted_objects(self):
         """Get the jitted kernel method.
 
@@ -301,15 +396,13 @@ class JittedGaussianProcess(Surrogate):
             self.k_mat,
             self.cholesky_k_mat,
             self.partial_derivatives_hyper_params,
-        ) = jitted_kernel(self.x_train, self.hyper_params)
+        ) = jitted_kernel(self.squared_distance_mat, self.hyper_params)
 
-        # get inverse by solving an equation system with cholesky
-        identity = np.eye(self.k_mat.shape[0])
-        self.k_mat_inv = cho_solve(
+        # get the weights of the training points by solving an equation system with cholesky
+        self.alpha = cho_solve(
             (self.cholesky_k_mat, True),
-            identity,
+            self.y_train.flatten(),
             check_finite=False,
-            overwrite_b=True,
         )
 
     def grad(self, samples, upstream_gradient):
@@ -355,20 +448,23 @@ class JittedGaussianProcess(Surrogate):
         ) = self._get_jitted_objects()
 
         x_test_transformed = self.scaler_x.transform(x_test)
-        posterior_mean_test_vec = posterior_mean_fun(
-            self.k_mat_inv,
-            x_test_transformed,
-            self.x_train,
-            self.y_train.flatten(),
-            self.hyper_params,
+        x_test_blocks = [
+            x_test_transformed[i : i + self.prediction_block_size]
+            for i in range(0, x_test_transformed.shape[0], self.prediction_block_size)
+        ]
+        posterior_mean_test_vec = np.concatenate(
+            [
+                posterior_mean_fun(self.alpha, x_test_block, self.x_train, self.hyper_params)
+                for x_test_block in x_test_blocks
+            ]
         )
-
-        var = posterior_covariance_fun(
-            self.k_mat_inv,
-            x_test_transformed,
-            self.x_train,
-            self.hyper_params,
-            support,
+        var = np.concatenate(
+            [
+                posterior_covariance_fun(
+                    self.cholesky_k_mat, x_test_block, self.x_train, self.hyper_params, support
+                )
+                for x_test_block in x_test_blocks
+            ]
         )
 
         if np.any(var.flatten() <= 0.0):
@@ -385,18 +481,21 @@ class JittedGaussianProcess(Surrogate):
         output["variance"] = (self.scaler_y.inverse_transform_std(np.sqrt(var)) ** 2).reshape(-1, 1)
 
         if gradient_bool:
-            grad_post_mean_test_mat = grad_posterior_mean_fun(
-                self.k_mat_inv,
-                x_test_transformed,
-                self.x_train,
-                self.y_train,
-                self.hyper_params,
+            grad_post_mean_test_mat = np.concatenate(
+                [
+                    grad_posterior_mean_fun(
+                        self.alpha, x_test_block, self.x_train, self.hyper_params
+                    )
+                    for x_test_block in x_test_blocks
+                ]
             )
-            grad_post_var_test_vec = grad_posterior_var_fun(
-                self.k_mat_inv,
-                x_test_transformed,
-                self.x_train,
-                self.hyper_params,
+            grad_post_var_test_vec = np.concatenate(
+                [
+                    grad_posterior_var_fun(
+                        self.cholesky_k_mat, x_test_block, self.x_train, self.hyper_params
+                    )
+                    for x_test_block in x_test_blocks
+                ]
             )
             output["grad_mean"] = self.scaler_y.inverse_transform_grad_mean(
                 grad_post_mean_test_mat, self.scaler_x.standard_deviation
@@ -420,7 +519,7 @@ class JittedGaussianProcess(Surrogate):
         state_dict = {
             "hyper_params_lst": self.hyper_params,
             "k_mat": self.k_mat,
-            "k_mat_inv": self.k_mat_inv,
+            "alpha": self.alpha,
             "cholesky_k_mat": self.cholesky_k_mat,
         }
         return state_dict
@@ -436,7 +535,7 @@ class JittedGaussianProcess(Surrogate):
         valid_keys = [
             "hyper_params_lst",
             "k_mat",
-            "k_mat_inv",
+            "alpha",
             "cholesky_k_mat",
         ]
 
@@ -447,7 +546,7 @@ class JittedGaussianProcess(Surrogate):
         # Actually set the new state of the object
         self.hyper_params = state_dict["hyper_params_lst"]
         self.k_mat = state_dict["k_mat"]
-        self.k_mat_inv = state_dict["k_mat_inv"]
+        self.alpha = state_dict["alpha"]
         self.cholesky_k_mat = state_dict["cholesky_k_mat"]
 
     @staticmethod
@@ -19,59 +19,130 @@ import warnings
 import numpy as np
 from numba import jit, njit, prange
 from numba.core.errors import NumbaDeprecationWarning, NumbaPendingDeprecationWarning
-from numpy.linalg.linalg import cholesky
+from numpy.linalg import cholesky
 
 warnings.simplefilter("ignore", category=NumbaDeprecationWarning)
 warnings.simplefilter("ignore", category=NumbaPendingDeprecationWarning)
 
 
+@jit(nopython=True)
+def forward_substitution(low_tri_mat, rhs_mat):
+    """Solve a linear system with a lower triangular matrix.
+
+    Args:
+        low_tri_mat (np.array): Lower triangular matrix
+        rhs_mat (np.array): Right-hand sides of the system (column-wise)
+
+    Returns:
+        sol_mat (np.array): Solution of the system
+    """
+    sol_mat = np.zeros(rhs_mat.shape, dtype=np.float64)
+    for i in range(low_tri_mat.shape[0]):
+        sol_mat[i] = (rhs_mat[i] - np.dot(low_tri_mat[i, :i], sol_mat[:i])) / low_tri_mat[i, i]
+    return sol_mat
+
+
+@jit(nopython=True)
+def cholesky_solve(cholesky_mat, rhs_mat):
+    """Solve a linear system based on the lower Cholesky decomposition of its matrix.
+
+    Args:
+        cholesky_mat (np.array): Lower Cholesky decomposition of the system matrix
+        rhs_mat (np.array): Right-hand sides of the system (column-wise)
+
+    Returns:
+        sol_mat (np.array): Solution of the system
+    """
+    intermediate_mat = forward_substitution(cholesky_mat, rhs_mat)
+    up_tri_mat = np.ascontiguousarray(cholesky_mat.T)
+    sol_mat = np.zeros(rhs_mat.shape, dtype=np.float64)
+    for i in range(up_tri_mat.shape[0] - 1, -1, -1):
+        sol_mat[i] = (
+            intermediate_mat[i] - np.dot(up_tri_mat[i, i + 1 :], sol_mat[i + 1 :])
+        ) / up_tri_mat[i, i]
+    return sol_mat
+
+
+@njit(parallel=True)
+def squared_distances(x_mat_1, x_mat_2):
+    r"""Compute the squared Euclidean distances between two sets of points.
+
+    The distances are computed via :math:`\|x-y\|^2=\|x\|^2+\|y\|^2-2x^Ty`, such that the
+    main effort is a single matrix product.
+
+    Args:
+        x_mat_1 (np.array): First set of points. Individual samples row-wise, columns correspond
+                            to different dimensions.
+        x_mat_2 (np.array): Second set of points. Individual samples row-wise, columns correspond
+                            to different dimensions.
+
+    Returns:
+        squared_distance_mat (np.array): Squared distances between the points of the first set
+                                         (row-wise) and the points of the second set
+                                         (column-wise)
+    """
+    x_mat_1 = np.ascontiguousarray(x_mat_1).astype(np.float64)
+    x_mat_2 = np.ascontiguousarray(x_mat_2).astype(np.float64)
+    squared_norms_1 = np.sum(x_mat_1**2, axis=1)
+    squared_norms_2 = np.sum(x_mat_2**2, axis=1)
+    squared_distance_mat = -2.0 * np.dot(x_mat_1, x_mat_2.T)
+    # pylint: disable=not-an-iterable
+    for i in prange(x_mat_1.shape[0]):
+        # pylint: enable=not-an-iterable
+        for j in range(x_mat_2.shape[0]):
+            squared_distance_mat[i, j] = max(
+                squared_distance_mat[i, j] + squared_norms_1[i] + squared_norms_2[j], 0.0
+            )
+    return squared_distance_mat
+
+
 # --- squared exponential covariance function -------------------
 @njit(parallel=True)
-def squared_exponential(x_train_mat, hyper_param_lst):
+def squared_exponential(squared_distance_mat, hyper_param_lst):
     """Jit the kernel for squared exponential covariance function.
 
     Also compute/pre-compile necessary
     derivatives for finding the MAP estimate of the GP. The covariance
     function here is the squared exponential covariance function.
 
+    Only the lower triangle is evaluated and mirrored, and the exponential is evaluated once per
+    entry for the covariance matrix and all derivatives.
+
     Args:
-        x_train_mat (np.array): Training input points for the GP. Row-wise samples are stored,
-                                different columns correspond to different input dimensions.
+        squared_distance_mat (np.array): Squared distances between the training input points
+                                         of the GP
         hyper_param_lst (lst): List with the hyper-parameters for the kernel
 
     Returns:
         k_mat (np.array): Assembled covariance matrix of the GP
-        k_mat_inv (np.array): Inverse of the assembled covariance matrix
         cholesky_k_mat (np.array): Lower cholesky decomposition of the covariance matrix
         partial_derivatives_hyper_params_lst (lst): List with partial derivatives of the
                                                     evidence w.r.t. the hyper-parameters
     """
     sigma_0_sq, l_scale_sq, sigma_n_sq = hyper_param_lst
-    k_mat = np.zeros((x_train_mat.shape[0], x_train_mat.shape[0]), dtype=np.float64)
-    partial_l_scale_sq = np.zeros((x_train_mat.shape[0], x_train_mat.shape[0]), dtype=np.float64)
-    partial_sigma_0_sq = np.zeros((x_train_mat.shape[0], x_train_mat.shape[0]), dtype=np.float64)
+    num_points = squared_distance_mat.shape[0]
+    k_mat = np.empty((num_points, num_points), dtype=np.float64)
+    partial_l_scale_sq = np.empty((num_points, num_points), dtype=np.float64)
+    partial_sigma_0_sq = np.empty((num_points, num_points), dtype=np.float64)
 
     # pylint: disable=not-an-iterable
-    for i in prange(x_train_mat.shape[0]):
-        for j in prange(x_train_mat.shape[0]):
-            # pylint: enable=not-an-iterable
-            if i == j:
-                noise_var = sigma_n_sq
-            else:
-                noise_var = 0.0
-
-            x = x_train_mat[i, :]
-            y = x_train_mat[j, :]
-
-            delta = np.linalg.norm(x - y)
-            k_mat[i, j] = sigma_0_sq * np.exp(-(delta**2) / (2.0 * l_scale_sq)) + noise_var
-            partial_l_scale_sq[i, j] = (
-                sigma_0_sq
-                * np.exp(-(delta**2) / (2.0 * l_scale_sq))
-                * delta**2
-                / (2.0 * l_scale_sq**2)
-            )
-            partial_sigma_0_sq[i, j] = np.exp(-(delta**2) / (2.0 * l_scale_sq))
+    for i in prange(num_points):
+        # pylint: enable=not-an-iterable
+        for j in range(i):
+            exp_term = np.exp(-squared_distance_mat[i, j] / (2.0 * l_scale_sq))
+            k_entry = sigma_0_sq * exp_term
+            partial_l_scale_sq_entry = k_entry * squared_distance_mat[i, j] / (2.0 * l_scale_sq**2)
+
+            k_mat[i, j] = k_entry
+            k_mat[j, i] = k_entry
+            partial_l_scale_sq[i, j] = partial_l_scale_sq_entry
+            partial_l_scale_sq[j, i] = partial_l_scale_sq_entry
+            partial_sigma_0_sq[i, j] = exp_term
+            partial_sigma_0_sq[j, i] = exp_term
+
+        k_mat[i, i] = sigma_0_sq + sigma_n_sq
+        partial_l_scale_sq[i, i] = 0.0
+        partial_sigma_0_sq[i, i] = 1.0
 
     # calculate first the cholesky decomposition
     cholesky_k_mat = cholesky(k_mat)
@@ -90,12 +161,27 @@ def squared_exponential(x_train_mat, hyper_param_lst):
     return (k_mat, cholesky_k_mat, partial_derivatives_hyper_params_lst)
 
 
+@jit(nopython=True)
+def covariance_squared_exponential(squared_distance_mat, hyper_param_lst):
+    """Evaluate the squared exponential covariance function between two sets of points.
+
+    Args:
+        squared_distance_mat (np.array): Squared distances between the two sets of points
+        hyper_param_lst (lst): List with the hyper-parameters of the kernel
+
+    Returns:
+        k_mat (np.array): Covariance matrix between the two sets of points without noise
+    """
+    sigma_0_sq, l_scale_sq, _ = hyper_param_lst
+    k_mat = sigma_0_sq * np.exp(-squared_distance_mat / (2.0 * l_scale_sq))
+    return k_mat
+
+
 @jit(nopython=True)
 def posterior_mean_squared_exponential(
-    k_mat_inv,
+    alpha_vec,
     x_test_mat,
     x_train_mat,
-    y_train_vec,
     hyper_param_lst,
 ):
     """Jit the posterior mean function of the Gaussian Process.
@@ -103,13 +189,12 @@ def posterior_mean_squared_exponential(
     The mean function is based on the squared exponential covariance function.
 
     Args:
-        k_mat_inv (np.array): Inverse of the assembled covariance matrix
+        alpha_vec (np.array): Weights of the training points, i.e., the inverse of the
+                              covariance matrix applied to the training outputs
         x_test_mat (np.array): Testing input points for the GP. Individual samples row-wise,
                     columns correspond to different dimensions.
         x_train_mat (np.array): Training input points for the GP. Individual samples row-wise,
                                 columns correspond to different dimensions.
-        y_train_vec (np.array): Training outputs for the GP. Column vector where rows correspond
-                                to different samples.
         hyper_param_lst (lst): List with the hyper-parameters of the kernel
 
     Returns:
@@ -117,23 +202,18 @@ def posterior_mean_squared_exponential(
     """
     sigma_0_sq, l_scale_sq, _ = hyper_param_lst
 
-    k_vec = np.zeros((x_train_mat.shape[0], x_test_mat.shape[0]), dtype=np.float64)
-    for j, x_test in enumerate(x_test_mat):
-        for i, x_train in enumerate(x_train_mat):
-            delta = np.linalg.norm(x_test - x_train)
-            k_vec[i, j] = sigma_0_sq * np.exp(-(delta**2) / (2 * l_scale_sq))
+    k_vec = sigma_0_sq * np.exp(-squared_distances(x_train_mat, x_test_mat) / (2 * l_scale_sq))
 
-    mu_vec = np.dot(np.dot(k_vec.T, k_mat_inv), (y_train_vec))
+    mu_vec = np.dot(k_vec.T, alpha_vec)
 
     return mu_vec
 
 
 @jit(nopython=True)
 def grad_posterior_mean_squared_exponential(
-    k_mat_inv,
+    alpha_vec,
     x_test_mat,
     x_train_mat,
-    y_train_vec,
     hyper_param_lst,
 ):
     """Jit the gradient of the posterior mean function of the GP.
@@ -141,13 +221,12 @@ def grad_posterior_mean_squared_exponential(
     The mean function is based on the squared exponential covariance function.
 
     Args:
-        k_mat_inv (np.array): Inverse of the assembled covariance matrix
+        alpha_vec (np.array): Weights of the training points, i.e., the inverse of the
+                              covariance matrix applied to the training outputs
         x_test_mat (np.array): Testing input points for the GP. Individual samples row-wise,
                     columns correspond to different dimensions.
         x_train_mat (np.array): Training input points for the GP. Individual samples row-wise,
                                 columns correspond to different dimensions.
-        y_train_vec (np.array): Training outputs for the GP. Column vector where rows correspond
-                                to different samples.
         hyper_param_lst (lst): List with the hyper-parameters of the kernel
 
     Returns:
@@ -157,25 +236,21 @@ def grad_posterior_mean_squared_exponential(
     """
     sigma_0_sq, l_scale_sq, _ = hyper_param_lst
 
-    grad_k_vec = np.zeros((x_train_mat.shape[0], x_train_mat.shape[1]), dtype=np.float64)
-    grad_mu_mat = np.zeros(x_test_mat.shape, dtype=np.float64)
-
-    for j, x_test in enumerate(x_test_mat):
-        for i, x_train in enumerate(x_train_mat):
-            delta = np.linalg.norm(x_test - x_train)
-            grad_k_vec[i] = (
-                sigma_0_sq
-                * np.exp(-(delta**2) / (2 * l_scale_sq))
-                * (-(x_test - x_train))
-                / (l_scale_sq)
-            )
-        grad_mu_mat[j] = np.dot(np.dot(grad_k_vec.T, k_mat_inv), (y_train_vec)).flatten()
+    k_vec = sigma_0_sq * np.exp(-squared_distances(x_train_mat, x_test_mat) / (2 * l_scale_sq))
+
+    # the gradient of k(x_test, x_train) w.r.t. x_test is
+    # k(x_test, x_train) (x_train - x_test) / l^2
+    weighted_k_mat = k_vec.T * alpha_vec
+    grad_mu_mat = (
+        np.dot(weighted_k_mat, np.ascontiguousarray(x_train_mat))
+        - np.sum(weighted_k_mat, axis=1).reshape(-1, 1) * x_test_mat
+    ) / l_scale_sq
     return grad_mu_mat
 
 
 @jit(nopython=True)
 def posterior_var_squared_exponential(
-    k_mat_inv,
+    cholesky_k_mat,
     x_test_mat,
     x_train_mat,
     hyper_param_lst,
@@ -186,7 +261,7 @@ def posterior_var_squared_exponential(
     The posterior is based on the squared exponential covariance function.
 
     Args:
-        k_mat_inv (np.array): Inverse of the assembled covariance matrix
+        cholesky_k_mat (np.array): Lower Cholesky decomposition of the covariance matrix
         x_test_mat (np.array): Testing input points for the GP. Individual samples row-wise,
                     columns correspond to different dimensions.
         x_train_mat (np.array): Training input points for the GP. Individual samples row-wise,
@@ -201,17 +276,13 @@ def posterior_var_squared_exponential(
                                            at the testing points x_test_vec
     """
     sigma_0_sq, l_scale_sq, sigma_n_sq = hyper_param_lst
-    posterior_variance_vec = np.zeros((x_test_mat.shape[0], 1), dtype=np.float64)
-    k_vec_test_train = np.zeros((x_train_mat.shape[0], 1), dtype=np.float64)
-    for j, x_test in enumerate(x_test_mat):
-        for i, x_train in enumerate(x_train_mat):
-            delta = np.linalg.norm(x_test - x_train)
-            k_vec_test_train[i, 0] = sigma_0_sq * np.exp(-(delta**2) / (2 * l_scale_sq))
-            k_test = sigma_0_sq
-
-        posterior_variance_vec[j] = k_test - np.dot(
-            np.dot(k_vec_test_train.T, k_mat_inv), k_vec_test_train
-        )
+    k_mat_test_train = sigma_0_sq * np.exp(
+        -squared_distances(x_train_mat, x_test_mat) / (2 * l_scale_sq)
+    )
+
+    v_mat = forward_substitution(cholesky_k_mat, k_mat_test_train)
+    posterior_variance_vec = (sigma_0_sq - np.sum(v_mat**2, axis=0)).reshape(-1, 1)
+
     if support == "y":
         posterior_variance_vec = posterior_variance_vec + sigma_n_sq
 
@@ -220,7 +291,7 @@ def posterior_var_squared_exponential(
 
 @jit(nopython=True)
 def grad_posterior_var_squared_exponential(
-    k_mat_inv,
+    cholesky_k_mat,
     x_test_mat,
     x_train_mat,
     hyper_param_lst,
@@ -230,7 +301,7 @@ def grad_posterior_var_squared_exponential(
     The posterior is based on the squared exponential covariance function.
 
     Args:
-        k_mat_inv (np.array): Inverse of the assembled covariance matrix
+        cholesky_k_mat (np.array): Lower Cholesky decomposition of the covariance matrix
         x_test_mat (np.array): Testing input points for the GP. Individual samples row-wise,
                     columns correspond to different dimensions.
         x_train_mat (np.array): Training input points for the GP. Individual samples row-wise,
@@ -243,23 +314,24 @@ def grad_posterior_var_squared_exponential(
                                             x_test_vec
     """
     sigma_0_sq, l_scale_sq, _ = hyper_param_lst
-    grad_posterior_variance = np.zeros((x_test_mat.shape[0], x_test_mat.shape[1]), dtype=np.float64)
-    grad_k_vec_test_train = np.zeros((x_train_mat.shape[0], x_test_mat.shape[1]), dtype=np.float64)
-    k_vec_test_train = np.zeros((x_train_mat.shape[0], 1), dtype=np.float64)
-    for j, x_test in enumerate(x_test_mat):
-        for i, x_train in enumerate(x_train_mat):
-            delta = np.linalg.norm(x_test - x_train)
-            grad_k_vec_test_train[i, :] = (
-                sigma_0_sq
-                * np.exp(-(delta**2) / (2 * l_scale_sq))
-                * (-(x_test - x_train))
-                / (l_scale_sq)
-            )
-            k_vec_test_train[i, 0] = sigma_0_sq * np.exp(-(delta**2) / (2 * l_scale_sq))
+    k_mat_test_train = sigma_0_sq * np.exp(
+        -squared_distances(x_train_mat, x_test_mat) / (2 * l_scale_sq)
+    )
 
-        grad_posterior_variance[j] = np.dot(
-            (-2 * np.dot(k_vec_test_train.T, k_mat_inv)), grad_k_vec_test_train
+    # weights of the training points for each testing point, i.e., K^{-1} k
+    weights_mat = cholesky_solve(cholesky_k_mat, k_mat_test_train)
+
+    # the gradient of k(x_test, x_train) w.r.t. x_test is
+    # k(x_test, x_train) (x_train - x_test) / l^2
+    weighted_k_mat = np.ascontiguousarray((weights_mat * k_mat_test_train).T)
+    grad_posterior_variance = (
+        -2
+        * (
+            np.dot(weighted_k_mat, np.ascontiguousarray(x_train_mat))
+            - np.sum(weighted_k_mat, axis=1).reshape(-1, 1) * x_test_mat
         )
+        / l_scale_sq
+    )
     return grad_posterior_variance
 
 
@@ -304,15 +376,17 @@ def grad_log_evidence_squared_exponential(
 
     data_minus_prior_mean = y_train_vec - x_train_vec
     alpha = np.dot(k_mat_inv, data_minus_prior_mean)
+    outer_minus_inv = np.dot(alpha, alpha.T) - k_mat_inv
 
-    grad_ev_sigma_0_sq_param = 0.5 * np.trace(
-        (np.dot(alpha, alpha.T) - k_mat_inv) @ (partial_sigma_0_sq) * np.exp(sigma_0_sq_param)
+    # the trace of a product of symmetric matrices is the sum of their elementwise product
+    grad_ev_sigma_0_sq_param = (
+        0.5 * np.sum(outer_minus_inv * partial_sigma_0_sq) * np.exp(sigma_0_sq_param)
     )
-    grad_ev_sigma_n_sq_param = 0.5 * np.trace(
-        (np.dot(alpha, alpha.T) - k_mat_inv) @ (partial_sigma_n_sq) * np.exp(sigma_n_sq_param)
+    grad_ev_sigma_n_sq_param = (
+        0.5 * np.sum(outer_minus_inv * partial_sigma_n_sq) * np.exp(sigma_n_sq_param)
     )
-    grad_ev_l_scale_sq_param = 0.5 * np.trace(
-        (np.dot(alpha, alpha.T) - k_mat_inv) @ (partial_l_scale_sq) * np.exp(l_scale_sq_param)
+    grad_ev_l_scale_sq_param = (
+        0.5 * np.sum(outer_minus_inv * partial_l_scale_sq) * np.exp(l_scale_sq_param)
     )
     grad = np.array(
         [grad_ev_sigma_0_sq_param, grad_ev_l_scale_sq_param, grad_ev_sigma_n_sq_param]
@@ -322,57 +396,57 @@ def grad_log_evidence_squared_exponential(
 
 
 # -- Matern 3-2 covariance function ------------------------------------
-@jit(nopython=True)
-def matern_3_2(x_train_mat, hyper_param_lst):
+@njit(parallel=True)
+def matern_3_2(squared_distance_mat, hyper_param_lst):
     """Jit the kernel for the Matern 3/2 function.
 
     Also compute/pre-compile necessary
     derivatives for finding the MAP estimate of the GP. The covariance
     function here is the squared exponential covariance function.
 
+    Only the lower triangle is evaluated and mirrored, and the exponential is evaluated once per
+    entry for the covariance matrix and all derivatives.
+
     Args:
-        x_train_mat (np.array): Training input points for the GP. Row-wise samples are stored,
-                                different columns correspond to different input dimensions.
+        squared_distance_mat (np.array): Squared distances between the training input points
+                                         of the GP
         hyper_param_lst (lst): List with the hyper-parameters for the kernel
 
     Returns:
         k_mat (np.array): Assembled covariance matrix of the GP
-        k_mat_inv (np.array): Inverse of the assembled covariance matrix
         cholesky_k_mat (np.array): Lower cholesky decomposition of the covariance matrix
         partial_derivatives_hyper_params_lst (lst): List with partial derivatives of the
                                                     evidence w.r.t. the hyper-parameters
     """
     sigma_0_sq, l_scale, sigma_n_sq = hyper_param_lst
-    k_mat = np.zeros((x_train_mat.shape[0], x_train_mat.shape[0]), dtype=np.float64)
-    partial_l_scale = np.zeros((x_train_mat.shape[0], x_train_mat.shape[0]), dtype=np.float64)
-    partial_sigma_0_sq = np.zeros((x_train_mat.shape[0], x_train_mat.shape[0]), dtype=np.float64)
+    num_points = squared_distance_mat.shape[0]
+    k_mat = np.empty((num_points, num_points), dtype=np.float64)
+    partial_l_scale = np.empty((num_points, num_points), dtype=np.float64)
+    partial_sigma_0_sq = np.empty((num_points, num_points), dtype=np.float64)
 
     # pylint: disable=not-an-iterable
-    for i in prange(x_train_mat.shape[0]):
-        for j in prange(x_train_mat.shape[0]):
-            # pylint: enable=not-an-iterable
-            if i == j:
-                noise_var = sigma_n_sq
-            else:
-                noise_var = 0.0
-
-            x = x_train_mat[i, :]
-            y = x_train_mat[j, :]
-
-            delta = np.linalg.norm(x - y)
-            k_mat[i, j] = (
-                sigma_0_sq
-                * (1 + np.sqrt(3) * delta / l_scale)
-                * np.exp(-np.sqrt(3) * delta / l_scale)
-                + noise_var
-            )
-            partial_l_scale[i, j] = (
-                sigma_0_sq * np.exp(-np.sqrt(3) * delta / l_scale) * 3 * delta**2 / (l_scale**3)
-            )
-            partial_sigma_0_sq[i, j] = (1 + np.sqrt(3) * delta / l_scale) * np.exp(
-                -np.sqrt(3) * delta / l_scale
+    for i in prange(num_points):
+        # pylint: enable=not-an-iterable
+        for j in range(i):
+            scaled_delta = np.sqrt(3.0 * squared_distance_mat[i, j]) / l_scale
+            exp_term = np.exp(-scaled_delta)
+            partial_sigma_0_sq_entry = (1 + scaled_delta) * exp_term
+            k_entry = sigma_0_sq * partial_sigma_0_sq_entry
+            partial_l_scale_entry = (
+                sigma_0_sq * exp_term * 3 * squared_distance_mat[i, j] / (l_scale**3)
             )
 
+            k_mat[i, j] = k_entry
+            k_mat[j, i] = k_entry
+            partial_l_scale[i, j] = partial_l_scale_entry
+            partial_l_scale[j, i] = partial_l_scale_entry
+            partial_sigma_0_sq[i, j] = partial_sigma_0_sq_entry
+            partial_sigma_0_sq[j, i] = partial_sigma_0_sq_entry
+
+        k_mat[i, i] = sigma_0_sq + sigma_n_sq
+        partial_l_scale[i, i] = 0.0
+        partial_sigma_0_sq[i, i] = 1.0
+
     # calculate first the cholesky decomposition
     cholesky_k_mat = cholesky(k_mat)
 
@@ -390,12 +464,28 @@ def matern_3_2(x_train_mat, hyper_param_lst):
     return (k_mat, cholesky_k_mat, partial_derivatives_hyper_params_lst)
 
 
+@jit(nopython=True)
+def covariance_matern_3_2(squared_distance_mat, hyper_param_lst):
+    """Evaluate the Matern 3/2 covariance function between two sets of points.
+
+    Args:
+        squared_distance_mat (np.array): Squared distances between the two sets of points
+        hyper_param_lst (lst): List with the hyper-parameters of the kernel
+
+    Returns:
+        k_mat (np.array): Covariance matrix between the two sets of points without noise
+    """
+    sigma_0_sq, l_scale, _ = hyper_param_lst
+    scaled_delta_mat = np.sqrt(3.0 * squared_distance_mat) / l_scale
+    k_mat = sigma_0_sq * (1 + scaled_delta_mat) * np.exp(-scaled_delta_mat)
+    return k_mat
+
+
 @jit(nopython=True)
 def posterior_mean_matern_3_2(
-    k_mat_inv,
+    alpha_vec,
     x_test_mat,
     x_train_mat,
-    y_train_vec,
     hyper_param_lst,
 ):
     """Jit the posterior mean function of the Gaussian Process.
@@ -403,13 +493,12 @@ def posterior_mean_matern_3_2(
     The mean function is based on the Matern 3/2 covariance function.
 
     Args:
-        k_mat_inv (np.array): Inverse of the assembled covariance matrix
+        alpha_vec (np.array): Weights of the training points, i.e., the inverse of the
+                              covariance matrix applied to the training outputs
         x_test_mat (np.array): Testing input points for the GP. Individual samples row-wise,
                     columns correspond to different dimensions.
         x_train_mat (np.array): Training input points for the GP. Individual samples row-wise,
                                 columns correspond to different dimensions.
-        y_train_vec (np.array): Training outputs for the GP. Column vector where rows correspond
-                                to different samples.
         hyper_param_lst (lst): List with the hyper-parameters of the kernel
 
     Returns:
@@ -417,24 +506,17 @@ def posterior_mean_matern_3_2(
     """
     sigma_0_sq, l_scale, _ = hyper_param_lst
 
-    k_vec = np.zeros((x_train_mat.shape[0], x_test_mat.shape[0]), dtype=np.float64)
-    for j, x_test in enumerate(x_test_mat):
-        for i, x_train in enumerate(x_train_mat):
-            delta = np.linalg.norm(x_test - x_train)
-            k_vec[i, j] = (
-                sigma_0_sq
-                * (1 + np.sqrt(3) * delta / l_scale)
-                * np.exp(-np.sqrt(3) * delta / l_scale)
-            )
+    scaled_delta_mat = np.sqrt(3.0 * squared_distances(x_train_mat, x_test_mat)) / l_scale
+    k_vec = sigma_0_sq * (1 + scaled_delta_mat) * np.exp(-scaled_delta_mat)
 
-    mu_vec = np.dot(np.dot(k_vec.T, k_mat_inv), (y_train_vec))
+    mu_vec = np.dot(k_vec.T, alpha_vec)
 
     return mu_vec
 
 
 @jit(nopython=True)
 def posterior_var_matern_3_2(
-    k_mat_inv,
+    cholesky_k_mat,
     x_test_mat,
     x_train_mat,
     hyper_param_lst,
@@ -445,7 +527,7 @@ def posterior_var_matern_3_2(
     The posterior is based on the Matern 3/2 kernel.
 
     Args:
-        k_mat_inv (np.array): Inverse of the assembled covariance matrix
+        cholesky_k_mat (np.array): Lower Cholesky decomposition of the covariance matrix
         x_test_mat (np.array): Testing input points for the GP. Individual samples row-wise,
                     columns correspond to different dimensions.
         x_train_mat (np.array): Training input points for the GP. Individual samples row-wise,
@@ -460,29 +542,12 @@ def posterior_var_matern_3_2(
                                             at the testing points x_test_vec
     """
     sigma_0_sq, l_scale, sigma_n_sq = hyper_param_lst
-    k_mat_test_train = np.zeros((x_train_mat.shape[0], x_test_mat.shape[0]), dtype=np.float64)
-    for j, x_test in enumerate(x_test_mat):
-        for i, x_train in enumerate(x_train_mat):
-            delta = np.linalg.norm(x_test - x_train)
-            k_mat_test_train[i, j] = (
-                sigma_0_sq
-                * (1 + np.sqrt(3) * delta / l_scale)
-                * np.exp(-np.sqrt(3) * delta / l_scale)
-            )
+    scaled_delta_mat = np.sqrt(3.0 * squared_distances(x_train_mat, x_test_mat)) / l_scale
+    k_mat_test_train = sigma_0_sq * (1 + scaled_delta_mat) * np.exp(-scaled_delta_mat)
 
-    k_mat_test = np.zeros((x_test_mat.shape[0], x_test_mat.shape[0]), dtype=np.float64)
-    for j, x_test1 in enumerate(x_test_mat):
-        for i, x_test2 in enumerate(x_test_mat):
-            delta = np.linalg.norm(x_test1 - x_test2)
-            k_mat_test[i, j] = (
-                sigma_0_sq
-                * (1 + np.sqrt(3) * delta / l_scale)
-                * np.exp(-np.sqrt(3) * delta / l_scale)
-            )
-
-    posterior_variance_vec = np.diag(
-        k_mat_test - np.dot(np.dot(k_mat_test_train.T, k_mat_inv), k_mat_test_train)
-    )
+    # only the diagonal of the prior covariance of the testing points is required
+    v_mat = forward_substitution(cholesky_k_mat, k_mat_test_train)
+    posterior_variance_vec = sigma_0_sq - np.sum(v_mat**2, axis=0)
 
     if support == "y":
         posterior_variance_vec = posterior_variance_vec + sigma_n_sq
@@ -544,16 +609,16 @@ def grad_log_evidence_matern_3_2(
 
     data_minus_prior_mean = y_train_vec - x_train_vec
     alpha = np.dot(k_mat_inv, data_minus_prior_mean)
+    outer_minus_inv = np.dot(alpha, alpha.T) - k_mat_inv
 
-    grad_ev_sigma_0_sq_param = 0.5 * np.trace(
-        (np.dot(alpha, alpha.T) - k_mat_inv) @ (partial_sigma_0_sq) * np.exp(sigma_0_sq_param)
-    )
-    grad_ev_sigma_n_sq_param = 0.5 * np.trace(
-        (np.dot(alpha, alpha.T) - k_mat_inv) @ (partial_sigma_n_sq) * np.exp(sigma_n_sq_param)
+    # the trace of a product of symmetric matrices is the sum of their elementwise product
+    grad_ev_sigma_0_sq_param = (
+        0.5 * np.sum(outer_minus_inv * partial_sigma_0_sq) * np.exp(sigma_0_sq_param)
     )
-    grad_ev_l_scale_param = 0.5 * np.trace(
-        (np.dot(alpha, alpha.T) - k_mat_inv) @ (partial_l_scale) * np.exp(l_scale_param)
+    grad_ev_sigma_n_sq_param = (
+        0.5 * np.sum(outer_minus_inv * partial_sigma_n_sq) * np.exp(sigma_n_sq_param)
     )
+    grad_ev_l_scale_param = 0.5 * np.sum(outer_minus_inv * partial_l_scale) * np.exp(l_scale_param)
     grad = np.array(
         [grad_ev_sigma_0_sq_param, grad_ev_l_scale_param, grad_ev_sigma_n_sq_param]
     ).flatten()
@@ -21,7 +21,7 @@ from typing import Any, Protocol, runtime_checkable
 
 import numpy as np
 
-from queens.distributions import Continuous, Discrete
+from queens.distributions import Continuous, Discrete, Normal, Uniform
 from queens.parameters.random_fields._random_field import RandomField
 from queens.utils.logger_settings import log_init_args
 
@@ -114,6 +114,55 @@ class Parameters:
         self.num_parameters = joint_parameters_dim
         self.random_field_flag = random_field_flag
         self.names = list(parameters.keys())
+        self._compile_joint_logpdf()
+
+    def _compile_joint_logpdf(self) -> None:
+        """Prepare the evaluation of the joint log-PDF and its gradient.
+
+        Normal parameters with diagonal covariance and Uniform parameters are grouped such that
+        their log-PDFs and gradients are evaluated in one vectorized operation per group, with the
+        constants and column indices precomputed here. All other parameters are evaluated
+        individually on their precomputed column slices. The distributions of the parameters are
+        assumed to be fixed after construction.
+        """
+        normal_indices = [np.zeros(0, dtype=int)]
+        normal_means, normal_variances = [np.zeros(0)], [np.zeros(0)]
+        normal_logpdf_const = 0.0
+        uniform_indices = [np.zeros(0, dtype=int)]
+        uniform_lower_bounds, uniform_upper_bounds = [np.zeros(0)], [np.zeros(0)]
+        uniform_logpdf_const = 0.0
+        other_parameters: list[tuple[Continuous | Discrete | RandomField, slice]] = []
+
+        start = 0
+        for parameter in self.to_list():
+            end = start + parameter.dimension
+            indices = np.arange(start, end)
+            # Only the exact types qualify for the grouped evaluation, since subclasses might
+            # override the log-PDF. Hence, isinstance cannot be used.
+            # pylint: disable-next=unidiomatic-typecheck
+            if type(parameter) is Normal and parameter.variances is not None:
+                normal_indices.append(indices)
+                normal_means.append(parameter.mean)
+                normal_variances.append(parameter.variances)
+                normal_logpdf_const += parameter.logpdf_const
+            elif type(parameter) is Uniform:  # pylint: disable=unidiomatic-typecheck
+                uniform_indices.append(indices)
+                uniform_lower_bounds.append(parameter.lower_bound)
+                uniform_upper_bounds.append(parameter.upper_bound)
+                uniform_logpdf_const += parameter.logpdf_const
+            else:
+                other_parameters.append((parameter, slice(start, end)))
+            start = end
+
+        self._normal_indices = np.concatenate(normal_indices)
+        self._normal_means = np.concatenate(normal_means)
+        self._normal_variances = np.concatenate(normal_variances)
+        self._normal_logpdf_const = normal_logpdf_const
+        self._uniform_indices = np.concatenate(uniform_indices)
+        self._uniform_lower_bounds = np.concatenate(uniform_lower_bounds)
+        self._uniform_upper_bounds = np.concatenate(uniform_upper_bounds)
+        self._uniform_logpdf_const = uniform_logpdf_const
+        self._other_parameters = other_parameters
 
     def draw_samples(self, num_samples: int) -> np.ndarray:
         """Draw samples from all parameters.
@@ -147,14 +196,22 @@ class Parameters:
             Log-PDF summed over all parameters
         """
         samples = samples.reshape(-1, self.num_parameters)
-        logpdf = np.zeros_like(samples[:, 0], dtype=float)
-        i = 0
-        for parameter in self.to_list():
-            if parameter.dimension is None:
-                raise ValueError(f"Dimension of the parameter {parameter} is not set.")
-
-            logpdf += parameter.logpdf(samples[:, i : i + parameter.dimension])
-            i += parameter.dimension
+        logpdf = np.zeros(samples.shape[0])
+        if self._normal_indices.size:
+            dist = samples[:, self._normal_indices] - self._normal_means
+            logpdf += self._normal_logpdf_const - 0.5 * np.sum(
+                dist**2 / self._normal_variances, axis=1
+            )
+        if self._uniform_indices.size:
+            uniform_samples = samples[:, self._uniform_indices]
+            within_bounds = np.all(
+                (uniform_samples >= self._uniform_lower_bounds)
+                & (uniform_samples <= self._uniform_upper_bounds),
+                axis=1,
+            )
+            logpdf += np.where(within_bounds, self._uniform_logpdf_const, -np.inf)
+        for parameter, columns in self._other_parameters:
+            logpdf += parameter.logpdf(samples[:, columns])
         return logpdf
 
     def grad_joint_logpdf(self, samples: np.ndarray) -> np.ndarray:
@@ -169,17 +226,16 @@ class Parameters:
         """
         samples = samples.reshape(-1, self.num_parameters)
         grad_logpdf = np.zeros(samples.shape)
-        j = 0
-        for parameter in self.to_list():
-            if parameter.dimension is None:
-                raise ValueError(f"Dimension of the parameter {parameter} is not set.")
+        if self._normal_indices.size:
+            grad_logpdf[:, self._normal_indices] = (
+                self._normal_means - samples[:, self._normal_indices]
+            ) / self._normal_variances
+        # the gradient of the Uniform log-PDF is zero everywhere
+        for parameter, columns in self._other_parameters:
             if not isinstance(parameter, HasGradLogPDF):
                 raise ValueError(f"Parameter {parameter} does not have a grad_logpdf function.")
 
-            grad_logpdf[:, j : j + parameter.dimension] = parameter.grad_logpdf(
-                samples[:, j : j + parameter.dimension]
-            )
-            j += parameter.dimension
+            grad_logpdf[:, columns] = parameter.grad_logpdf(samples[:, columns])
         return grad_logpdf
 
     def latent_grad(self, upstream_gradient: np.ndarray) -> np.ndarray:
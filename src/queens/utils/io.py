@@ -139,6 +139,9 @@ def load_result(path_to_result_file: Path) -> Any:
     """
     path_to_result_file = Path(path_to_result_file)
     results = load_pickle(path_to_result_file)
+    if hasattr(results, "set_result_dir"):
+        # results split into several files locate them relative to the result file
+        results.set_result_dir(path_to_result_file.parent)
     return results
 
 
@@ -48,6 +48,7 @@ def minimize(
     tol: float | None = None,
     callback: Callable | None = None,
     options: dict | None = None,
+    jac: Callable | None = None,
 ) -> "OptimizeResult":
     """A simple wrapper for scipy.optimize.minimize using JAX.
 
@@ -119,6 +120,8 @@ def minimize(
             execution is terminated.
             For all the other methods, the signature is: ```callback(xk)``` where `xk` is the
             current parameter vector, represented as a PyTree.
+        jac: Jitted gradient of `fun` w.r.t. its first argument. Passing it allows to reuse the
+            compiled gradient across minimizations. If None, the gradient is traced and compiled.
 
     Returns:
         The optimization result represented as a ``OptimizeResult`` object.
@@ -138,7 +141,8 @@ def minimize(
         return float(fun(x, *args))
 
     # Wrap the gradient in a similar manner
-    jac = jit(grad(fun))
+    if jac is None:
+        jac = jit(grad(fun))
 
     def jac_wrapper(x_flat: Any, *args: Any) -> np.ndarray:
         x = unravel(x_flat)
@@ -53,6 +53,23 @@ def at_least_3d(arr: np.ndarray) -> np.ndarray:
     return arr
 
 
+def row_keys(rows: ArrayLike) -> np.ndarray:
+    """Represent each row of a 2D array by a single key.
+
+    Equal rows have equal keys, where negative zeros are treated as zeros. The keys can be sorted
+    and searched, and their bytes (e.g., from *tolist()*) are hashable.
+
+    Args:
+        rows: Rows of a 2D array (a 1D array is treated as a single row)
+
+    Returns:
+        Keys of the rows
+    """
+    # adding zero maps -0.0 to 0.0 such that equal rows have identical bytes
+    rows = np.ascontiguousarray(np.atleast_2d(np.asarray(rows, dtype=float)) + 0.0)
+    return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).reshape(-1)
+
+
 def extract_block_diag(array: np.ndarray, block_size: int) -> np.ndarray:
     """Extract block diagonals of square 2D Array.
 
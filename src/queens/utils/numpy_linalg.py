@@ -17,6 +17,7 @@
 import logging
 
 import numpy as np
+from scipy.linalg import solve_triangular
 
 _logger = logging.getLogger(__name__)
 
@@ -71,3 +72,76 @@ def add_nugget_to_diagonal(matrix: np.ndarray, nugget_value: np.generic | float)
     nugget_diag = np.where(np.diag(matrix) < nugget_value, nugget_value, 0)
     matrix += np.diag(nugget_diag)
     return matrix
+
+
+def cholesky_rank_one_update(
+    low_chol: np.ndarray, vector: np.ndarray, downdate: bool = False
+) -> np.ndarray:
+    r"""Rank-one update of a lower-triangular Cholesky factor.
+
+    Computes the Cholesky factor of :math:`LL^T \pm vv^T` in :math:`\mathcal{O}(d^2)` operations
+    instead of refactorizing the updated matrix in :math:`\mathcal{O}(d^3)` operations.
+
+    Args:
+        low_chol: Lower-triangular Cholesky factor :math:`L`
+        vector: Update vector :math:`v`
+        downdate: If True, compute the factor of :math:`LL^T - vv^T` instead
+
+    Returns:
+        Updated lower-triangular Cholesky factor
+    """
+    low_chol = np.array(low_chol, dtype=float)
+    vector = np.array(vector, dtype=float).reshape(-1)
+    sign = -1.0 if downdate else 1.0
+    for k in range(vector.shape[0]):
+        diagonal_entry_squared = low_chol[k, k] ** 2 + sign * vector[k] ** 2
+        if diagonal_entry_squared <= 0.0:
+            raise np.linalg.LinAlgError(
+                "Cholesky downdate failed since the resulting matrix is not positive definite!"
+            )
+        diagonal_entry = np.sqrt(diagonal_entry_squared)
+        cosine = diagonal_entry / low_chol[k, k]
+        sine = vector[k] / low_chol[k, k]
+        low_chol[k, k] = diagonal_entry
+        low_chol[k + 1 :, k] = (low_chol[k + 1 :, k] + sign * sine * vector[k + 1 :]) / cosine
+        vector[k + 1 :] = cosine * vector[k + 1 :] - sine * low_chol[k + 1 :, k]
+    return low_chol
+
+
+def extend_cholesky(
+    low_chol: np.ndarray,
+    cross_matrix: np.ndarray,
+    new_matrix: np.ndarray,
+    jitter_start_value: np.generic | float = 1e-10,
+) -> np.ndarray:
+    r"""Extend a lower-triangular Cholesky factor by new rows and columns.
+
+    Computes the Cholesky factor of the block matrix :math:`[[A, B^T], [B, C]]` from the factor
+    :math:`L` of :math:`A` in :math:`\mathcal{O}(d^2k)` operations, where :math:`k` is the number
+    of appended rows, instead of refactorizing the whole matrix in :math:`\mathcal{O}(d^3)`
+    operations.
+
+    If the decomposition of the Schur complement :math:`C - L_B L_B^T` with
+    :math:`L_B = B L^{-T}` fails, a jitter is only added to its diagonal, i.e., to the diagonal of
+    the new block :math:`C`, as in *safe_cholesky*.
+
+    Args:
+        low_chol: Lower-triangular Cholesky factor :math:`L` of :math:`A`
+        cross_matrix: Off-diagonal block :math:`B` of shape (k, d)
+        new_matrix: Diagonal block :math:`C` of shape (k, k)
+        jitter_start_value: Starting value of the jitter added to the diagonal of the Schur
+                            complement if its decomposition fails
+
+    Returns:
+        Lower-triangular Cholesky factor of the extended matrix
+    """
+    low_chol_cross = solve_triangular(low_chol, cross_matrix.T, lower=True, check_finite=False).T
+    schur_complement = new_matrix - np.dot(low_chol_cross, low_chol_cross.T)
+    low_chol_new = safe_cholesky(schur_complement, jitter_start_value)
+
+    num_old, num_new = low_chol.shape[0], low_chol_new.shape[0]
+    extended_low_chol = np.zeros((num_old + num_new, num_old + num_new))
+    extended_low_chol[:num_old, :num_old] = low_chol
+    extended_low_chol[num_old:, :num_old] = low_chol_cross
+    extended_low_chol[num_old:, num_old:] = low_chol_new
+    return extended_low_chol
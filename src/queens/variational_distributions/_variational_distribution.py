@@ -16,6 +16,8 @@
 
 import abc
 
+import numpy as np
+
 
 class Variational:
     """Base class for probability distributions for variational inference.
@@ -85,6 +87,24 @@ class Variational:
             variational_parameters (np.ndarray):  variational parameters (1 x n_params)
         """
 
+    def natural_gradient(self, variational_parameters, gradient, dampening_coefficient=0.0):
+        """Precondition a gradient with the inverse Fisher information matrix.
+
+        Solves *(FIM + dampening_coefficient * I) x = gradient*. Distributions with a
+        structured Fisher information matrix override this method to avoid the dense solve.
+
+        Args:
+            variational_parameters (np.ndarray): Variational parameters
+            gradient (np.ndarray): Gradient w.r.t. the variational parameters (n_params)
+            dampening_coefficient (float, optional): Nugget added to the diagonal of the FIM
+
+        Returns:
+            natural_gradient (np.ndarray): Natural gradient (n_params)
+        """
+        fim = self.fisher_information_matrix(variational_parameters)
+        fim = fim + np.eye(len(fim)) * dampening_coefficient
+        return np.linalg.solve(fim, gradient)
+
     @abc.abstractmethod
     def initialize_variational_parameters(self, random=False):
         """Initialize variational parameters.
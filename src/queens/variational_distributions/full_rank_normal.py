@@ -16,7 +16,6 @@
 
 import numpy as np
 import scipy
-from numba import njit
 
 from queens.utils.logger_settings import log_init_args
 from queens.variational_distributions._variational_distribution import Variational
@@ -38,6 +37,9 @@ class FullRankNormal(Variational):
 
     Attributes:
         n_parameters (int): Number of parameters used in the parameterization.
+        distribution_parameters_cache (tuple): Variational parameters (as bytes) of the last
+                                               reconstruction and the corresponding mean,
+                                               covariance and Cholesky factor.
     """
 
     @log_init_args
@@ -49,6 +51,7 @@ class FullRankNormal(Variational):
         """
         super().__init__(dimension)
         self.n_parameters = (dimension * (dimension + 1)) // 2 + dimension
+        self.distribution_parameters_cache = (None, None)
 
     def initialize_variational_parameters(self, random=False):
         r"""Initialize variational parameters.
@@ -132,6 +135,30 @@ class FullRankNormal(Variational):
 
         return mean, cov
 
+    def _cached_distribution_parameters(self, variational_parameters):
+        """Reconstruct mean value, covariance and Cholesky factor with a cache.
+
+        The logpdf, the score function and the sample gradient are typically evaluated for the
+        same variational parameters, such that the last reconstruction is reused. The returned
+        arrays must not be modified.
+
+        Args:
+            variational_parameters (np.ndarray): Variational parameters
+
+        Returns:
+            mean (np.ndarray): Mean value of the distribution (n_dim x 1)
+            cov (np.ndarray): Covariance of the distribution (n_dim x n_dim)
+            L (np.ndarray): Cholesky decomposition of the covariance matrix (n_dim x n_dim)
+        """
+        key = np.asarray(variational_parameters, dtype=float).tobytes()
+        cached_key, distribution_parameters = self.distribution_parameters_cache
+        if key != cached_key:
+            distribution_parameters = self.reconstruct_distribution_parameters(
+                variational_parameters, return_cholesky=True
+            )
+            self.distribution_parameters_cache = (key, distribution_parameters)
+        return distribution_parameters
+
     def _grad_reconstruct_distribution_parameters(self):
         """Gradient of the parameter reconstruction.
 
@@ -168,19 +195,14 @@ class FullRankNormal(Variational):
         Returns:
             logpdf (np.ndarray): Row vector of the logpdfs
         """
-        mean, cov, cholesky = self.reconstruct_distribution_parameters(
-            variational_parameters, return_cholesky=True
-        )
+        mean, _, cholesky = self._cached_distribution_parameters(variational_parameters)
         x = np.atleast_2d(x)
-        u = np.linalg.solve(cov, (x.T - mean))
-
-        def col_dot_prod(x, y):
-            return np.sum(x * y, axis=0)
+        u = scipy.linalg.solve_triangular(cholesky, x.T - mean, lower=True)
 
         logpdf = (
             -0.5 * self.dimension * np.log(2 * np.pi)
             - np.sum(np.log(np.abs(np.diag(cholesky))))
-            - 0.5 * col_dot_prod(x.T - mean, u)
+            - 0.5 * np.sum(u**2, axis=0)
         )
         return logpdf.flatten()
 
@@ -211,29 +233,18 @@ class FullRankNormal(Variational):
         Returns:
             score (np.ndarray): Column-wise scores
         """
-        mean, cov, cholesky = self.reconstruct_distribution_parameters(
-            variational_parameters, return_cholesky=True
-        )
+        mean, _, cholesky = self._cached_distribution_parameters(variational_parameters)
         x = np.atleast_2d(x)
         # Helper variable
-        q = np.linalg.solve(cov, x.T - mean)
-        dlogpdf_dmu = q.copy()
-        diag_indx = np.cumsum(np.arange(1, self.dimension + 1)) - 1
-        n_params_chol = (self.dimension * (self.dimension + 1)) // 2
-        dlogpdf_dsigma = np.zeros((n_params_chol, 1))
-        # Term due to determinant
-        dlogpdf_dsigma[diag_indx] = -1.0 / (np.diag(cholesky).reshape(-1, 1))
-        dlogpdf_dsigma = np.tile(dlogpdf_dsigma, (1, len(x)))
-        # Term due to normalization
+        q = scipy.linalg.cho_solve((cholesky, True), x.T - mean)
         b = np.matmul(cholesky.T, q)
-        indx = 0
-        f = np.zeros(dlogpdf_dsigma.shape)
-        for r in range(0, self.dimension):
-            for s in range(0, r + 1):
-                dlogpdf_dsigma[indx, :] += q[r, :] * b[s, :]
-                f[indx, :] += q[r, :] * b[s, :]
-                indx += 1
-        score = np.vstack((dlogpdf_dmu, dlogpdf_dsigma))
+        # Term due to normalization for the entries L_rs in row-wise order
+        rows, columns = np.tril_indices(self.dimension)
+        dlogpdf_dsigma = q[rows] * b[columns]
+        # Term due to determinant
+        diag_indx = np.cumsum(np.arange(1, self.dimension + 1)) - 1
+        dlogpdf_dsigma[diag_indx] -= 1.0 / np.diag(cholesky).reshape(-1, 1)
+        score = np.vstack((q, dlogpdf_dsigma))
         return score
 
     def total_grad_params_logpdf(self, variational_parameters, standard_normal_sample_batch):
@@ -269,19 +280,20 @@ class FullRankNormal(Variational):
             within one sample. (Third dimension is empty
             and just added to keep slices two-dimensional.)
         """
-        # pylint: disable-next=unbalanced-tuple-unpacking
-        mean, cov = self.reconstruct_distribution_parameters(variational_parameters)
-        gradient_lst = []
-        for sample in sample_batch:
-            gradient_lst.append(
-                np.dot(np.linalg.inv(cov), -(sample.reshape(-1, 1) - mean)).reshape(-1, 1)
-            )
-
-        gradients_batch = np.array(gradient_lst)
+        mean, _, cholesky = self._cached_distribution_parameters(variational_parameters)
+        gradients_batch = -scipy.linalg.cho_solve(
+            (cholesky, True), np.atleast_2d(sample_batch).T - mean
+        ).T
         return gradients_batch.reshape(sample_batch.shape)
 
     def fisher_information_matrix(self, variational_parameters):
-        """Compute the Fisher information matrix analytically.
+        r"""Compute the Fisher information matrix analytically.
+
+        Writing a perturbation of the Cholesky factor as :math:`dL=LX` with a lower triangular
+        matrix :math:`X`, the Fisher information of the Cholesky parameters reads
+        :math:`2\sum_i X_{ii}^2 + \sum_{i>j} X_{ij}^2`. Since every column of :math:`X` only
+        depends on the same column of :math:`dL`, the Cholesky block of the FIM is
+        block-diagonal with one block per column of :math:`L`.
 
         Args:
             variational_parameters (np.ndarray): Variational parameters
@@ -292,38 +304,86 @@ class FullRankNormal(Variational):
         _, cov, cholesky = self.reconstruct_distribution_parameters(
             variational_parameters, return_cholesky=True
         )
+        mu_block = np.linalg.inv(cov + 1e-8 * np.eye(len(cov)))
 
-        def fim_blocks(dimension):
-            """Compute the blocks of the FIM."""
-            mu_block = np.linalg.inv(cov + 1e-8 * np.eye(len(cov)))
-            n_params_chol = (dimension * (dimension + 1)) // 2
-            sigma_block = np.zeros((n_params_chol, n_params_chol))
-            matrix_list = []
-            # Improvements of this implementation are welcomed!
-            for r in range(0, dimension):
-                for s in range(0, r + 1):
-                    matrix_q = np.zeros(cholesky.shape)
-                    matrix_q[r, s] = 1
-                    matrix_q = cholesky @ matrix_q.T
-                    matrix_q = np.linalg.solve(cov, matrix_q + matrix_q.T)
-                    matrix_list.append(matrix_q)
-            for p in range(n_params_chol):
-                for q in range(p + 1):
-                    val = 0.5 * np.trace(matrix_list[p] @ matrix_list[q])
-                    sigma_block[p, q] = val
-                    sigma_block[q, p] = val
-            return mu_block, sigma_block
-
-        # Using jit is useful in higher dimensional cases but introduces an computational overhead
-        # for lowerdimensional cases. Doing some tests showed that the break evenpoint is reached
-        # at around dimension 35
-        if self.dimension < 35:
-            mu_block, sigma_block = fim_blocks(self.dimension)
-        else:
-            mu_block, sigma_block = njit(fim_blocks)(self.dimension)
+        n_params_chol = (self.dimension * (self.dimension + 1)) // 2
+        sigma_block = np.zeros((n_params_chol, n_params_chol))
+        for column, column_indices in enumerate(self._cholesky_column_indices()):
+            inverse_cholesky = scipy.linalg.solve_triangular(
+                cholesky[column:, column:], np.eye(self.dimension - column), lower=True
+            )
+            weights = self._cholesky_column_fisher_weights(column)
+            sigma_block[np.ix_(column_indices, column_indices)] = inverse_cholesky.T @ (
+                weights[:, np.newaxis] * inverse_cholesky
+            )
 
         return scipy.linalg.block_diag(mu_block, sigma_block)
 
+    def natural_gradient(self, variational_parameters, gradient, dampening_coefficient=0.0):
+        r"""Precondition a gradient with the inverse Fisher information matrix.
+
+        Exploits the block structure of the FIM (see *fisher_information_matrix*): The mean block
+        is solved with the covariance matrix and the Cholesky block column-wise with
+        :math:`(L_c^{-T} W_c L_c^{-1} + \delta I)^{-1} = L_c (W_c + \delta L_c^T L_c)^{-1} L_c^T`,
+        where :math:`L_c` is the trailing block of :math:`L` of column :math:`c`. The dense FIM
+        is never assembled.
+
+        Args:
+            variational_parameters (np.ndarray): Variational parameters
+            gradient (np.ndarray): Gradient w.r.t. the variational parameters (n_params)
+            dampening_coefficient (float, optional): Nugget added to the diagonal of the FIM
+
+        Returns:
+            natural_gradient (np.ndarray): Natural gradient (n_params)
+        """
+        _, cov, cholesky = self.reconstruct_distribution_parameters(
+            variational_parameters, return_cholesky=True
+        )
+        natural_gradient = np.zeros(gradient.shape)
+
+        # mean block: (A^-1 + d I) x = g  <=>  (I + d A) x = A g  with A = cov + 1e-8 I
+        cov_jitter = cov + 1e-8 * np.eye(self.dimension)
+        natural_gradient[: self.dimension] = np.linalg.solve(
+            np.eye(self.dimension) + dampening_coefficient * cov_jitter,
+            cov_jitter @ gradient[: self.dimension],
+        )
+
+        gradient_cholesky = gradient[self.dimension :]
+        natural_gradient_cholesky = natural_gradient[self.dimension :]
+        for column, column_indices in enumerate(self._cholesky_column_indices()):
+            cholesky_column = cholesky[column:, column:]
+            system_matrix = np.diag(
+                self._cholesky_column_fisher_weights(column)
+            ) + dampening_coefficient * (cholesky_column.T @ cholesky_column)
+            natural_gradient_cholesky[column_indices] = cholesky_column @ scipy.linalg.solve(
+                system_matrix, cholesky_column.T @ gradient_cholesky[column_indices], assume_a="pos"
+            )
+
+        return natural_gradient
+
+    def _cholesky_column_indices(self):
+        r"""Indices of the Cholesky parameters per column of the Cholesky factor.
+
+        Returns:
+            column_indices (list): Parameter indices of the entries :math:`L_{rc}, r \geq c` for
+                                   every column :math:`c`
+        """
+        rows = np.arange(self.dimension)
+        return [rows[column:] * (rows[column:] + 1) // 2 + column for column in rows]
+
+    def _cholesky_column_fisher_weights(self, column):
+        """Weights of the column-wise Fisher information of the Cholesky parameters.
+
+        Args:
+            column (int): Column of the Cholesky factor
+
+        Returns:
+            weights (np.ndarray): Weight 2 for the diagonal entry and 1 below
+        """
+        weights = np.ones(self.dimension - column)
+        weights[0] = 2.0
+        return weights
+
     def export_dict(self, variational_parameters):
         """Create a dict of the distribution based on the given parameters.
 
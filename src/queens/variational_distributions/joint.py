@@ -271,6 +271,30 @@ class Joint(Variational):
 
         return scipy.linalg.block_diag(*fim)
 
+    def natural_gradient(self, variational_parameters, gradient, dampening_coefficient=0.0):
+        """Precondition a gradient with the inverse Fisher information matrix.
+
+        The FIM is block-diagonal, such that the solve is conducted per subdistribution.
+
+        Args:
+            variational_parameters (np.ndarray): Variational parameters
+            gradient (np.ndarray): Gradient w.r.t. the variational parameters (n_params)
+            dampening_coefficient (float, optional): Nugget added to the diagonal of the FIM
+
+        Returns:
+            natural_gradient (np.ndarray): Natural gradient (n_params)
+        """
+        natural_gradient = []
+        for (parameters, distribution), sub_gradient in zip(
+            self._zip_variational_parameters_distributions(variational_parameters),
+            split_array_by_chunk_sizes(gradient, self.distributions_n_parameters),
+            strict=True,
+        ):
+            natural_gradient.append(
+                distribution.natural_gradient(parameters, sub_gradient, dampening_coefficient)
+            )
+        return np.concatenate(natural_gradient)
+
     def export_dict(self, variational_parameters):
         """Create a dict of the distribution based on the given parameters.
 
@@ -246,9 +246,36 @@ class MeanFieldNormal(Variational):
         Returns:
             FIM (np.ndarray): Matrix (n_parameters x n_parameters)
         """
+        return np.diag(self._fisher_information_diagonal(variational_parameters))
+
+    def _fisher_information_diagonal(self, variational_parameters):
+        """Diagonal of the Fisher information matrix.
+
+        Args:
+            variational_parameters (np.ndarray): Variational parameters
+
+        Returns:
+            fisher_diag (np.ndarray): Diagonal of the FIM (n_parameters)
+        """
         fisher_diag = np.exp(-2 * variational_parameters[self.dimension :])
         fisher_diag = np.hstack((fisher_diag, 2 * np.ones(self.dimension)))
-        return np.diag(fisher_diag)
+        return fisher_diag
+
+    def natural_gradient(self, variational_parameters, gradient, dampening_coefficient=0.0):
+        """Precondition a gradient with the inverse Fisher information matrix.
+
+        The FIM is diagonal, such that the solve reduces to an elementwise division.
+
+        Args:
+            variational_parameters (np.ndarray): Variational parameters
+            gradient (np.ndarray): Gradient w.r.t. the variational parameters (n_params)
+            dampening_coefficient (float, optional): Nugget added to the diagonal of the FIM
+
+        Returns:
+            natural_gradient (np.ndarray): Natural gradient (n_params)
+        """
+        fisher_diag = self._fisher_information_diagonal(variational_parameters)
+        return gradient / (fisher_diag + dampening_coefficient)
 
     def export_dict(self, variational_parameters):
         """Create a dict of the distribution based on the given parameters.
@@ -163,8 +163,9 @@ class MixtureModel(Variational):
         """Draw *n_draw* samples from the variational distribution.
 
         Uses a two-step process:
-            1. From a multinomial distribution, based on the weights, select a component
-            2. Sample from the selected component
+            1. From a categorical distribution, based on the weights, select a component for
+               every sample
+            2. Sample from the selected components, drawing all samples of a component at once
 
         Args:
             variational_parameters (np.ndarray): Variational parameters
@@ -176,14 +177,14 @@ class MixtureModel(Variational):
         parameters_list, weights = self._construct_component_variational_parameters(
             variational_parameters
         )
-        samples = []
-        for _ in range(n_draws):
-            # Select component to draw from
-            component = np.argmax(np.random.multinomial(1, weights))
-            # Draw a sample of this component
-            sample = self.base_distribution.draw(parameters_list[component], 1)
-            samples.append(sample)
-        samples = np.concatenate(samples, axis=0)
+        # Select the component to draw from for every sample
+        components = np.random.choice(self.n_components, size=n_draws, p=weights)
+        samples = np.empty((n_draws, self.dimension))
+        for component, n_draws_component in zip(*np.unique(components, return_counts=True)):
+            # Draw all samples of this component
+            samples[components == component] = self.base_distribution.draw(
+                parameters_list[component], n_draws_component
+            )
         return samples
 
     def logpdf(self, variational_parameters, x):
@@ -282,10 +283,7 @@ class MixtureModel(Variational):
         """
         samples = self.draw(variational_parameters, n_samples)
         scores = self.grad_params_logpdf(variational_parameters, samples)
-        fim = 0
-        for j in range(n_samples):
-            fim = fim + np.outer(scores[:, j], scores[:, j])
-        fim = fim / n_samples
+        fim = np.matmul(scores, scores.T) / n_samples
         return fim
 
     def export_dict(self, variational_parameters):
@@ -15,6 +15,7 @@
 """Integration tests for the Least Squares iterator."""
 
 import numpy as np
+import pytest
 
 from queens.distributions.free_variable import FreeVariable
 from queens.drivers.function import Function
@@ -193,3 +194,35 @@ def test_least_squares_trust_region_reflective_rosenbrock_error(global_settings)
 
     np.testing.assert_allclose(results.x, np.array([+1.0, +1.0, -0.001039]), rtol=1e-06, atol=1e-06)
     np.testing.assert_allclose(results.fun[:2], np.array([+0.0, +0.0]), rtol=1e-07, atol=0)
+
+
+@pytest.mark.parametrize("algorithm", ["trf", "lm", "dogbox"])
+def test_least_squares_broyden_rosenbrock60(algorithm, global_settings):
+    """Test the least squares iterator with Broyden updates of the Jacobian."""
+    # Parameters
+    x1 = FreeVariable(dimension=1)
+    x2 = FreeVariable(dimension=1)
+    parameters = Parameters(x1=x1, x2=x2)
+
+    # Setup iterator
+    driver = Function(parameters=parameters, function="rosenbrock60_residual")
+    scheduler = Pool(experiment_name=global_settings.experiment_name)
+    model = Simulation(scheduler=scheduler, driver=driver)
+    iterator = LeastSquares(
+        model=model,
+        parameters=parameters,
+        global_settings=global_settings,
+        initial_guess=[-3.0, -4.0],
+        result_description={"write_results": True},
+        algorithm=algorithm,
+        broyden_updates=3,
+    )
+
+    # Actual analysis
+    run_iterator(iterator, global_settings=global_settings)
+
+    # Load results
+    results = load_result(global_settings.result_file(".pickle"))
+
+    np.testing.assert_allclose(results.x, np.array([+1.0, +1.0]))
+    np.testing.assert_allclose(results.fun, np.array([+0.0, +0.0]), atol=1e-12)
@@ -18,6 +18,7 @@ The tests are based on the low-fidelity and the high-fidelity Borehole
 function.
 """
 
+import numpy as np
 import pytest
 
 from queens.distributions.uniform import Uniform
@@ -142,3 +143,31 @@ def test_mlmc_borehole_optimal_num_samples(global_settings, parameters, models):
     assert result["mean_estimators"] == pytest.approx([61.89127335, 16.06763486])
     assert result["var_estimators"] == pytest.approx([1290.91108238, 78.42313115])
     assert result["num_samples"] == pytest.approx([12716, 100])
+
+
+def test_mlmc_borehole_adaptive_continuation(global_settings, parameters, models):
+    """Test case for the iterator in the adaptive continuation mode."""
+    target_rmse = 1.0
+    # Set up iterator.
+    iterator_adaptive = MLMC(
+        seed=42,
+        num_samples=[1000, 100],
+        models=models,
+        parameters=parameters,
+        global_settings=global_settings,
+        cost_models=[1, 1000],
+        target_rmse=target_rmse,
+    )
+
+    # Run iterator and load results.
+    run_iterator(iterator=iterator_adaptive, global_settings=global_settings)
+    result = load_result(path_to_result_file=global_settings.result_file(".pickle"))
+
+    # Test outputs.
+    assert result["std"] <= target_rmse
+    assert result["num_samples"][0] >= 1000
+    assert result["num_samples"][1] >= 100
+    assert np.all(result["wall_time_models"] > 0)
+    assert [len(result_estimator) for result_estimator in result["result"]] == list(
+        result["num_samples"]
+    )
@@ -16,7 +16,9 @@
 
 import numpy as np
 import pytest
+from scipy.optimize import minimize
 
+from example_simulator_functions.rosenbrock60 import rosenbrock60
 from queens.distributions.free_variable import FreeVariable
 from queens.drivers.function import Function
 from queens.iterators.optimization import Optimization
@@ -62,6 +64,51 @@ def test_optimization_rosenbrock(algorithm, global_settings):
     np.testing.assert_allclose(results.fun, np.array(+0.0), atol=5.0e-07)
 
 
+@pytest.mark.parametrize("algorithm", ["L-BFGS-B", "NELDER-MEAD", "COBYLA"])
+def test_optimization_rosenbrock_multi_start(algorithm, global_settings, mocker):
+    """Test the lock-step multi-start optimization."""
+    parameters = Parameters(x1=FreeVariable(dimension=1), x2=FreeVariable(dimension=1))
+
+    # Setup iterator
+    model = Simulation(
+        scheduler=Pool(experiment_name=global_settings.experiment_name),
+        driver=Function(parameters=parameters, function="rosenbrock60"),
+    )
+    # the last start duplicates the first one and is stopped early
+    initial_guess = np.array([[-3.0, -4.0], [2.0, 3.0], [0.5, -1.0], [-3.0, -4.0]])
+    iterator = Optimization(
+        algorithm=algorithm,
+        initial_guess=initial_guess,
+        result_description={"write_results": True},
+        model=model,
+        parameters=parameters,
+        global_settings=global_settings,
+    )
+    spy_evaluate = mocker.spy(model, "evaluate")
+
+    # Actual analysis
+    run_iterator(iterator, global_settings=global_settings)
+
+    # Load results
+    results = load_result(global_settings.result_file(".pickle"))
+
+    assert len(iterator.solutions) == 4
+    assert iterator.solutions[3].status == -1
+    if algorithm == "COBYLA":
+        # COBYLA reaches its iteration limit on the Rosenbrock function, so the starts have to
+        # match independent runs
+        for solution, start in zip(iterator.solutions[:3], initial_guess):
+            reference_solution = minimize(lambda x: rosenbrock60(*x), start, method="COBYLA")
+            np.testing.assert_allclose(solution.x, reference_solution.x)
+        # COBYLA starts run one after another, the duplicate start is served from the cache
+        assert spy_evaluate.call_count <= sum(solution.nfev for solution in iterator.solutions[:3])
+    else:
+        np.testing.assert_allclose(results.x, np.array([+1.0, +1.0]), rtol=1.0e-3)
+        np.testing.assert_allclose(results.fun, np.array(+0.0), atol=5.0e-07)
+        # every model evaluation serves all active starts at once
+        assert spy_evaluate.call_count < sum(solution.nfev for solution in iterator.solutions[:3])
+
+
 @pytest.mark.parametrize(
     "algorithm",
     ["COBYLA", "SLSQP"],
@@ -110,3 +110,25 @@ def test_jitted_gaussian_process_two_dim(gp_model, training_data_park91a, testin
     assert_surrogate_model_output(
         output, mean_ref, var_ref, gradient_mean_ref, gradient_variance_ref, decimals
     )
+
+
+def test_jitted_gaussian_process_update(gp_model):
+    """Test incremental update of a trained jitted GP with new training points."""
+    x_train = np.linspace(-5, 5, 25).reshape(-1, 1)
+    y_train = sinus_test_fun(x_train)
+
+    gp_model.setup(x_train[:20], y_train[:20])
+    gp_model.train()
+    gp_model.update(x_train[20:], y_train[20:])
+    k_mat = gp_model.k_mat
+    cholesky_k_mat = gp_model.cholesky_k_mat
+    alpha = gp_model.alpha
+
+    # recompute the linear algebra on the extended training data from scratch
+    jitted_kernel = gp_model._get_jitted_objects()[0]  # pylint: disable=protected-access
+    gp_model._set_jitted_kernel(jitted_kernel)  # pylint: disable=protected-access
+
+    assert gp_model.x_train.shape == (25, 1)
+    np.testing.assert_allclose(k_mat, gp_model.k_mat, atol=1e-12)
+    np.testing.assert_allclose(cholesky_k_mat, gp_model.cholesky_k_mat, atol=1e-10)
+    np.testing.assert_allclose(alpha, gp_model.alpha, rtol=1e-6, atol=1e-8)
@@ -163,3 +163,53 @@ def test_logpdf_gaussian_process_park91a(
 
     np.testing.assert_allclose(mean, expected_mean[approx_type], rtol=5e-2)
     np.testing.assert_allclose(std, expected_std[approx_type], rtol=5e-1)
+
+
+def test_logpdf_gaussian_process_park91a_bucketed(
+    likelihood_model, parameters, expected_mean, expected_std, global_settings
+):
+    """Test for GP with IP park with training data padded to buckets."""
+    np.random.seed(41)
+    logpdf_gp_model = LogpdfGaussianProcess(
+        approx_type="GPMAP-I",
+        num_optimizations=3,
+        prior_rate=[1.0e-1, 10.0, 1.0e8],
+        quantile=0.90,
+        train_bucket_size=32,
+    )
+    adaptive_sampling_iterator = AdaptiveSampling(
+        model=logpdf_gp_model,
+        parameters=parameters,
+        global_settings=global_settings,
+        likelihood_model=likelihood_model,
+        initial_train_samples=parameters.draw_samples(8),
+        solving_iterator=SequentialMonteCarloChopin(
+            model=logpdf_gp_model,
+            parameters=parameters,
+            global_settings=global_settings,
+            seed=42,
+            waste_free=True,
+            feynman_kac_model="adaptive_tempering",
+            max_feval=1_000_000_000,
+            num_particles=3000,
+            num_rejuvenation_steps=30,
+            resampling_method="residual",
+            resampling_threshold=0.5,
+            result_description={},
+        ),
+        num_new_samples=4,
+        num_steps=4,
+    )
+
+    run_iterator(adaptive_sampling_iterator, global_settings)
+
+    results = load_result(global_settings.result_file(".pickle"))
+    particles = results["particles"][-1]
+    weights = results["weights"][-1]
+    mean = np.average(particles, weights=weights, axis=0)
+    std = np.average((particles - mean) ** 2, weights=weights, axis=0) ** (1 / 2)
+
+    # the at most 24 training samples of all steps are padded to one bucket of 32 samples
+    assert logpdf_gp_model.jit_func_generate_output.keywords["x_train"].shape[0] == 32
+    np.testing.assert_allclose(mean, expected_mean["GPMAP-I"], rtol=5e-2)
+    np.testing.assert_allclose(std, expected_std["GPMAP-I"], rtol=5e-1)
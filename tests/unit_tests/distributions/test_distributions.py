@@ -29,12 +29,23 @@ def test_create_export_dict():
         "covariance": np.array([[1.0]]),
         "dimension": 1,
         "low_chol": np.array([[1.0]]),
-        "precision": np.array([[1.0]]),
+        "variances": np.array([1.0]),
         "logpdf_const": np.array([-0.9189385332046728]),
     }
+    assert len(exported_dict) == len(ref_dict)
     for (key, value), (key_ref, value_ref) in zip(exported_dict.items(), ref_dict.items()):
         assert key == key_ref
         if key == "type":
             assert value == value_ref
         else:
             np.testing.assert_allclose(value, value_ref)
+
+
+def test_export_dict_excludes_cached_precision():
+    """Test that the cached precision matrix is not exported."""
+    distribution = Normal(mean=[0.0, 1.0], covariance=[[2.0, 0.5], [0.5, 1.0]])
+    exported_dict = distribution.export_dict()
+
+    np.testing.assert_allclose(distribution.precision, np.linalg.inv(distribution.covariance))
+    assert distribution.export_dict().keys() == exported_dict.keys()
+    assert "_precision" not in exported_dict
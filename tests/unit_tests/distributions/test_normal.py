@@ -229,6 +229,38 @@ def test_ppf_normal_3d(normal_3d):
         normal_3d.ppf(np.zeros(2))
 
 
+def test_logpdf_normal_3d_diagonal(mean_3d, sample_pos_3d):
+    """Test logpdf and grad_logpdf for a diagonal covariance matrix."""
+    covariance = np.diag([1.0, 4.0, 9.0])
+    normal = Normal(mean=mean_3d, covariance=covariance)
+    sample_pos_3d = sample_pos_3d.reshape(-1, 3)
+    ref_logpdf = scipy.stats.multivariate_normal.logpdf(sample_pos_3d, mean=mean_3d, cov=covariance)
+    ref_grad_logpdf = np.dot(mean_3d - sample_pos_3d, np.linalg.inv(covariance))
+    np.testing.assert_allclose(normal.variances, np.diag(covariance))
+    np.testing.assert_allclose(normal.logpdf(sample_pos_3d), ref_logpdf)
+    np.testing.assert_allclose(normal.grad_logpdf(sample_pos_3d), ref_grad_logpdf)
+
+
+def test_low_rank_update_normal_3d(mean_3d, covariance_3d, sample_pos_3d):
+    """Test low-rank update and downdate of the covariance matrix."""
+    normal = Normal(mean=mean_3d, covariance=covariance_3d)
+    low_rank_factor = np.array([[1.0, 0.5], [-0.2, 0.0], [0.3, 1.0]])
+    updated_covariance = covariance_3d + np.dot(low_rank_factor, low_rank_factor.T)
+    sample_pos_3d = sample_pos_3d.reshape(-1, 3)
+
+    normal.low_rank_update(low_rank_factor)
+    ref_sol = scipy.stats.multivariate_normal.logpdf(
+        sample_pos_3d, mean=mean_3d, cov=updated_covariance
+    )
+    np.testing.assert_allclose(normal.covariance, updated_covariance)
+    np.testing.assert_allclose(normal.low_chol, np.linalg.cholesky(updated_covariance))
+    np.testing.assert_allclose(normal.precision, np.linalg.inv(updated_covariance))
+    np.testing.assert_allclose(normal.logpdf(sample_pos_3d), ref_sol)
+
+    normal.low_rank_update(low_rank_factor, downdate=True)
+    np.testing.assert_allclose(normal.low_chol, np.linalg.cholesky(covariance_3d))
+
+
 def test_init_normal_wrong_dimension(mean_3d):
     """Test ValueError of init method of Normal Distribution class."""
     covariance = np.array([[[1.0, 0.1], [1.0, 0.1]], [[0.2, 2.0], [0.2, 2.0]]])
@@ -196,3 +196,20 @@ def test_ppf(reference_data, distribution):
     else:
         with pytest.raises(ValueError, match="Method does not support multivariate distributions!"):
             distribution.ppf(quantiles)
+
+
+def test_pdf_failure_unknown_event(reference_data, distribution):
+    """Test if events outside of the sample space lead to failure."""
+    _, _, _, reference_dimension, _ = reference_data
+    sample_location = np.full((1, reference_dimension), 10)
+    with pytest.raises(ValueError, match="At least one event is not part of the sample space"):
+        distribution.pdf(sample_location)
+
+
+def test_export_dict(distribution):
+    """Test that the sorted lookup caches are not exported."""
+    exported_dict = distribution.export_dict()
+
+    assert exported_dict["type"] == "Particle"
+    assert "cumulative_probabilities" in exported_dict
+    assert not {"_sorting_indices", "_sorted_event_keys"} & exported_dict.keys()
@@ -507,6 +507,36 @@ def test_evaluate_per_coordinate(default_bmfia_interface, mocker):
     np.testing.assert_array_equal(variance, np.array([[3, 5], [4, 6]]))
 
 
+def test_training_seeds_restore_global_rng(default_bmfia_interface, mocker):
+    """Test that seeding the training does not reset the global random number generator."""
+    training_draws = []
+    mapping = mocker.MagicMock()
+    mapping.train.side_effect = lambda: training_draws.append(np.random.random())
+    default_bmfia_interface.probabilistic_mapping_obj_lst = [mapping]
+    default_bmfia_interface.seed = 42
+
+    np.random.seed(0)
+    reference_draws = np.random.random(3)
+
+    np.random.seed(0)
+    default_bmfia_interface._train_probabilistic_mappings_serial()  # pylint: disable=protected-access
+    BmfiaInterface.optimize_hyper_params(mapping, seed=42)
+    np.testing.assert_array_equal(np.random.random(3), reference_draws)
+
+    # the training itself is seeded
+    np.random.seed(42)
+    assert training_draws == [np.random.random()] * 2
+
+
+def test_training_seeds(default_bmfia_interface, default_probabilistic_obj_lst):
+    """Test the seeds for the training of the mappings."""
+    default_bmfia_interface.probabilistic_mapping_obj_lst = default_probabilistic_obj_lst
+    assert default_bmfia_interface.training_seeds() == [None, None, None]
+
+    default_bmfia_interface.seed = 42
+    assert default_bmfia_interface.training_seeds() == [42, 43, 44]
+
+
 def test_evaluate_per_time_step(default_probabilistic_obj_lst, mocker):
     """Test the evaluation per time step."""
     # general inputs
@@ -14,17 +14,21 @@
 #
 """Unit tests for AdaptiveSampling iterator.
 
-Currently only tests the internal method _filter_failed_evaluations
-since there is an integration test covering the full functionality
-already.
+Currently only tests the internal method _filter_failed_evaluations,
+the filtering of new samples, the writing of results and the
+Cauchy-Schwarz divergence since there is an integration test covering
+the full functionality already.
 """
 
+import shutil
 from unittest.mock import Mock
 
 import numpy as np
 import pytest
 
-from queens.iterators.adaptive_sampling import AdaptiveSampling
+from queens.iterators import adaptive_sampling
+from queens.iterators.adaptive_sampling import AdaptiveSampling, cauchy_schwarz_divergence
+from queens.utils.io import load_pickle, load_result
 
 
 @pytest.fixture(name="adaptive_sampling_iterator")
@@ -136,3 +140,133 @@ def test_filter_failed_evaluations_multiple_calls(adaptive_sampling_iterator):
     np.testing.assert_array_equal(
         adaptive_sampling_iterator.x_train_failed, expected_x_train_failed
     )
+
+
+def test_write_results_per_step(adaptive_sampling_iterator, global_settings):
+    """Test that results are written per step and loaded lazily."""
+    np.random.seed(42)
+    particles = np.random.rand(10, 2)
+    weights = np.full(10, 0.1)
+    adaptive_sampling_iterator.write_results(particles, weights, np.zeros(10), 0)
+    adaptive_sampling_iterator.write_results(particles + 1.0, weights, np.ones(10), 1)
+
+    results = load_result(global_settings.result_file(".pickle"))
+
+    assert len(results["particles"]) == 2
+    np.testing.assert_array_equal(results["particles"][0], particles)
+    np.testing.assert_array_equal(results["particles"][-1], particles + 1.0)
+    np.testing.assert_array_equal(results["log_posterior"][-1], np.ones(10))
+    np.testing.assert_array_equal(
+        results["x_train_new"][-1], adaptive_sampling_iterator.x_train_new
+    )
+    cs_div = results["cs_div"][:]
+    assert np.isnan(cs_div[0])
+    assert cs_div[1] > 0
+
+
+def test_write_results_appends_training_data(
+    adaptive_sampling_iterator, global_settings, tmp_path_factory
+):
+    """Test that step files only contain new rows and are indexed relative to the result file."""
+    np.random.seed(42)
+    particles = np.random.rand(10, 2)
+    weights = np.full(10, 0.1)
+    x_train = np.random.rand(5, 2)
+    model_outputs = np.random.rand(5, 3)
+    for num_train in [2, 2, 5]:
+        adaptive_sampling_iterator.x_train = x_train[:num_train]
+        adaptive_sampling_iterator.model_outputs = model_outputs[:num_train]
+        adaptive_sampling_iterator.y_train = np.random.rand(num_train, 1)
+        adaptive_sampling_iterator.write_results(particles, weights, np.zeros(10), 0)
+
+    step_files = adaptive_sampling_iterator.step_files
+    assert [len(load_pickle(step_file)["x_train"]) for step_file in step_files] == [2, 0, 3]
+    assert len(load_pickle(step_files[-1])["y_train"]) == 5
+
+    moved_output_dir = tmp_path_factory.mktemp("moved")
+    shutil.copytree(global_settings.output_dir, moved_output_dir, dirs_exist_ok=True)
+    for step_file in step_files:
+        step_file.unlink()
+    results = load_result(moved_output_dir / global_settings.result_file(".pickle").name)
+
+    np.testing.assert_array_equal(results["x_train"][0], x_train[:2])
+    np.testing.assert_array_equal(results["x_train"][1], x_train[:2])
+    np.testing.assert_array_equal(results["x_train"][-1], x_train)
+    np.testing.assert_array_equal(results["model_outputs"][-1], model_outputs)
+    x_train_steps = results["x_train"][1:]
+    assert len(x_train_steps) == 2
+    np.testing.assert_array_equal(x_train_steps[-1], x_train)
+    assert results["x_train_failed"][-1].shape == (0, 2)
+    with pytest.raises(IndexError):
+        results["x_train"][3]  # pylint: disable=pointless-statement
+
+
+def test_restart_appends_training_data(adaptive_sampling_iterator, global_settings):
+    """Test that a restart continues appending new rows to the previous step files."""
+    np.random.seed(42)
+    particles = np.random.rand(10, 2)
+    weights = np.full(10, 0.1)
+    x_train = np.random.rand(4, 2)
+    adaptive_sampling_iterator.x_train = x_train[:3]
+    adaptive_sampling_iterator.write_results(particles, weights, np.zeros(10), 0)
+
+    adaptive_sampling_iterator.restart_file = global_settings.result_file(".pickle")
+    adaptive_sampling_iterator.step_files = []
+    adaptive_sampling_iterator.num_written_rows = {}
+    adaptive_sampling_iterator.pre_run()
+    np.testing.assert_array_equal(adaptive_sampling_iterator.x_train, x_train[:3])
+    assert adaptive_sampling_iterator.num_written_rows["x_train"] == 3
+
+    adaptive_sampling_iterator.x_train = x_train
+    adaptive_sampling_iterator.write_results(particles, weights, np.zeros(10), 1)
+
+    results = load_result(global_settings.result_file(".pickle"))
+    assert len(load_pickle(adaptive_sampling_iterator.step_files[-1])["x_train"]) == 1
+    np.testing.assert_array_equal(results["x_train"][0], x_train[:3])
+    np.testing.assert_array_equal(results["x_train"][-1], x_train)
+
+
+def test_restart_loads_each_step_once(adaptive_sampling_iterator, global_settings, mocker):
+    """Test that a restart unpickles each step file only once."""
+    np.random.seed(42)
+    particles = np.random.rand(10, 2)
+    weights = np.full(10, 0.1)
+    x_train = np.random.rand(6, 2)
+    for num_train in [2, 4, 6]:
+        adaptive_sampling_iterator.x_train = x_train[:num_train]
+        adaptive_sampling_iterator.write_results(particles, weights, np.zeros(10), 0)
+
+    adaptive_sampling_iterator.restart_file = global_settings.result_file(".pickle")
+    adaptive_sampling_iterator.step_files = []
+    spy_load_pickle = mocker.spy(adaptive_sampling, "load_pickle")
+    adaptive_sampling_iterator.pre_run()
+
+    assert spy_load_pickle.call_count == 3
+    np.testing.assert_array_equal(adaptive_sampling_iterator.x_train, x_train)
+    np.testing.assert_array_equal(adaptive_sampling_iterator.particles_prev, particles)
+    assert adaptive_sampling_iterator.num_written_rows["x_train"] == 6
+
+
+def test_choose_new_samples_filters_training_samples(adaptive_sampling_iterator):
+    """Test that particles which are already training samples are not chosen again."""
+    np.random.seed(42)
+    adaptive_sampling_iterator.x_train = np.array([[0.1, 0.2], [-0.0, 0.4]])
+    particles = np.array([[0.1, 0.2], [0.0, 0.4], [0.5, 0.6], [0.7, 0.8]])
+    weights = np.full(4, 0.25)
+
+    x_train_new = adaptive_sampling_iterator.choose_new_samples(particles, weights)
+
+    np.testing.assert_array_equal(np.sort(x_train_new, axis=0), particles[2:])
+
+
+def test_cauchy_schwarz_divergence_blocks():
+    """Test that the blockwise Cauchy-Schwarz divergence is independent of the block size."""
+    np.random.seed(42)
+    samples_1 = np.random.randn(100, 2)
+    samples_2 = np.random.randn(80, 2) * 1.5 + 0.5
+
+    cs_div_single_block = cauchy_schwarz_divergence(samples_1, samples_2)
+    cs_div_blocks = cauchy_schwarz_divergence(samples_1, samples_2, max_block_elements=500)
+
+    np.testing.assert_allclose(cs_div_blocks, cs_div_single_block, rtol=1e-10)
+    assert cs_div_single_block > 0
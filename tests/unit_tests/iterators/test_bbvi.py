@@ -0,0 +1,137 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the BBVI iterator."""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from queens.iterators.bbvi import BBVI
+from queens.stochastic_optimizers import Adam
+from queens.variational_distributions import MeanFieldNormal
+
+
+@pytest.fixture(name="gradient_samples")
+def fixture_gradient_samples():
+    """MC gradient samples, control variate samples and importance sampling weights."""
+    rng = np.random.default_rng(42)
+    f_mat = 10.0 + 3.0 * rng.normal(size=(4, 30))
+    h_mat = rng.normal(size=(4, 30))
+    weights_is = 2.0 * rng.random(30)
+    return f_mat, h_mat, weights_is
+
+
+def averaged_scalings_reference(f_mat, h_mat, weights_is):
+    """Averaged control variate scalings with *np.cov*."""
+    cov_sum = sum(
+        np.cov(ielbo, covariate, aweights=weights_is)[0, 1]
+        for ielbo, covariate in zip(f_mat, h_mat, strict=True)
+    )
+    var_sum = sum(float(np.cov(covariate, aweights=weights_is)) for covariate in h_mat)
+    return np.ones((len(h_mat), 1)) * cov_sum / var_sum
+
+
+def componentwise_scalings_reference(f_mat, h_mat, weights_is):
+    """Componentwise control variate scalings with *np.cov*."""
+    return np.array(
+        [
+            [np.cov(ielbo, covariate)[0, 1] / float(np.cov(covariate, aweights=weights_is))]
+            for ielbo, covariate in zip(f_mat, h_mat, strict=True)
+        ]
+    )
+
+
+# pylint: disable=protected-access
+@pytest.mark.parametrize(
+    "scaling_function, reference_function",
+    [
+        (BBVI._averaged_control_variates_scalings, averaged_scalings_reference),
+        (BBVI._componentwise_control_variates_scalings, componentwise_scalings_reference),
+    ],
+)
+def test_control_variates_scalings(gradient_samples, scaling_function, reference_function):
+    """Test the control variate scalings with and without leave-one-out."""
+    f_mat, h_mat, weights_is = gradient_samples
+
+    np.testing.assert_allclose(
+        scaling_function(f_mat, h_mat, weights_is), reference_function(f_mat, h_mat, weights_is)
+    )
+
+    loo_cv_scaling = BBVI._loo_control_variates_scalings(scaling_function, f_mat, h_mat, weights_is)
+    expected_loo_cv_scaling = np.concatenate(
+        [
+            reference_function(
+                np.delete(f_mat, i, 1), np.delete(h_mat, i, 1), np.delete(weights_is, i)
+            )
+            for i in range(f_mat.shape[1])
+        ],
+        axis=1,
+    )
+    np.testing.assert_allclose(loo_cv_scaling, expected_loo_cv_scaling)
+
+
+@pytest.mark.parametrize("memory", [1, 3])
+def test_importance_sampling_weights_from_memory(
+    global_settings, default_parameters_uniform_2d, memory
+):
+    """Test the cached importance sampling weights against recomputing all logpdfs."""
+    iterator = BBVI(
+        model=Mock(),
+        parameters=default_parameters_uniform_2d,
+        global_settings=global_settings,
+        result_description={},
+        variational_distribution=MeanFieldNormal(dimension=2),
+        n_samples_per_iter=5,
+        random_seed=1,
+        max_feval=100,
+        control_variates_scaling_type="averaged",
+        loo_control_variates_scaling=False,
+        stochastic_optimizer=Adam(
+            learning_rate=0.1,
+            optimization_type="max",
+            rel_l1_change_threshold=-1,
+            rel_l2_change_threshold=-1,
+        ),
+        memory=memory,
+    )
+    rng = np.random.default_rng(7)
+    for iteration in range(8):
+        iterator.stochastic_optimizer.iteration = iteration
+        iterator.variational_params = MeanFieldNormal.construct_variational_parameters(
+            rng.normal(size=2), np.diag(rng.uniform(0.5, 2.0, size=2))
+        )
+        # once the memory is filled, the samples of previous iterations are partly reused
+        iterator.sampling_bool = iteration <= memory or iteration % 3 != 0
+        if iterator.sampling_bool:
+            iterator.sample_set = iterator.variational_distribution.draw(
+                iterator.variational_params, 5
+            )
+            iterator.log_posterior_unnormalized = rng.normal(size=5)
+        iterator._update_sample_and_posterior_lists()
+
+        assert len(iterator.log_variational_memory) == len(iterator.parameter_list)
+        if iteration > 0:
+            np.testing.assert_allclose(
+                iterator._get_importance_sampling_weights_from_memory(),
+                iterator.get_importance_sampling_weights(
+                    iterator.parameter_list, iterator.sample_set
+                ),
+                rtol=1e-12,
+            )
+
+    # the samples and parameters of the oldest iterations dropped out of the memory
+    assert len(iterator.parameter_list) == memory + 1
+    assert len(iterator.sample_set) == 5 * (memory + 1)
@@ -159,3 +159,77 @@ def test_correct_sensitivity_indices(default_sobol_index_iterator):
 
     np.testing.assert_allclose(si["S2"], ref_s2, 1e-07, 1e-07)
     np.testing.assert_allclose(si["S2_conf"], ref_s2_conf, 1e-07, 1e-07)
+
+
+@pytest.mark.parametrize("calc_second_order", [True, False])
+def test_streaming_sensitivity_indices(
+    global_settings, default_simulation_model, default_parameters_uniform_3d, calc_second_order
+):
+    """Test that streamed Sobol indices match the indices of the full design."""
+    default_simulation_model.driver.parameters = default_parameters_uniform_3d
+    sobol_index_kwargs = {
+        "model": default_simulation_model,
+        "parameters": default_parameters_uniform_3d,
+        "global_settings": global_settings,
+        "seed": 42,
+        "num_samples": 128,
+        "calc_second_order": calc_second_order,
+        "num_bootstrap_samples": 1000,
+        "confidence_level": 0.95,
+        "result_description": {},
+    }
+    sobol_index_iterator = SobolIndex(**sobol_index_kwargs)
+    sobol_index_iterator.pre_run()
+    sobol_index_iterator.core_run()
+
+    streaming_sobol_index_iterator = SobolIndex(**sobol_index_kwargs, chunk_size=32)
+    streaming_sobol_index_iterator.pre_run()
+    streaming_sobol_index_iterator.core_run()
+
+    assert streaming_sobol_index_iterator.samples is None
+    assert [
+        history["num_samples"] for history in streaming_sobol_index_iterator.convergence_history
+    ] == [32, 64, 96, 128]
+
+    si = sobol_index_iterator.sensitivity_indices
+    si_streaming = streaming_sobol_index_iterator.sensitivity_indices
+    keys = ["S1", "ST", "S2"] if calc_second_order else ["S1", "ST"]
+    for key in keys:
+        np.testing.assert_allclose(si_streaming[key], si[key], atol=1e-2)
+        # delta-method and bootstrap confidence intervals agree roughly
+        np.testing.assert_allclose(si_streaming[f"{key}_conf"], si[f"{key}_conf"], rtol=0.5)
+
+
+def test_streaming_convergence(
+    global_settings, default_simulation_model, default_parameters_uniform_3d
+):
+    """Test that streaming stops once the indices have converged."""
+    default_simulation_model.driver.parameters = default_parameters_uniform_3d
+    sobol_index_iterator = SobolIndex(
+        model=default_simulation_model,
+        parameters=default_parameters_uniform_3d,
+        global_settings=global_settings,
+        seed=42,
+        num_samples=1024,
+        calc_second_order=False,
+        num_bootstrap_samples=1000,
+        confidence_level=0.95,
+        result_description={},
+        chunk_size=128,
+        convergence_tolerance=0.15,
+    )
+    sobol_index_iterator.pre_run()
+    sobol_index_iterator.core_run()
+
+    convergence_history = sobol_index_iterator.convergence_history
+    max_conf = [
+        max(np.max(history["S1_conf"]), np.max(history["ST_conf"]))
+        for history in convergence_history
+    ]
+    assert convergence_history[-1]["num_samples"] < 1024
+    assert max_conf[-1] <= 0.15
+    assert min(max_conf[:-1]) > 0.15
+    # Ishigami function with a=7 and b=0.1
+    np.testing.assert_allclose(
+        sobol_index_iterator.sensitivity_indices["S1"], [0.3139, 0.4424, 0.0], atol=0.1
+    )
@@ -0,0 +1,192 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the vectorized Sobol index estimates with GP uncertainty."""
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from queens.iterators.sobol_index_gp_uncertainty_utils import estimator
+from queens.iterators.sobol_index_gp_uncertainty_utils.estimator import (
+    SobolIndexEstimator,
+    split_estimate_chunks,
+)
+from queens.iterators.sobol_index_gp_uncertainty_utils.utils_estimate_indices import (
+    calculate_indices,
+    calculate_indices_third_order,
+)
+
+NUMBER_PARAMETERS = 3
+
+
+@pytest.fixture(name="prediction_and_bootstrap_indices")
+def fixture_prediction_and_bootstrap_indices():
+    """Predictions of stacked GP realizations and bootstrap indices."""
+    rng = np.random.default_rng(42)
+    number_monte_carlo_samples = 50
+    prediction = rng.normal(size=(4, number_monte_carlo_samples, 2 * NUMBER_PARAMETERS + 3))
+    prediction[..., -1] += prediction[..., 0]
+    bootstrap_indices = np.concatenate(
+        (
+            np.arange(number_monte_carlo_samples)[np.newaxis],
+            rng.integers(number_monte_carlo_samples, size=(5, number_monte_carlo_samples)),
+        )
+    )
+    return prediction, bootstrap_indices
+
+
+@pytest.mark.parametrize(
+    "first_order_estimator", ["Janon2014", "Janon2014alt", "Gratiet2014", "Saltelli2010"]
+)
+def test_calculate_indices_stacked(prediction_and_bootstrap_indices, first_order_estimator):
+    """Test that stacked estimates match single realizations and bootstrap samples."""
+    prediction, bootstrap_indices = prediction_and_bootstrap_indices
+    # the third-order sample matrix is not used for lower-order indices
+    prediction = np.delete(prediction, -3, axis=-1)
+
+    first_order, total_order, second_order = calculate_indices(
+        prediction, bootstrap_indices, NUMBER_PARAMETERS, first_order_estimator, True
+    )
+    assert first_order.shape == (4, 6, NUMBER_PARAMETERS)
+    assert second_order.shape == (4, 6, NUMBER_PARAMETERS, NUMBER_PARAMETERS)
+    # redundant second-order indices are not estimated
+    assert np.isnan(second_order[(..., *np.tril_indices(NUMBER_PARAMETERS))]).all()
+    assert not np.isnan(second_order[(..., *np.triu_indices(NUMBER_PARAMETERS, k=1))]).any()
+
+    for k, prediction_k in enumerate(prediction):
+        for b, bootstrap_indices_b in enumerate(bootstrap_indices):
+            first_order_kb, total_order_kb, second_order_kb = calculate_indices(
+                prediction_k[bootstrap_indices_b],
+                np.arange(prediction.shape[1]),
+                NUMBER_PARAMETERS,
+                first_order_estimator,
+                True,
+            )
+            np.testing.assert_allclose(first_order[k, b], first_order_kb)
+            np.testing.assert_allclose(total_order[k, b], total_order_kb)
+            np.testing.assert_allclose(second_order[k, b], second_order_kb)
+
+
+def test_calculate_indices_third_order_stacked(prediction_and_bootstrap_indices):
+    """Test that stacked third-order estimates match single realizations."""
+    prediction, bootstrap_indices = prediction_and_bootstrap_indices
+
+    third_order = calculate_indices_third_order(
+        prediction, bootstrap_indices, NUMBER_PARAMETERS, "Saltelli2010"
+    )
+    assert third_order.shape == (4, 6)
+    for k, prediction_k in enumerate(prediction):
+        np.testing.assert_allclose(
+            third_order[k],
+            calculate_indices_third_order(
+                prediction_k, bootstrap_indices, NUMBER_PARAMETERS, "Saltelli2010"
+            ),
+        )
+
+
+def test_calculate_indices_reference_values(prediction_and_bootstrap_indices):
+    """Test the estimates against the previous estimator per bootstrap sample."""
+    prediction, bootstrap_indices = prediction_and_bootstrap_indices
+
+    first_order, total_order, second_order = calculate_indices(
+        np.delete(prediction, -3, axis=-1),
+        bootstrap_indices,
+        NUMBER_PARAMETERS,
+        "Saltelli2010",
+        True,
+    )
+    third_order = calculate_indices_third_order(
+        prediction, bootstrap_indices, NUMBER_PARAMETERS, "Saltelli2010"
+    )
+
+    # reference values of the first GP realization and the first two bootstrap samples
+    np.testing.assert_allclose(
+        first_order[0, :2],
+        [
+            [0.5136544491, -0.0472939609, -0.1197244111],
+            [0.2580734809, -0.2067921910, -0.2906679107],
+        ],
+        rtol=1e-9,
+    )
+    np.testing.assert_allclose(
+        total_order[0, :2],
+        [[0.7884189173, 0.7765747766, 0.9536246210], [0.7672512468, 0.7233829454, 1.1201728813]],
+        rtol=1e-9,
+    )
+    np.testing.assert_allclose(
+        second_order[0, :2][(..., *np.triu_indices(NUMBER_PARAMETERS, k=1))],
+        [
+            [-0.8567093869, -0.5116917525, -0.0393909678],
+            [-0.4876207542, -0.3546253210, 0.1653745698],
+        ],
+        rtol=1e-9,
+    )
+    np.testing.assert_allclose(
+        third_order[0],
+        [1.0771107960, 0.9152064899, 1.6189121814, 1.4998973303, 0.5375065447, 1.5154518552],
+        rtol=1e-9,
+    )
+
+
+def test_split_estimate_chunks():
+    """Test that the bootstrap samples are split if there are too few GP realizations."""
+    assert split_estimate_chunks(1, 10, 1) == [(slice(0, 1), slice(0, 10))]
+    assert split_estimate_chunks(1, 10, 3) == [
+        (slice(0, 1), slice(0, 4)),
+        (slice(0, 1), slice(4, 7)),
+        (slice(0, 1), slice(7, 10)),
+    ]
+    assert split_estimate_chunks(4, 10, 2) == [
+        (slice(0, 2), slice(0, 10)),
+        (slice(2, 4), slice(0, 10)),
+    ]
+    assert len(split_estimate_chunks(1, 2, 8)) == 2
+
+
+@pytest.mark.parametrize("num_procs, pool_used", [(1, False), (3, True)])
+def test_estimate_gp_mean(prediction_and_bootstrap_indices, num_procs, pool_used, mocker):
+    """Test that the GP mean is estimated in chunks of bootstrap samples."""
+    prediction, _ = prediction_and_bootstrap_indices
+    prediction = np.delete(prediction[:1], -3, axis=-1)
+    index_estimator = SobolIndexEstimator.from_config_create(
+        {
+            "number_monte_carlo_samples": prediction.shape[1],
+            "number_gp_realizations": 1,
+            "number_bootstrap_samples": 6,
+            "second_order": True,
+        },
+        [f"x{i}" for i in range(NUMBER_PARAMETERS)],
+    )
+    spy_pool = mocker.spy(estimator, "shared_prediction_pool")
+
+    estimates = index_estimator.estimate(
+        xr.DataArray(
+            prediction.transpose(1, 2, 0), dims=("monte_carlo", "sample_matrix", "gp_realization")
+        ),
+        num_procs,
+    )
+
+    assert spy_pool.called == pool_used
+    expected_estimates = calculate_indices(
+        prediction,
+        index_estimator._draw_bootstrap_index(),  # pylint: disable=protected-access
+        NUMBER_PARAMETERS,
+        "Saltelli2010",
+        True,
+    )
+    for key, expected_estimate in zip(
+        ["first_order", "total_order", "second_order"], expected_estimates, strict=True
+    ):
+        np.testing.assert_array_equal(estimates[key].values, expected_estimate)
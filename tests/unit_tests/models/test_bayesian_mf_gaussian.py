@@ -15,12 +15,12 @@
 """Unit tests for Bayesian multi-fidelity Gaussian likelihood function."""
 
 # pylint: disable=invalid-name
-from unittest import mock
-
 import numpy as np
 import pytest
 from mock import Mock, patch
+from scipy.stats import norm
 
+from queens.distributions.mean_field_normal import MeanFieldNormal
 from queens.models.likelihoods.bmf_gaussian import BMFGaussian, BmfiaInterface
 from queens.models.simulation import Simulation
 
@@ -267,16 +267,14 @@ def test_evaluate_mf_likelihood(default_mf_likelihood, mocker):
         [[1, 1, 1], [2, 2, 2]]
     )  # three dim output per point x in x_batch (row-wise)
     x_batch = np.array([[0, 0], [0, 1]])  # make points have distance 1
-    diff_mat = np.array([[1, 1, 1], [2, 2, 2]])  # for simplicity we assume diff_mat equals
-    var_y_mat = np.array([[1, 1, 1], [1, 1, 1]])
     z_mat = y_lf_mat
-    m_f_mat = np.array([[1, 1], [1, 1]])
+    m_f_mat = np.array([[1.0, 2.0], [0.5, -1.0]])
+    var_y_mat = np.array([[1.0, 0.5], [2.0, 0.1]])
 
-    # mock the normal distribution
-    distribution_mock = mock.MagicMock()
-    distribution_mock.update_variance.return_value = None
-    distribution_mock.logpdf.return_value = np.array([[1.0]])
-    default_mf_likelihood.normal_distribution = distribution_mock
+    y_obs = np.array([0.8, 1.5])
+    default_mf_likelihood.normal_distribution = MeanFieldNormal(
+        mean=y_obs, variance=default_mf_likelihood.noise_var, dimension=2
+    )
 
     mp1 = mocker.patch(
         "queens.iterators.bmfia.BMFIA.set_feature_strategy",
@@ -301,12 +299,11 @@ def test_evaluate_mf_likelihood(default_mf_likelihood, mocker):
     mp2.assert_called_once()
     np.testing.assert_array_equal(z_mat, mp2.call_args[0][0])
 
-    # test covariance update and logpdf count
-    assert distribution_mock.update_variance.call_count == diff_mat.shape[0]
-    assert distribution_mock.logpdf.call_count == diff_mat.shape[0]
-
-    # test logpdf output and input
-    np.testing.assert_array_equal(log_lik_mf, np.array([1, 1]))
+    # test logpdf output against the independent normal densities per coordinate
+    std_mat = np.sqrt(var_y_mat + default_mf_likelihood.noise_var)
+    expected_log_lik_mf = np.sum(norm.logpdf(m_f_mat, loc=y_obs, scale=std_mat), axis=1)
+    np.testing.assert_allclose(log_lik_mf, expected_log_lik_mf)
+    np.testing.assert_allclose(default_mf_likelihood.min_log_lik_mf, np.min(expected_log_lik_mf))
 
 
 def test_grad(default_mf_likelihood):
@@ -337,18 +334,16 @@ def test_partial_grad_evaluate(mocker, default_mf_likelihood):
         [[1, 1, 1], [2, 2, 2]]
     )  # three dim output per point x in x_batch (row-wise)
     forward_model_input = np.array([[0, 0], [0, 1]])  # make points have distance 1
-    diff_mat = np.array([[1, 1, 1], [2, 2, 2]])  # for simplicity we assume diff_mat equals
-    var_y_mat = np.array([[1, 1, 1], [1, 1, 1]])
     z_mat = forward_model_output
-    m_f_mat = np.array([[1, 1], [1, 1]])
-    grad_m_f_mat = np.array([[6, 7, 8], [9, 10, 11]])
-    grad_var_y_mat = np.array([[12, 13, 14], [15, 16, 17]])
-
-    # create mock attribute for mf_likelihood
-    distribution_mock = mock.MagicMock()
-    distribution_mock.update_variance.return_value = None
-    distribution_mock.logpdf.return_value = np.array([[1]])
-    default_mf_likelihood.normal_distribution = distribution_mock
+    m_f_mat = np.array([[1.0, 2.0], [0.5, -1.0]])
+    var_y_mat = np.array([[1.0, 0.5], [2.0, 0.1]])
+    grad_m_f_mat = np.array([[[6.0], [7.0]], [[9.0], [10.0]]])
+    grad_var_y_mat = np.array([[[12.0], [13.0]], [[15.0], [16.0]]])
+
+    y_obs = np.array([0.8, 1.5])
+    default_mf_likelihood.normal_distribution = MeanFieldNormal(
+        mean=y_obs, variance=default_mf_likelihood.noise_var, dimension=2
+    )
 
     mp1 = mocker.patch(
         "queens.iterators.bmfia.BMFIA.set_feature_strategy",
@@ -358,15 +353,6 @@ def test_partial_grad_evaluate(mocker, default_mf_likelihood):
         "queens.models.likelihoods.bmf_gaussian.BmfiaInterface.evaluate_and_gradient",
         return_value=(m_f_mat, var_y_mat, grad_m_f_mat, grad_var_y_mat),
     )
-
-    mocker.patch(
-        "queens.distributions.mean_field_normal.MeanFieldNormal.logpdf",
-        return_value=0.1,
-    )
-    mp3 = mocker.patch(
-        "queens.models.likelihoods.bmf_gaussian.BMFGaussian.grad_log_pdf_d_ylf",
-        return_value=np.array([[0.2]]),
-    )
     grad_out = default_mf_likelihood.partial_grad_evaluate(
         forward_model_input, forward_model_output
     )
@@ -383,44 +369,21 @@ def test_partial_grad_evaluate(mocker, default_mf_likelihood):
     mp2.assert_called_once()
     np.testing.assert_array_equal(z_mat, mp2.call_args[0][0])
 
-    # test covariance update and logpdf count
-    assert distribution_mock.update_variance.call_count == diff_mat.shape[0]
-    assert distribution_mock.logpdf.call_count == diff_mat.shape[0]
-
-    # test grad logpdf features
-    assert mp3.call_count == diff_mat.shape[0]
-
-    # test logpdf output and input
-    np.testing.assert_array_equal(grad_out, np.array([[0.2], [0.2]]))
-
-
-def test_grad_log_pdf_d_ylf(default_mf_likelihood):
-    """Test grad log pdf d ylf method."""
-    m_f_vec = np.array([[1, 4]])
-    grad_m_f = np.array([[3, 5]])
-    grad_var_y = np.array([[7, 10]])
-
-    d_log_lik_d_mf = np.array([[1], [2]])  # two samples, output is scalar
-    d_log_lik_d_var = np.array([[3], [4]])  # two samples, output is scalar
-
-    # create mock attribute for mf_likelihood
-    distribution_mock = mock.MagicMock()
-    distribution_mock.grad_logpdf.return_value = d_log_lik_d_mf
-    distribution_mock.grad_logpdf_var.return_value = d_log_lik_d_var
-    default_mf_likelihood.normal_distribution = distribution_mock
-
-    # run the method
-    d_log_lik_d_z = default_mf_likelihood.grad_log_pdf_d_ylf(m_f_vec, grad_m_f, grad_var_y)
-
-    # --- assert and test statements ----------------------------------------
-    distribution_mock.grad_logpdf.assert_called_once()
-    distribution_mock.grad_logpdf.assert_called_with(m_f_vec)
-
-    distribution_mock.grad_logpdf_var.assert_called_once()
-    distribution_mock.grad_logpdf_var.assert_called_with(m_f_vec)
-
-    expected_d_log_lik_d_z = np.array([[24, 50]])
-    np.testing.assert_array_equal(d_log_lik_d_z, expected_d_log_lik_d_z)
+    # compare against the per-sample evaluation with the mean-field normal distribution
+    normal_distribution = MeanFieldNormal(
+        mean=y_obs, variance=default_mf_likelihood.noise_var, dimension=2
+    )
+    expected_grad_out = []
+    for m_f_vec, variance_vec, grad_m_f, grad_var_y in zip(
+        m_f_mat, var_y_mat, grad_m_f_mat, grad_var_y_mat, strict=True
+    ):
+        normal_distribution.update_variance(variance_vec + default_mf_likelihood.noise_var)
+        expected_grad_out.append(
+            normal_distribution.grad_logpdf(m_f_vec.reshape(1, -1)).flatten() * grad_m_f.flatten()
+            + normal_distribution.grad_logpdf_var(m_f_vec.reshape(1, -1)).flatten()
+            * grad_var_y.flatten()
+        )
+    np.testing.assert_allclose(grad_out, np.array(expected_grad_out))
 
 
 def test_initialize_bmfia_iterator(default_bmfia_iterator, mocker):
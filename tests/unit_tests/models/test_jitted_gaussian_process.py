@@ -0,0 +1,102 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the jitted GP model."""
+
+import numpy as np
+import pytest
+from scipy.spatial.distance import cdist
+
+from queens.models.surrogates.jitted_gaussian_process import JittedGaussianProcess
+from queens.stochastic_optimizers import Adam
+
+
+@pytest.fixture(name="training_data")
+def fixture_training_data():
+    """Training samples of a smooth two-dimensional function."""
+    x_train = np.random.default_rng(2).uniform(-2.0, 2.0, size=(30, 2))
+    y_train = (np.sin(x_train[:, 0]) * np.cos(x_train[:, 1])).reshape(-1, 1)
+    return x_train, y_train
+
+
+@pytest.fixture(name="x_test")
+def fixture_x_test():
+    """Test samples."""
+    return np.random.default_rng(3).uniform(-2.0, 2.0, size=(23, 2))
+
+
+def trained_gp_model(x_train, y_train, prediction_block_size):
+    """Trained jitted GP with a squared exponential kernel."""
+    optimizer = Adam(
+        learning_rate=0.1,
+        optimization_type="max",
+        rel_l1_change_threshold=0.001,
+        rel_l2_change_threshold=0.001,
+        max_iteration=50,
+    )
+    model = JittedGaussianProcess(
+        stochastic_optimizer=optimizer,
+        kernel_type="squared_exponential",
+        initial_hyper_params_lst=[1.0, 1.0, 0.01],
+        noise_var_lb=1.0e-4,
+        data_scaling="standard_scaler",
+        prediction_block_size=prediction_block_size,
+    )
+    model.setup(x_train, y_train)
+    model.train()
+    return model
+
+
+def dense_prediction(model, x_test, support):
+    """Posterior mean and variance based on the explicit inverse of the covariance matrix."""
+    sigma_0_sq, l_scale_sq, sigma_n_sq = model.hyper_params
+    k_mat_inv = np.linalg.inv(model.k_mat)
+    k_test_train = sigma_0_sq * np.exp(
+        -cdist(model.scaler_x.transform(x_test), model.x_train, "sqeuclidean") / (2 * l_scale_sq)
+    )
+    mean = np.dot(np.dot(k_test_train, k_mat_inv), model.y_train)
+    var = sigma_0_sq - np.sum(np.dot(k_test_train, k_mat_inv) * k_test_train, axis=1)
+    if support == "y":
+        var = var + sigma_n_sq
+    mean = model.scaler_y.inverse_transform_mean(mean).reshape(-1, 1)
+    var = (model.scaler_y.inverse_transform_std(np.sqrt(var)) ** 2).reshape(-1, 1)
+    return mean, var
+
+
+def test_cached_alpha(training_data):
+    """Test that the cached weights of the training points equal the dense solution."""
+    model = trained_gp_model(*training_data, prediction_block_size=1000)
+
+    np.testing.assert_allclose(
+        model.alpha, np.linalg.solve(model.k_mat, model.y_train.flatten()), rtol=1e-6, atol=1e-8
+    )
+    np.testing.assert_allclose(
+        np.dot(model.cholesky_k_mat, model.cholesky_k_mat.T), model.k_mat, atol=1e-10
+    )
+
+
+@pytest.mark.parametrize("support", ["f", "y"])
+def test_blocked_prediction(training_data, x_test, support):
+    """Test that blocked predictions equal the dense prediction of all points at once."""
+    model = trained_gp_model(*training_data, prediction_block_size=1000)
+    model_blocked = trained_gp_model(*training_data, prediction_block_size=4)
+    mean_ref, var_ref = dense_prediction(model, x_test, support)
+
+    output = model.predict(x_test, support=support, gradient_bool=True)
+    output_blocked = model_blocked.predict(x_test, support=support, gradient_bool=True)
+
+    np.testing.assert_allclose(output["result"], mean_ref, rtol=1e-6, atol=1e-8)
+    np.testing.assert_allclose(output["variance"], var_ref, rtol=1e-6, atol=1e-8)
+    for key in ["result", "variance", "grad_mean", "grad_var"]:
+        np.testing.assert_allclose(output_blocked[key], output[key], rtol=1e-12, atol=1e-14)
@@ -0,0 +1,119 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the jitted GP kernels."""
+
+import numpy as np
+import pytest
+from scipy.spatial.distance import cdist
+
+import queens.models.surrogates.utils.kernel_jitted as utils_jitted
+
+HYPER_PARAMS = [1.3, 0.8, 1.0e-2]
+
+
+@pytest.fixture(name="x_train")
+def fixture_x_train():
+    """Training input points with a duplicated point."""
+    x_train = np.random.default_rng(4).normal(size=(17, 3))
+    x_train[-1] = x_train[0]
+    return x_train
+
+
+def pairwise_distances(x_train):
+    """Euclidean distances evaluated pair by pair as in the previous kernel assembly."""
+    num_points = x_train.shape[0]
+    delta = np.zeros((num_points, num_points))
+    for i in range(num_points):
+        for j in range(num_points):
+            delta[i, j] = np.linalg.norm(x_train[i] - x_train[j])
+    return delta
+
+
+def squared_exponential_reference(x_train, hyper_params):
+    """Previous assembly of the squared exponential kernel from the training inputs."""
+    sigma_0_sq, l_scale_sq, sigma_n_sq = hyper_params
+    delta = pairwise_distances(x_train)
+    exp_term = np.exp(-(delta**2) / (2.0 * l_scale_sq))
+    k_mat = sigma_0_sq * exp_term + sigma_n_sq * np.eye(x_train.shape[0])
+    partial_l_scale_sq = sigma_0_sq * exp_term * delta**2 / (2.0 * l_scale_sq**2)
+    return k_mat, [exp_term, partial_l_scale_sq, np.eye(x_train.shape[0])]
+
+
+def matern_3_2_reference(x_train, hyper_params):
+    """Previous assembly of the Matern 3/2 kernel from the training inputs."""
+    sigma_0_sq, l_scale, sigma_n_sq = hyper_params
+    delta = pairwise_distances(x_train)
+    exp_term = np.exp(-np.sqrt(3) * delta / l_scale)
+    partial_sigma_0_sq = (1 + np.sqrt(3) * delta / l_scale) * exp_term
+    k_mat = sigma_0_sq * partial_sigma_0_sq + sigma_n_sq * np.eye(x_train.shape[0])
+    partial_l_scale = sigma_0_sq * exp_term * 3 * delta**2 / (l_scale**3)
+    return k_mat, [partial_sigma_0_sq, partial_l_scale, np.eye(x_train.shape[0])]
+
+
+def test_squared_distances(x_train):
+    """Test the squared distances against scipy."""
+    x_test = np.random.default_rng(5).normal(size=(9, 3))
+
+    np.testing.assert_allclose(
+        utils_jitted.squared_distances(x_train, x_train),
+        cdist(x_train, x_train, "sqeuclidean"),
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        utils_jitted.squared_distances(x_test, x_train),
+        cdist(x_test, x_train, "sqeuclidean"),
+        atol=1e-12,
+    )
+    assert np.all(utils_jitted.squared_distances(x_train, x_train) >= 0.0)
+
+
+@pytest.mark.parametrize(
+    "kernel, reference_kernel",
+    [
+        (utils_jitted.squared_exponential, squared_exponential_reference),
+        (utils_jitted.matern_3_2, matern_3_2_reference),
+    ],
+)
+def test_kernels_from_squared_distances(x_train, kernel, reference_kernel):
+    """Test the kernels assembled from cached squared distances against the previous assembly."""
+    squared_distance_mat = utils_jitted.squared_distances(x_train, x_train)
+    k_mat_ref, partial_derivatives_ref = reference_kernel(x_train, HYPER_PARAMS)
+
+    k_mat, cholesky_k_mat, partial_derivatives = kernel(squared_distance_mat, HYPER_PARAMS)
+
+    np.testing.assert_allclose(k_mat, k_mat_ref, rtol=1e-12, atol=1e-7)
+    np.testing.assert_allclose(cholesky_k_mat, np.linalg.cholesky(k_mat_ref), atol=1e-6)
+    for partial_derivative, partial_derivative_ref in zip(
+        partial_derivatives, partial_derivatives_ref
+    ):
+        np.testing.assert_allclose(partial_derivative, partial_derivative_ref, atol=1e-7)
+
+
+@pytest.mark.parametrize(
+    "covariance_function, reference_kernel",
+    [
+        (utils_jitted.covariance_squared_exponential, squared_exponential_reference),
+        (utils_jitted.covariance_matern_3_2, matern_3_2_reference),
+    ],
+)
+def test_covariance_functions(x_train, covariance_function, reference_kernel):
+    """Test the noise-free covariance functions against the previous assembly."""
+    squared_distance_mat = utils_jitted.squared_distances(x_train, x_train)
+    k_mat_ref, _ = reference_kernel(x_train, HYPER_PARAMS)
+    k_mat_ref = k_mat_ref - HYPER_PARAMS[-1] * np.eye(x_train.shape[0])
+
+    np.testing.assert_allclose(
+        covariance_function(squared_distance_mat, np.array(HYPER_PARAMS)), k_mat_ref, atol=1e-7
+    )
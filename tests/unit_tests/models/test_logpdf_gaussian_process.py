@@ -0,0 +1,252 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the log-pdf Gaussian process model."""
+
+import logging
+import os
+
+import numpy as np
+import pytest
+
+from queens.models.logpdf_gaussian_process import LogpdfGaussianProcess
+from queens.utils import jax_minimize_wrapper
+
+HYPERPARAMETERS = np.array([0.5, 0.7, 1.2, 1.0e-6])
+
+
+@pytest.fixture(name="training_data")
+def fixture_training_data():
+    """Training samples of a two-dimensional Gaussian log-likelihood."""
+    x_train = np.random.default_rng(42).uniform(-1.0, 1.0, size=(11, 2))
+    y_train = -0.5 * np.sum(x_train**2 / 0.25, axis=1) - 1.0
+    return x_train, y_train
+
+
+@pytest.fixture(name="x_test")
+def fixture_x_test():
+    """Test samples."""
+    return np.random.default_rng(0).uniform(-1.0, 1.0, size=(7, 2))
+
+
+def fixed_hyperparameter_model(approx_type, train_bucket_size):
+    """Log-pdf GP with fixed instead of optimized or sampled hyperparameters."""
+    model = LogpdfGaussianProcess(
+        approx_type=approx_type, num_hyper=2, train_bucket_size=train_bucket_size
+    )
+    model.optimize_hyperparameters = lambda: HYPERPARAMETERS
+    model.sample_hyperparameters = lambda: np.array([HYPERPARAMETERS, 1.1 * HYPERPARAMETERS])
+    return model
+
+
+def test_hyperparameter_loss_padding(training_data):
+    """Test that padded training samples do not change the hyperparameter loss."""
+    x_train, y_train = training_data
+    model = LogpdfGaussianProcess(approx_type="GPMAP-I", train_bucket_size=8)
+    model.x_train = x_train
+    model.y_train = y_train.reshape(-1, 1)
+
+    x_train_padded, y_train_padded, train_mask = model.pad_training_data()
+    assert train_mask.size == 16
+    np.testing.assert_array_equal(train_mask, np.repeat([1.0, 0.0], [11, 5]))
+
+    transformed_hyperparameters = np.log(HYPERPARAMETERS)
+    loss_padded = model.hyperparameter_loss(
+        transformed_hyperparameters, x_train_padded, y_train_padded, train_mask
+    )
+    loss = model.hyperparameter_loss(
+        transformed_hyperparameters, x_train, y_train.reshape(-1, 1), np.ones(y_train.size)
+    )
+    np.testing.assert_allclose(loss_padded, loss, rtol=1e-10)
+
+
+@pytest.mark.parametrize("approx_type", ["GPMAP-I", "CGPMAP-II", "CFBGP"])
+def test_evaluate_padding(training_data, x_test, approx_type):
+    """Test that padded training samples do not change the predictions."""
+    x_train, y_train = training_data
+    model_padded = fixed_hyperparameter_model(approx_type, train_bucket_size=8)
+    model = fixed_hyperparameter_model(approx_type, train_bucket_size=None)
+    np.random.seed(1)
+    model_padded.initialize(x_train, y_train, num_observations=5)
+    np.random.seed(1)
+    model.initialize(x_train, y_train, num_observations=5)
+
+    assert model_padded.jit_func_generate_output.keywords["x_train"].shape[0] == 16
+    assert model.jit_func_generate_output.keywords["x_train"].shape[0] == 11
+    np.testing.assert_allclose(
+        model_padded.evaluate(x_test)["result"], model.evaluate(x_test)["result"], rtol=1e-8
+    )
+
+
+@pytest.mark.parametrize("approx_type", ["GPMAP-I", "CFBGP"])
+def test_incremental_update_equals_full_factorization(training_data, approx_type):
+    """Test that appended samples give the same training factors as a full factorization."""
+    x_train, y_train = training_data
+    model = fixed_hyperparameter_model(approx_type, train_bucket_size=None)
+    model.refit_interval = 2
+    model.initialize(x_train[:6], y_train[:6], num_observations=5)
+    scaler_x, scaler_y = model.scaler_x, model.scaler_y
+
+    assert model.is_incremental_update(x_train, y_train.reshape(-1, 1))
+    model.initialize(x_train, y_train, num_observations=5)
+
+    assert model.num_updates_since_refit == 1
+    assert model.scaler_x is scaler_x
+    assert model.scaler_y == scaler_y
+    np.testing.assert_allclose(model.x_train, scaler_x.transform(x_train))
+    np.testing.assert_allclose(
+        model.y_train, y_train.reshape(-1, 1) / scaler_y - model.prior_gp_mean
+    )
+    hyperparameters = np.atleast_2d(model.hyperparameters)
+    chol_k_train_train = np.reshape(model.chol_k_train_train, (len(hyperparameters), 11, 11))
+    v_train = np.reshape(model.v_train, (len(hyperparameters), 11, 1))
+    for i, hyperparameter in enumerate(hyperparameters):
+        chol_k_train_train_full, v_train_full = model.calc_train_factor(hyperparameter)
+        np.testing.assert_allclose(chol_k_train_train[i], chol_k_train_train_full, atol=1e-10)
+        np.testing.assert_allclose(v_train[i], v_train_full, rtol=1e-6)
+
+
+def test_incremental_update_with_jitter(training_data, caplog):
+    """Test that a jittered extension matches a full factorization for duplicated samples."""
+    x_train, y_train = training_data
+    hyperparameters = np.array([0.5, 0.7, 1.2, 1.0e-18])
+    x_train = np.concatenate([x_train, x_train[[0, 3]]])
+    y_train = np.concatenate([y_train, y_train[[0, 3]]])
+    model = LogpdfGaussianProcess(approx_type="GPMAP-I", jitter=0.0, refit_interval=2)
+    model.optimize_hyperparameters = lambda: hyperparameters
+    model.initialize(x_train[:11], y_train[:11], num_observations=5)
+
+    with caplog.at_level(logging.WARNING, logger="queens.utils.numpy_linalg"):
+        model.initialize(x_train, y_train, num_observations=5)
+    assert model.num_updates_since_refit == 1
+    # the duplicated samples make the new block singular up to round-off
+    assert "Added 1.00e-18 to diagonal" in caplog.text
+
+    chol_k_train_train = np.asarray(model.chol_k_train_train)
+    chol_k_train_train_full, _ = model.calc_train_factor(hyperparameters)
+    np.testing.assert_allclose(
+        chol_k_train_train @ chol_k_train_train.T,
+        chol_k_train_train_full @ chol_k_train_train_full.T,
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(chol_k_train_train[:11, :11], chol_k_train_train_full[:11, :11])
+
+
+def test_refit_interval(training_data):
+    """Test that a full refit happens every *refit_interval* initializations."""
+    x_train, y_train = training_data
+    model = fixed_hyperparameter_model("GPMAP-I", train_bucket_size=None)
+    model.refit_interval = 3
+    num_refits = []
+    model.optimize_hyperparameters = lambda: num_refits.append(1) or HYPERPARAMETERS
+
+    num_updates_since_refit = []
+    for num_train in [5, 6, 7, 8, 9, 10]:
+        model.initialize(x_train[:num_train], y_train[:num_train], num_observations=5)
+        num_updates_since_refit.append(model.num_updates_since_refit)
+
+    assert num_updates_since_refit == [0, 1, 2, 0, 1, 2]
+    assert len(num_refits) == 2
+    assert model.y_train_unscaled.size == 10
+
+
+def test_refit_on_changed_training_data(training_data):
+    """Test that changed or unchanged training data is not appended incrementally."""
+    x_train, y_train = training_data
+    model = fixed_hyperparameter_model("GPMAP-I", train_bucket_size=None)
+    model.refit_interval = 10
+    assert not model.is_incremental_update(x_train, y_train.reshape(-1, 1))
+
+    model.initialize(x_train[:6], y_train[:6], num_observations=5)
+    y_train_changed = y_train.reshape(-1, 1).copy()
+    y_train_changed[0] += 1.0
+
+    assert model.is_incremental_update(x_train, y_train.reshape(-1, 1))
+    assert not model.is_incremental_update(x_train, y_train_changed)
+    assert not model.is_incremental_update(x_train[::-1], y_train.reshape(-1, 1)[::-1])
+    assert not model.is_incremental_update(x_train[:6], y_train.reshape(-1, 1)[:6])
+
+    model.initialize(x_train, y_train_changed, num_observations=5)
+    assert model.num_updates_since_refit == 0
+
+
+def test_refit_interval_one_always_refits(training_data):
+    """Test that the default refit interval never appends samples incrementally."""
+    x_train, y_train = training_data
+    model = fixed_hyperparameter_model("GPMAP-I", train_bucket_size=None)
+    model.initialize(x_train[:6], y_train[:6], num_observations=5)
+
+    assert model.refit_interval == 1
+    assert not model.is_incremental_update(x_train, y_train.reshape(-1, 1))
+
+
+def optimization_model(training_data, num_optimization_workers, num_converged_optimizations=None):
+    """Log-pdf GP with scaled training data for hyperparameter optimization."""
+    x_train, y_train = training_data
+    model = LogpdfGaussianProcess(
+        approx_type="GPMAP-I",
+        num_optimizations=4,
+        num_optimization_workers=num_optimization_workers,
+        num_converged_optimizations=num_converged_optimizations,
+    )
+    model.num_dim = x_train.shape[1]
+    model.x_train = x_train
+    model.y_train = y_train.reshape(-1, 1) / np.max(np.abs(y_train)) - model.prior_gp_mean
+    return model
+
+
+def test_num_optimization_workers_default():
+    """Test that the default number of workers is bounded by restarts and CPUs."""
+    model = LogpdfGaussianProcess(approx_type="GPMAP-I", num_optimizations=10_000)
+    assert 1 <= model.num_optimization_workers <= os.cpu_count()
+    model = LogpdfGaussianProcess(approx_type="GPMAP-I", num_optimizations=1)
+    assert model.num_optimization_workers == 1
+
+
+def test_concurrent_optimizations_equal_serial(training_data):
+    """Test that concurrent restarts find the same optimum as serial restarts."""
+    np.random.seed(3)
+    hyperparameters_serial = optimization_model(training_data, 1).optimize_hyperparameters()
+    np.random.seed(3)
+    hyperparameters_concurrent = optimization_model(training_data, 4).optimize_hyperparameters()
+
+    np.testing.assert_allclose(hyperparameters_concurrent, hyperparameters_serial, rtol=1e-10)
+
+
+def test_optimizations_stop_early(training_data, mocker):
+    """Test that the remaining restarts are skipped once enough restarts converged."""
+    minimize = mocker.spy(jax_minimize_wrapper, "minimize")
+    model = optimization_model(training_data, 1, num_converged_optimizations=2)
+    optimum_converged = mocker.spy(model, "optimum_converged")
+    np.random.seed(3)
+    hyperparameters = model.optimize_hyperparameters()
+
+    assert minimize.call_count == 2
+    assert optimum_converged.call_count == 2
+    assert optimum_converged.spy_return
+    np.random.seed(3)
+    hyperparameters_all = optimization_model(training_data, 1).optimize_hyperparameters()
+    np.testing.assert_allclose(hyperparameters, hyperparameters_all, rtol=1e-4)
+
+
+def test_optimum_converged():
+    """Test the convergence check of the optimization restarts."""
+    model = LogpdfGaussianProcess(approx_type="GPMAP-I", num_converged_optimizations=2)
+    assert model.optimum_converged(np.array([-3.0, -3.0 + 1e-9, -1.0]))
+    assert not model.optimum_converged(np.array([-3.0, -2.0, -1.0]))
+    assert not model.optimum_converged(np.array([-3.0, np.nan]))
+    assert not model.optimum_converged(np.array([np.nan, np.nan]))
+
+    model.num_converged_optimizations = None
+    assert not model.optimum_converged(np.array([-3.0, -3.0]))
@@ -98,6 +98,34 @@ def test_joint_logpdf(parameters_set_1):
     np.testing.assert_almost_equal(logpdf, np.array([-np.inf, -15.14250]), decimal=5)
 
 
+def test_joint_logpdf_mixed_parameters():
+    """Test *joint_logpdf* and *grad_joint_logpdf* for grouped and individual parameters."""
+    parameters_dict = {
+        "x1": Normal(mean=1.0, covariance=2.0),
+        "x2": Uniform(lower_bound=[-1, 0], upper_bound=[1, 3]),
+        "x3": Normal(mean=[0, 1], covariance=[[1.0, 0.5], [0.5, 2.0]]),
+        "x4": Normal(mean=-1.0, covariance=0.5),
+        "x5": Uniform(lower_bound=0, upper_bound=5),
+    }
+    parameters = Parameters(**parameters_dict)
+    samples = np.array(
+        [[0.5, 0.2, 1.0, 0.3, -0.4, -2.0, 1.0], [1.5, -0.9, 2.5, 1.0, 2.0, 0.0, 6.0]]
+    )
+
+    ref_logpdf = np.zeros(2)
+    ref_grad_logpdf = np.zeros(samples.shape)
+    i = 0
+    for parameter in parameters_dict.values():
+        ref_logpdf += parameter.logpdf(samples[:, i : i + parameter.dimension])
+        ref_grad_logpdf[:, i : i + parameter.dimension] = parameter.grad_logpdf(
+            samples[:, i : i + parameter.dimension]
+        )
+        i += parameter.dimension
+
+    np.testing.assert_allclose(parameters.joint_logpdf(samples), ref_logpdf)
+    np.testing.assert_allclose(parameters.grad_joint_logpdf(samples), ref_grad_logpdf)
+
+
 @pytest.mark.parametrize(
     "parameters_set, samples, expected, expect_error",
     [
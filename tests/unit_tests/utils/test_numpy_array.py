@@ -17,7 +17,7 @@
 import numpy as np
 import pytest
 
-from queens.utils.numpy_array import at_least_2d, at_least_3d
+from queens.utils.numpy_array import at_least_2d, at_least_3d, row_keys
 
 
 @pytest.fixture(name="arr_0d", scope="module")
@@ -57,3 +57,17 @@ def test_at_least_3d(arr_0d, arr_1d, arr_2d, arr_3d):
     np.testing.assert_equal(at_least_3d(arr_1d).shape, (arr_1d.shape[0], 1, 1))
     np.testing.assert_equal(at_least_3d(arr_2d).shape, (arr_2d.shape[0], arr_2d.shape[1], 1))
     np.testing.assert_equal(at_least_3d(arr_3d).shape, arr_3d.shape)
+
+
+def test_row_keys():
+    """Test numpy utils function *row_keys*."""
+    rows = np.array([[0.0, 1.0], [-0.0, 1.0], [1.0, 0.0], [2.0, 3.0]])
+    keys = row_keys(rows)
+
+    assert keys.shape == (4,)
+    assert keys[0] == keys[1]
+    assert keys[0] != keys[2]
+    assert len(set(keys.tolist())) == 3
+    np.testing.assert_array_equal(row_keys(rows[3]), keys[3:])
+    sorted_keys = np.sort(keys)
+    np.testing.assert_array_equal(sorted_keys[np.searchsorted(sorted_keys, keys)], keys)
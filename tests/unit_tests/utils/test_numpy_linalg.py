@@ -0,0 +1,55 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Test-module for numpy linear algebra utils functions."""
+
+import numpy as np
+import pytest
+
+from queens.utils.numpy_linalg import extend_cholesky
+
+
+@pytest.fixture(name="spd_matrix")
+def fixture_spd_matrix():
+    """Return symmetric positive definite matrix."""
+    factor = np.random.default_rng(1).normal(size=(7, 7))
+    return factor @ factor.T + 7 * np.eye(7)
+
+
+@pytest.mark.parametrize("num_old", [1, 4, 6])
+def test_extend_cholesky(spd_matrix, num_old):
+    """Test that the extended factor equals the factor of the full matrix."""
+    low_chol = np.linalg.cholesky(spd_matrix[:num_old, :num_old])
+
+    extended_low_chol = extend_cholesky(
+        low_chol, spd_matrix[num_old:, :num_old], spd_matrix[num_old:, num_old:]
+    )
+
+    np.testing.assert_allclose(extended_low_chol, np.linalg.cholesky(spd_matrix), atol=1e-12)
+    np.testing.assert_array_equal(extended_low_chol, np.tril(extended_low_chol))
+
+
+def test_extend_cholesky_singular_schur_complement(spd_matrix):
+    """Test that duplicated samples are stabilized by jitter on the Schur complement."""
+    matrix = spd_matrix[:4, :4]
+    low_chol = np.linalg.cholesky(matrix)
+
+    extended_low_chol = extend_cholesky(low_chol, matrix[-1:], matrix[-1:, -1:], 1e-8)
+
+    assert np.all(np.isfinite(extended_low_chol))
+    np.testing.assert_allclose(extended_low_chol[:4, :4], low_chol)
+    extended_matrix = extended_low_chol @ extended_low_chol.T
+    np.testing.assert_allclose(extended_matrix[:4, :4], matrix, atol=1e-12)
+    np.testing.assert_allclose(extended_matrix[4, :4], matrix[-1], atol=1e-12)
+    assert 0 < extended_low_chol[4, 4] < 1e-3
@@ -449,6 +449,27 @@ def test_fisher_information_matrix(distributions):
     )
 
 
+@pytest.mark.parametrize(
+    "distributions",
+    [name for name in DISTRIBUTION_NAMES if name != "mixture"],  # mixtures use MC
+    indirect=True,
+)
+@pytest.mark.parametrize("dampening_coefficient", [0.0, 0.1])
+def test_natural_gradient(distributions, dampening_coefficient):
+    """Test natural gradient method."""
+    distribution, reference_data = distributions
+    if isinstance(distribution, Particle) and not dampening_coefficient:
+        pytest.skip("The FIM of the particle distribution is singular.")
+    gradient = np.linspace(-1.0, 2.0, len(reference_data.variational_parameters))
+    fim = reference_data.fisher_information_matrix + dampening_coefficient * np.eye(len(gradient))
+    np.testing.assert_almost_equal(
+        distribution.natural_gradient(
+            reference_data.variational_parameters, gradient, dampening_coefficient
+        ),
+        np.linalg.solve(fim, gradient),
+    )
+
+
 @pytest.mark.parametrize(
     "distributions",
     ["mixture"],
@@ -463,228 +484,228 @@ def test_fisher_information_matrix_mixture(distributions):
     fisher_information_matrix = np.array(
         [
             [
-                3.06080000e-02,
-                -5.49138154e-04,
-                -1.89769539e-03,
-                3.11856262e-02,
-                -2.55931009e-03,
-                -2.13490913e-03,
-                7.60080656e-03,
-                -1.21100059e-02,
-                -1.16372587e-02,
-                3.28987288e-02,
-                -1.96920920e-02,
-                -1.72690930e-02,
-                1.29289534e-02,
-                -1.29289534e-02,
+                2.79000083e-02,
+                -1.41137008e-03,
+                -2.25352340e-04,
+                1.95791028e-02,
+                -4.62523364e-03,
+                -3.60894333e-03,
+                8.05540027e-03,
+                -1.12541346e-02,
+                -1.16421255e-02,
+                3.48023386e-02,
+                -1.77363568e-02,
+                -1.79404947e-02,
+                1.27384673e-02,
+                -1.27384673e-02,
             ],
             [
-                -5.49138154e-04,
-                2.96640537e-02,
-                -3.22532276e-04,
-                -7.13753203e-04,
-                2.51165801e-02,
-                -2.35472754e-03,
-                -1.11138326e-02,
-                8.67324526e-03,
-                -1.12780780e-02,
-                -1.66668787e-02,
-                3.65828012e-02,
-                -1.76977888e-02,
-                1.40427452e-02,
-                -1.40427452e-02,
+                -1.41137008e-03,
+                2.95556011e-02,
+                -1.84117085e-03,
+                -3.16787835e-03,
+                2.32111336e-02,
+                -6.22923770e-03,
+                -1.15128509e-02,
+                8.14862507e-03,
+                -1.18730622e-02,
+                -1.76143232e-02,
+                3.53619156e-02,
+                -2.01747867e-02,
+                1.27816701e-02,
+                -1.27816701e-02,
             ],
             [
-                -1.89769539e-03,
-                -3.22532276e-04,
-                2.67459566e-02,
-                -4.65171955e-03,
-                2.05184722e-03,
-                1.80548992e-02,
-                -1.18951344e-02,
-                -1.25321269e-02,
-                7.60485164e-03,
-                -1.72694867e-02,
-                -1.98390932e-02,
-                3.32512867e-02,
-                1.06219305e-02,
-                -1.06219305e-02,
+                -2.25352340e-04,
+                -1.84117085e-03,
+                2.80012304e-02,
+                -2.43291138e-04,
+                1.79021984e-04,
+                1.69185750e-02,
+                -1.21454830e-02,
+                -1.21177034e-02,
+                8.12695622e-03,
+                -1.96665374e-02,
+                -1.84456039e-02,
+                3.61951724e-02,
+                1.25429491e-02,
+                -1.25429491e-02,
             ],
             [
-                3.11856262e-02,
-                -7.13753203e-04,
-                -4.65171955e-03,
-                1.35727617e-01,
-                4.56849721e-04,
-                7.12263892e-04,
-                -2.25040119e-02,
-                4.78128381e-03,
-                4.79578497e-03,
-                -4.35796329e-03,
-                1.48385531e-02,
-                1.26454205e-02,
-                6.35870624e-04,
-                -6.35870624e-04,
+                1.95791028e-02,
+                -3.16787835e-03,
+                -2.43291138e-04,
+                1.01229743e-01,
+                1.31111764e-04,
+                1.52937496e-03,
+                -2.14264505e-02,
+                3.91245970e-03,
+                3.90149158e-03,
+                -5.91532395e-03,
+                1.19830222e-02,
+                1.01832415e-02,
+                -5.25948322e-03,
+                5.25948322e-03,
             ],
             [
-                -2.55931009e-03,
-                2.51165801e-02,
-                2.05184722e-03,
-                4.56849721e-04,
-                1.11645726e-01,
-                1.97211627e-03,
-                3.90094793e-03,
-                -2.09648169e-02,
-                4.92667954e-03,
-                1.10121478e-02,
-                -1.33652729e-03,
-                1.27732623e-02,
-                -1.07848592e-03,
-                1.07848592e-03,
+                -4.62523364e-03,
+                2.32111336e-02,
+                1.79021984e-04,
+                1.31111764e-04,
+                1.11954267e-01,
+                8.90159404e-03,
+                3.97687575e-03,
+                -2.10533230e-02,
+                5.71518882e-03,
+                1.08329219e-02,
+                -1.13445836e-03,
+                1.94116108e-02,
+                -2.34980446e-03,
+                2.34980446e-03,
             ],
             [
-                -2.13490913e-03,
-                -2.35472754e-03,
-                1.80548992e-02,
-                7.12263892e-04,
-                1.97211627e-03,
-                9.85006673e-02,
-                4.80426877e-03,
-                4.93119673e-03,
-                -2.21595441e-02,
-                1.16316727e-02,
-                1.20487099e-02,
-                -6.31598313e-03,
-                -6.36819172e-03,
-                6.36819172e-03,
+                -3.60894333e-03,
+                -6.22923770e-03,
+                1.69185750e-02,
+                1.52937496e-03,
+                8.90159404e-03,
+                9.44109513e-02,
+                5.77064610e-03,
+                3.94266834e-03,
+                -2.01767285e-02,
+                1.53602059e-02,
+                1.14296397e-02,
+                1.64722981e-03,
+                -5.19226629e-03,
+                5.19226629e-03,
             ],
             [
-                7.60080656e-03,
-                -1.11138326e-02,
-                -1.18951344e-02,
-                -2.25040119e-02,
-                3.90094793e-03,
-                4.80426877e-03,
-                4.13357055e-01,
-                -1.95187096e-02,
-                -1.45207550e-02,
-                -5.68741624e-02,
-                5.27900629e-03,
-                -1.64852750e-02,
-                2.69106581e-02,
-                -2.69106581e-02,
+                8.05540027e-03,
+                -1.15128509e-02,
+                -1.21454830e-02,
+                -2.14264505e-02,
+                3.97687575e-03,
+                5.77064610e-03,
+                4.10550681e-01,
+                -1.42054775e-02,
+                -2.15644252e-02,
+                -4.30543490e-02,
+                -8.30174798e-03,
+                2.14433697e-03,
+                2.66454025e-02,
+                -2.66454025e-02,
             ],
             [
-                -1.21100059e-02,
-                8.67324526e-03,
-                -1.25321269e-02,
-                4.78128381e-03,
-                -2.09648169e-02,
-                4.93119673e-03,
-                -1.95187096e-02,
-                4.24689137e-01,
-                -1.99012755e-02,
-                -1.52304439e-03,
-                -7.23991013e-02,
-                -1.42034734e-02,
-                2.72208134e-02,
-                -2.72208134e-02,
+                -1.12541346e-02,
+                8.14862507e-03,
+                -1.21177034e-02,
+                3.91245970e-03,
+                -2.10533230e-02,
+                3.94266834e-03,
+                -1.42054775e-02,
+                4.12385158e-01,
+                -1.14531277e-02,
+                -3.12981181e-03,
+                -8.78058748e-02,
+                -1.51154665e-02,
+                2.77237278e-02,
+                -2.77237278e-02,
             ],
             [
-                -1.16372587e-02,
-                -1.12780780e-02,
-                7.60485164e-03,
-                4.79578497e-03,
-                4.92667954e-03,
-                -2.21595441e-02,
-                -1.45207550e-02,
-                -1.99012755e-02,
-                4.14962873e-01,
-                -9.04637721e-03,
-                -1.95904870e-03,
-                -5.48844013e-02,
-                2.66214795e-02,
-                -2.66214795e-02,
+                -1.16421255e-02,
+                -1.18730622e-02,
+                8.12695622e-03,
+                3.90149158e-03,
+                5.71518882e-03,
+                -2.01767285e-02,
+                -2.15644252e-02,
+                -1.14531277e-02,
+                4.21437616e-01,
+                -1.44735879e-02,
+                4.76576161e-03,
+                -7.46046107e-02,
+                2.76857876e-02,
+                -2.76857876e-02,
             ],
             [
-                3.28987288e-02,
-                -1.66668787e-02,
-                -1.72694867e-02,
-                -4.35796329e-03,
-                1.10121478e-02,
-                1.16316727e-02,
-                -5.68741624e-02,
-                -1.52304439e-03,
-                -9.04637721e-03,
-                1.53286058e00,
-                -1.84654445e-02,
-                2.37789120e-02,
-                2.93396976e-02,
-                -2.93396976e-02,
+                3.48023386e-02,
+                -1.76143232e-02,
+                -1.96665374e-02,
+                -5.91532395e-03,
+                1.08329219e-02,
+                1.53602059e-02,
+                -4.30543490e-02,
+                -3.12981181e-03,
+                -1.44735879e-02,
+                1.52445721e00,
+                -3.36050353e-03,
+                -1.93203303e-02,
+                3.16884417e-02,
+                -3.16884417e-02,
             ],
             [
-                -1.96920920e-02,
-                3.65828012e-02,
-                -1.98390932e-02,
-                1.48385531e-02,
-                -1.33652729e-03,
-                1.20487099e-02,
-                5.27900629e-03,
-                -7.23991013e-02,
-                -1.95904870e-03,
-                -1.84654445e-02,
-                1.68953593e00,
-                -2.94930948e-02,
-                3.07967827e-02,
-                -3.07967827e-02,
+                -1.77363568e-02,
+                3.53619156e-02,
+                -1.84456039e-02,
+                1.19830222e-02,
+                -1.13445836e-03,
+                1.14296397e-02,
+                -8.30174798e-03,
+                -8.78058748e-02,
+                4.76576161e-03,
+                -3.36050353e-03,
+                1.60753075e00,
+                -2.96254740e-02,
+                3.10236615e-02,
+                -3.10236615e-02,
             ],
             [
-                -1.72690930e-02,
-                -1.76977888e-02,
-                3.32512867e-02,
-                1.26454205e-02,
-                1.27732623e-02,
-                -6.31598313e-03,
-                -1.64852750e-02,
-                -1.42034734e-02,
-                -5.48844013e-02,
-                2.37789120e-02,
-                -2.94930948e-02,
-                1.60817064e00,
-                2.85616389e-02,
-                -2.85616389e-02,
+                -1.79404947e-02,
+                -2.01747867e-02,
+                3.61951724e-02,
+                1.01832415e-02,
+                1.94116108e-02,
+                1.64722981e-03,
+                2.14433697e-03,
+                -1.51154665e-02,
+                -7.46046107e-02,
+                -1.93203303e-02,
+                -2.96254740e-02,
+                1.66183837e00,
+                2.87338121e-02,
+                -2.87338121e-02,
             ],
             [
-                1.29289534e-02,
-                1.40427452e-02,
-                1.06219305e-02,
-                6.35870624e-04,
-                -1.07848592e-03,
-                -6.36819172e-03,
-                2.69106581e-02,
-                2.72208134e-02,
-                2.66214795e-02,
-                2.93396976e-02,
-                3.07967827e-02,
-                2.85616389e-02,
-                5.02412940e-02,
-                -5.02412940e-02,
+                1.27384673e-02,
+                1.27816701e-02,
+                1.25429491e-02,
+                -5.25948322e-03,
+                -2.34980446e-03,
+                -5.19226629e-03,
+                2.66454025e-02,
+                2.77237278e-02,
+                2.76857876e-02,
+                3.16884417e-02,
+                3.10236615e-02,
+                2.87338121e-02,
+                5.11902242e-02,
+                -5.11902242e-02,
             ],
             [
-                -1.29289534e-02,
-                -1.40427452e-02,
-                -1.06219305e-02,
-                -6.35870624e-04,
-                1.07848592e-03,
-                6.36819172e-03,
-                -2.69106581e-02,
-                -2.72208134e-02,
-                -2.66214795e-02,
-                -2.93396976e-02,
-                -3.07967827e-02,
-                -2.85616389e-02,
-                -5.02412940e-02,
-                5.02412940e-02,
+                -1.27384673e-02,
+                -1.27816701e-02,
+                -1.25429491e-02,
+                5.25948322e-03,
+                2.34980446e-03,
+                5.19226629e-03,
+                -2.66454025e-02,
+                -2.77237278e-02,
+                -2.76857876e-02,
+                -3.16884417e-02,
+                -3.10236615e-02,
+                -2.87338121e-02,
+                -5.11902242e-02,
+                5.11902242e-02,
             ],
         ]
     )